@@ -1,10 +1,14 @@
 import logging
 from homeassistant import config_entries, core
 
+from datetime import timedelta
+
 from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.update_coordinator import UpdateFailed
-from .const import DOMAIN, PLATFORMS
+from .const import CONF_PARSE_IN_PROCESSES, DOMAIN, PLATFORMS
 from .coordinator import KadermanagerDataUpdateCoordinator
+from .parse_pool import async_acquire_parse_pool, async_release_parse_pool
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -15,7 +19,14 @@ async def async_setup_entry(
     """Set up platform from a ConfigEntry."""
     hass.data.setdefault(DOMAIN, {})
 
+    # Services need voluptuous, only load them inside Home Assistant
+    from .services import async_setup_services
+
+    async_setup_services(hass)
+
     coordinator = KadermanagerDataUpdateCoordinator(hass, entry)
+    if entry.options.get(CONF_PARSE_IN_PROCESSES, False):
+        coordinator.parse_pool = await async_acquire_parse_pool(hass, entry.entry_id)
     await coordinator.async_load_cache()
 
     hass.data[DOMAIN][entry.entry_id] = coordinator
@@ -24,6 +35,7 @@ async def async_setup_entry(
         await coordinator.async_config_entry_first_refresh()
     except UpdateFailed as err:
         if not coordinator.data:
+            await async_release_parse_pool(hass, entry.entry_id)
             # Raise ConfigEntryNotReady so HA retries setup automatically
             # once the server becomes reachable again.
             raise ConfigEntryNotReady(
@@ -38,6 +50,18 @@ async def async_setup_entry(
     entry.async_on_unload(entry.add_update_listener(async_update_options))
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    # All enabled entities declared their fields, later refreshes fetch those
+    coordinator.demand.ready = True
+
+    # Cheap enrollment count polls between the full updates
+    if coordinator.attendance_interval:
+        entry.async_on_unload(
+            async_track_time_interval(
+                hass,
+                coordinator.async_poll_attendance,
+                timedelta(minutes=coordinator.attendance_interval),
+            )
+        )
 
     return True
 
@@ -58,5 +82,13 @@ async def async_unload_entry(
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
         hass.data[DOMAIN].pop(entry.entry_id)
+        await async_release_parse_pool(hass, entry.entry_id)
+        if not any(
+            isinstance(value, KadermanagerDataUpdateCoordinator)
+            for value in hass.data[DOMAIN].values()
+        ):
+            from .services import async_unload_services
+
+            async_unload_services(hass)
 
     return unload_ok
@@ -0,0 +1,255 @@
+"""SQLite archive of the events that already took place.
+
+A refresh only keeps upcoming events. Before a passed event drops out of the
+coordinator data its last snapshot is upserted here: date, type, location,
+enrollment count and the player lists. Player names are stored once per team
+in their own table and the events refer to them by ID, like the roster does
+in memory.
+
+All teams share one database file in the Home Assistant configuration
+directory. Every call opens its own connection in the executor, so nothing
+is held in memory between calendar queries.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from homeassistant.core import HomeAssistant
+
+from .models import PLAYER_ZONES, KadermanagerEvent, TeamRoster
+
+ARCHIVE_FILE = "kadermanager_archive.db"
+ARCHIVE_SCHEMA_VERSION = 1
+# Longest event in the archive, all-day events last one day
+ARCHIVE_MAX_DURATION = timedelta(days=1)
+# Rows returned by one range query at most, about a year of a busy team
+ARCHIVE_QUERY_LIMIT = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    team TEXT NOT NULL,
+    uid TEXT NOT NULL,
+    start TEXT NOT NULL,
+    end TEXT NOT NULL,
+    date TEXT,
+    time TEXT,
+    original_date TEXT,
+    title TEXT,
+    type TEXT,
+    location TEXT,
+    link TEXT,
+    in_count INTEGER,
+    players TEXT,
+    PRIMARY KEY (team, uid)
+);
+CREATE INDEX IF NOT EXISTS events_team_start ON events (team, start);
+CREATE INDEX IF NOT EXISTS events_team_type ON events (team, type, start);
+CREATE TABLE IF NOT EXISTS players (
+    id INTEGER PRIMARY KEY,
+    team TEXT NOT NULL,
+    name TEXT NOT NULL,
+    UNIQUE (team, name)
+);
+"""
+
+_UPSERT = """
+INSERT INTO events (
+    team, uid, start, end, date, time, original_date, title, type, location,
+    link, in_count, players
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (team, uid) DO UPDATE SET
+    start = excluded.start,
+    end = excluded.end,
+    date = excluded.date,
+    time = excluded.time,
+    original_date = excluded.original_date,
+    title = excluded.title,
+    type = excluded.type,
+    location = excluded.location,
+    link = excluded.link,
+    in_count = excluded.in_count,
+    players = COALESCE(excluded.players, events.players)
+"""
+
+_COLUMNS = (
+    "uid",
+    "date",
+    "time",
+    "original_date",
+    "title",
+    "type",
+    "location",
+    "link",
+    "in_count",
+)
+
+
+def _utc(value: datetime) -> str:
+    """Return a timestamp that sorts chronologically as text."""
+    return value.astimezone(timezone.utc).isoformat()
+
+
+class SeasonArchive:
+    """Passed events of one team, queried by date range."""
+
+    def __init__(self, hass: HomeAssistant, path: str, teamname: str) -> None:
+        """Initialize the archive, the file is created on first write."""
+        self.hass = hass
+        self.path = path
+        self.teamname = teamname
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path)
+        if connection.execute("PRAGMA user_version").fetchone()[0] == 0:
+            connection.executescript(_SCHEMA)
+            connection.execute(f"PRAGMA user_version = {ARCHIVE_SCHEMA_VERSION}")
+        return connection
+
+    def _player_ids(
+        self, connection: sqlite3.Connection, names: Iterable[str]
+    ) -> Dict[str, int]:
+        names = set(names)
+        connection.executemany(
+            "INSERT OR IGNORE INTO players (team, name) VALUES (?, ?)",
+            ((self.teamname, name) for name in sorted(names)),
+        )
+        return {
+            name: player_id
+            for player_id, name in connection.execute(
+                "SELECT id, name FROM players WHERE team = ?", (self.teamname,)
+            )
+            if name in names
+        }
+
+    def upsert(self, events: List[KadermanagerEvent], roster: TeamRoster) -> int:
+        """Store the latest snapshot of the events, return how many were written."""
+        snapshots = []
+        for event in events:
+            if not event.uid or event.start is None or event.end is None:
+                continue
+            players = (
+                roster.expand(event.players)
+                if event.players and any(event.players.values())
+                else None
+            )
+            snapshots.append((event, players))
+        if not snapshots:
+            return 0
+
+        connection = self._connect()
+        try:
+            with connection:
+                self._write(connection, snapshots)
+        finally:
+            connection.close()
+        return len(snapshots)
+
+    def _write(
+        self,
+        connection: sqlite3.Connection,
+        snapshots: List[Tuple[KadermanagerEvent, Optional[Dict[str, List[str]]]]],
+    ) -> None:
+        ids = self._player_ids(
+            connection,
+            (
+                name
+                for _, players in snapshots
+                for names in (players or {}).values()
+                for name in names
+            ),
+        )
+        rows = []
+        for event, players in snapshots:
+            player_ids = (
+                {
+                    zone: [ids[name] for name in players.get(zone, [])]
+                    for zone in PLAYER_ZONES
+                }
+                if players
+                else None
+            )
+            rows.append(
+                (
+                    self.teamname,
+                    event.uid,
+                    _utc(event.start),  # type: ignore[arg-type]
+                    _utc(event.end),  # type: ignore[arg-type]
+                    event.date,
+                    event.time,
+                    event.original_date,
+                    event.title,
+                    event.type,
+                    event.location,
+                    event.link,
+                    event.in_count,
+                    json.dumps(player_ids) if player_ids else None,
+                )
+            )
+        connection.executemany(_UPSERT, rows)
+
+    def between(
+        self,
+        start: datetime,
+        end: datetime,
+        event_type: Optional[str] = None,
+        limit: int = ARCHIVE_QUERY_LIMIT,
+    ) -> List[KadermanagerEvent]:
+        """Return the archived events overlapping the range, oldest first.
+
+        Only the range is read, using the start index; players are left out.
+        """
+        query = (
+            f"SELECT {', '.join(_COLUMNS)} FROM events"
+            " WHERE team = ? AND start >= ? AND start < ? AND end > ?"
+        )
+        params: List[Any] = [
+            self.teamname,
+            _utc(start - ARCHIVE_MAX_DURATION),
+            _utc(end),
+            _utc(start),
+        ]
+        if event_type is not None:
+            query += " AND type = ?"
+            params.append(event_type)
+        query += " ORDER BY start LIMIT ?"
+        params.append(limit)
+
+        connection = self._connect()
+        try:
+            return [
+                KadermanagerEvent.from_dict(dict(zip(_COLUMNS, row)))
+                for row in connection.execute(query, params)
+            ]
+        finally:
+            connection.close()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the number of archived events and the covered dates."""
+        connection = self._connect()
+        try:
+            count, first, last = connection.execute(
+                "SELECT COUNT(*), MIN(date), MAX(date) FROM events WHERE team = ?",
+                (self.teamname,),
+            ).fetchone()
+        finally:
+            connection.close()
+        return {"events": count, "first": first, "last": last}
+
+    async def async_upsert(
+        self, events: List[KadermanagerEvent], roster: TeamRoster
+    ) -> int:
+        return await self.hass.async_add_executor_job(self.upsert, events, roster)
+
+    async def async_between(
+        self, start: datetime, end: datetime, event_type: Optional[str] = None
+    ) -> List[KadermanagerEvent]:
+        return await self.hass.async_add_executor_job(
+            self.between, start, end, event_type
+        )
+
+    async def async_stats(self) -> Dict[str, Any]:
+        return await self.hass.async_add_executor_job(self.stats)
@@ -0,0 +1,143 @@
+"""Circuit breakers per endpoint of a team.
+
+A team without the widgets enabled answers them with 404 on every refresh;
+without a breaker each of these requests is sent, logged and followed by
+its pacing pause again. After `BREAKER_THRESHOLD` consecutive failures the
+endpoint's breaker opens and its requests are skipped. Once the cooldown
+has passed it is half-open: the next request is sent as a probe, success
+closes the breaker and another failure opens it for twice as long.
+
+Rate limits, forbidden responses and connection errors are not counted,
+they concern the whole site and are handled by the coordinator's back-off.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Dict
+
+import aiohttp
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import storage
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+from .pipeline import Handler, Request, Response
+from .reader import ResponseTooLarge
+from .traffic import endpoint_for
+
+_LOGGER = logging.getLogger(__name__)
+
+BREAKERS_STORAGE_VERSION = 1
+
+# Consecutive failures that open a breaker
+BREAKER_THRESHOLD = 3
+BREAKER_COOLDOWN = timedelta(hours=6)
+BREAKER_MAX_COOLDOWN = timedelta(days=7)
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+# The login flow must always be possible
+_EXEMPT = {"login"}
+
+
+class EndpointUnavailable(Exception):
+    """Error to indicate a request was skipped by an open breaker."""
+
+
+def _counts_as_failure(err: BaseException) -> bool:
+    if isinstance(err, aiohttp.ClientResponseError):
+        return err.status not in (403, 429)
+    return isinstance(
+        err, (asyncio.TimeoutError, ResponseTooLarge, aiohttp.ClientPayloadError)
+    )
+
+
+class CircuitBreakers:
+    """Breaker states of all endpoints of a team, persisted across restarts."""
+
+    name = "circuit_breakers"
+
+    def __init__(self, hass: HomeAssistant, teamname: str) -> None:
+        self._store = storage.Store(
+            hass, BREAKERS_STORAGE_VERSION, f"{DOMAIN}_{teamname}_breakers"
+        )
+        self.endpoints: Dict[str, Dict[str, Any]] = {}
+
+    def state(self, endpoint: str) -> str:
+        """Return the state of an endpoint's breaker."""
+        breaker = self.endpoints.get(endpoint)
+        if breaker is None or breaker["open_until"] is None:
+            return STATE_CLOSED
+        if dt_util.now() < dt_util.parse_datetime(breaker["open_until"]):
+            return STATE_OPEN
+        return STATE_HALF_OPEN
+
+    def allows(self, url: str) -> bool:
+        """Return whether a request to `url` would be sent."""
+        return self.state(endpoint_for(url)) != STATE_OPEN
+
+    async def __call__(self, request: Request, handler: Handler) -> Response:
+        endpoint = request.endpoint
+        if endpoint in _EXEMPT:
+            return await handler(request)
+        if self.state(endpoint) == STATE_OPEN:
+            raise EndpointUnavailable(
+                f"Skipping {request.url}, {endpoint} failed repeatedly"
+            )
+        try:
+            resp = await handler(request)
+        except Exception as e:
+            if _counts_as_failure(e):
+                self.record_failure(endpoint)
+            raise
+        self.record_success(endpoint)
+        return resp
+
+    def record_success(self, endpoint: str) -> None:
+        if self.endpoints.pop(endpoint, None) is not None:
+            _LOGGER.info("Endpoint %s responds again, closing its breaker", endpoint)
+
+    def record_failure(self, endpoint: str) -> None:
+        breaker = self.endpoints.setdefault(
+            endpoint, {"failures": 0, "opened": 0, "open_until": None}
+        )
+        half_open = self.state(endpoint) == STATE_HALF_OPEN
+        breaker["failures"] += 1
+        if not half_open and breaker["failures"] < BREAKER_THRESHOLD:
+            return
+        cooldown = min(BREAKER_COOLDOWN * 2 ** breaker["opened"], BREAKER_MAX_COOLDOWN)
+        breaker["opened"] += 1
+        open_until: datetime = dt_util.now() + cooldown
+        breaker["open_until"] = open_until.isoformat()
+        _LOGGER.warning(
+            "Endpoint %s failed %s times in a row, skipping it until %s",
+            endpoint,
+            breaker["failures"],
+            open_until,
+        )
+
+    async def async_load(self) -> None:
+        """Restore the stored breakers."""
+        stored = await self._store.async_load()
+        if stored:
+            self.endpoints = {**stored.get("endpoints", {}), **self.endpoints}
+
+    async def async_save(self) -> None:
+        """Persist the breakers."""
+        await self._store.async_save({"endpoints": self.endpoints})
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the state, failures and reopen time of every tripped breaker."""
+        return {
+            endpoint: {
+                "state": self.state(endpoint),
+                "failures": breaker["failures"],
+                "open_until": breaker["open_until"],
+            }
+            for endpoint, breaker in self.endpoints.items()
+        }
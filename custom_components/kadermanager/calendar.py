@@ -1,16 +1,17 @@
 import logging
-from datetime import datetime, timedelta, date
-from typing import Optional
+from datetime import datetime, date
+from typing import Any, Optional, cast
 
 from homeassistant.components.calendar import CalendarEntity, CalendarEvent
 from homeassistant.core import HomeAssistant
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
-from homeassistant.util import dt as dt_util
 
 from .const import DOMAIN, CONF_TEAM_NAME
 from .coordinator import KadermanagerDataUpdateCoordinator
+from .demand import FIELD_EVENTS, FIELD_IN_COUNT
+from .models import KadermanagerEvent
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -36,6 +37,14 @@ class KadermanagerCalendar(CoordinatorEntity, CalendarEntity):
         self._unique_id = f"{entry.entry_id}_calendar"
         self._event: Optional[CalendarEvent] = None
 
+    async def async_added_to_hass(self) -> None:
+        """Declare the fields shown in the event descriptions."""
+        await super().async_added_to_hass()
+        coordinator = cast(KadermanagerDataUpdateCoordinator, self.coordinator)
+        self.async_on_remove(
+            coordinator.demand.register(self._unique_id, (FIELD_EVENTS, FIELD_IN_COUNT))
+        )
+
     @property
     def name(self) -> str:
         """Return the name of the entity."""
@@ -69,84 +78,56 @@ class KadermanagerCalendar(CoordinatorEntity, CalendarEntity):
         if not self.coordinator.data or not self.coordinator.data.get("events"):
             return None
 
-        # We assume the list is sorted by date by the website/scraper
+        # The coordinator keeps the list sorted by start
         first_event_data = self.coordinator.data["events"][0]
         return self._parse_event(first_event_data)
 
     async def async_get_events(
         self, hass: HomeAssistant, start_date: datetime, end_date: datetime
     ) -> list[CalendarEvent]:
-        """Return calendar events within a datetime range."""
-        if not self.coordinator.data or not self.coordinator.data.get("events"):
-            return []
+        """Return calendar events within a datetime range.
 
+        Served from the index of all upcoming events, independent of the
+        event limit, and from the archive for passed events.
+        """
+        coordinator = cast(KadermanagerDataUpdateCoordinator, self.coordinator)
         events = []
-        for event_data in self.coordinator.data["events"]:
-            cal_event = self._parse_event(event_data)
-            if (
-                cal_event
-                and convert_to_datetime(cal_event.start) >= start_date
-                and convert_to_datetime(cal_event.end) <= end_date
-            ):
+        # Only the events in the range are converted
+        for event in await coordinator.async_events_between(start_date, end_date):
+            cal_event = self._parse_event(event)
+            if cal_event:
                 events.append(cal_event)
-            elif cal_event:
-                s = convert_to_datetime(cal_event.start)
-                e = convert_to_datetime(cal_event.end)
-                if s < end_date and e > start_date:
-                    events.append(cal_event)
 
         return events
 
-    def _parse_event(self, event_data: dict) -> Optional[CalendarEvent]:
-        """Convert scraped data to CalendarEvent."""
-        try:
-            date_str = event_data.get("date")  # YYYY-MM-DD
-            time_str = event_data.get("time")  # HH:MM or Unknown
-
-            if not date_str or date_str == "Unknown":
-                return None
-
-            dt_start: datetime | date
-            dt_end: datetime | date
-
-            if time_str and time_str != "Unknown":
-                dt_start_naive = datetime.strptime(
-                    f"{date_str} {time_str}", "%Y-%m-%d %H:%M"
-                )
-                # Make aware assuming default time zone (Since scraped data is local)
-                dt_start = dt_start_naive.replace(tzinfo=dt_util.DEFAULT_TIME_ZONE)
-
-                dt_end = dt_start + timedelta(hours=2)
-            else:
-                dt_start = datetime.strptime(date_str, "%Y-%m-%d").date()
-                dt_end = dt_start + timedelta(days=1)
-
-            summary = (
-                f"{event_data.get('type', 'Event')}: {event_data.get('title', '')}"
-            )
-            description = (
-                f"Location: {event_data.get('location', '')}\n"
-                f"In: {event_data.get('in_count', '')}\n"
-                f"Link: {event_data.get('link', '')}"
-            )
-
-            return CalendarEvent(
-                summary=summary,
-                start=dt_start,
-                end=dt_end,
-                description=description,
-                location=event_data.get("location"),
-                uid=event_data.get("link"),
-            )
-        except Exception as e:
-            _LOGGER.error(f"Error parsing calendar event: {e}")
-            return None
+    def _parse_event(
+        self, event: KadermanagerEvent | dict[str, Any]
+    ) -> Optional[CalendarEvent]:
+        """Convert a scraped event to a CalendarEvent."""
+        if not isinstance(event, KadermanagerEvent):
+            event = KadermanagerEvent.from_dict(event)
 
+        if event.start is None or event.end is None:
+            return None
 
-def convert_to_datetime(val):
-    """Helper to ensure comparison works for date and datetime."""
-    if isinstance(val, datetime):
-        if val.tzinfo is None:
-            val = val.replace(tzinfo=dt_util.DEFAULT_TIME_ZONE)
-        return val
-    return datetime(val.year, val.month, val.day, tzinfo=dt_util.DEFAULT_TIME_ZONE)
+        dt_start: datetime | date = event.start
+        dt_end: datetime | date = event.end
+        if event.all_day:
+            dt_start = event.start.date()
+            dt_end = event.end.date()
+
+        summary = f"{event.type}: {event.title}"
+        description = (
+            f"Location: {event.location}\n"
+            f"In: {event.in_count if event.in_count is not None else ''}\n"
+            f"Link: {event.link}"
+        )
+
+        return CalendarEvent(
+            summary=summary,
+            start=dt_start,
+            end=dt_end,
+            description=description,
+            location=event.location,
+            uid=event.uid,
+        )
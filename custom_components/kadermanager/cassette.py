@@ -0,0 +1,387 @@
+"""Record and replay the HTTP traffic of a refresh.
+
+A cassette holds the request/response pairs of one or more refreshes (URL,
+status, selected headers, body and timing). In record mode the coordinator's
+session is wrapped so every response read by `_async_get_url` and
+`_async_login` is captured; in replay mode the session is replaced by one
+that answers from the cassette without touching the network.
+
+Cassettes never contain credentials: login form values, CSRF tokens and
+cookies are dropped, the configured username and password and e-mail
+addresses are redacted wherever they appear, and player and comment author names are replaced by
+stable pseudonyms so the roster still behaves like the original one.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+import logging
+import re
+import time
+from collections import defaultdict, deque
+from html import escape, unescape
+from typing import Any, AsyncIterator, Deque, Dict, Iterable, List, Optional
+
+import aiohttp
+from multidict import CIMultiDict, CIMultiDictProxy
+from yarl import URL
+
+_LOGGER = logging.getLogger(__name__)
+
+CASSETTE_VERSION = 1
+REDACTED = "**REDACTED**"
+
+# Response headers that are kept, everything else (Set-Cookie!) is dropped.
+# Request headers such as Cookie are never recorded.
+RECORDED_HEADERS = ("Content-Type", "ETag", "Last-Modified", "Location")
+
+_PLAYER_LABEL_RE = re.compile(
+    r'(<span[^>]*class="[^"]*player_label[^"]*"[^>]*>)(.*?)(</span>)', re.DOTALL
+)
+# Comment authors are the first text line of the <h5>, possibly inside a link
+_AUTHOR_RE = re.compile(r"(<h5[^>]*>\s*(?:<[^>]+>\s*)*)([^<\n]+)")
+_EMAIL_RE = re.compile(r"[\w.+-]+@[\w-]+(?:\.[\w-]+)+")
+# Values of login inputs, e.g. the login name filled in again after a failure
+_LOGIN_INPUT_RE = re.compile(
+    r'(<input[^>]*name="(?:login_name|password|email)"[^>]*>)', re.IGNORECASE
+)
+_VALUE_RE = re.compile(r'(value=")[^"]*(")')
+_CSRF_RE = re.compile(
+    r'((?:name="authenticity_token"\s+value|name="csrf-token"\s+content)=")[^"]*(")'
+)
+
+
+class Redactor:
+    """Remove credentials and replace names in bodies with stable pseudonyms."""
+
+    def __init__(self, secrets: Iterable[Optional[str]] = ()) -> None:
+        self._pseudonyms: Dict[str, str] = {}
+        self._secrets: List[str] = []
+        self.add_secrets(*secrets)
+
+    def add_secrets(self, *secrets: Optional[str]) -> None:
+        """Redact these strings (usually the credentials) from now on."""
+        merged = set(self._secrets) | {s for s in secrets if s}
+        # Longest first, so a password containing the username goes whole
+        self._secrets = sorted(merged, key=len, reverse=True)
+
+    def text(self, text: str) -> str:
+        """Return `text` without the secrets and e-mail addresses."""
+        for secret in self._secrets:
+            text = text.replace(secret, REDACTED)
+        return _EMAIL_RE.sub(REDACTED, text)
+
+    def pseudonym(self, name: str) -> str:
+        """Return the pseudonym of a name, the same name always maps alike."""
+        key = unescape(name).strip()
+        if key not in self._pseudonyms:
+            self._pseudonyms[key] = f"Spieler {len(self._pseudonyms) + 1}"
+        return self._pseudonyms[key]
+
+    def body(self, body: str) -> str:
+        """Return `body` without credentials, names and tokens."""
+        body = _LOGIN_INPUT_RE.sub(
+            lambda m: _VALUE_RE.sub(r"\1" + REDACTED + r"\2", m.group(1)),
+            self.text(body),
+        )
+        body = _PLAYER_LABEL_RE.sub(
+            lambda m: m.group(1) + escape(self.pseudonym(m.group(2))) + m.group(3),
+            body,
+        )
+        body = _AUTHOR_RE.sub(
+            lambda m: m.group(1) + escape(self.pseudonym(m.group(2))), body
+        )
+        return _CSRF_RE.sub(lambda m: m.group(1) + REDACTED + m.group(2), body)
+
+
+class Cassette:
+    """Ordered request/response pairs of recorded refreshes."""
+
+    def __init__(self, interactions: Optional[List[Dict[str, Any]]] = None) -> None:
+        self.interactions: List[Dict[str, Any]] = interactions or []
+        self._redactor = Redactor()
+
+    def add_secrets(self, *secrets: Optional[str]) -> None:
+        """Redact these strings from everything recorded from now on."""
+        self._redactor.add_secrets(*secrets)
+
+    def record(
+        self,
+        method: str,
+        url: str,
+        status: int,
+        final_url: str,
+        headers: Dict[str, str],
+        body: Optional[str],
+        elapsed: float,
+        form: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Append one redacted interaction."""
+        self.interactions.append(
+            {
+                "method": method,
+                "url": self._redactor.text(url),
+                # Form values may be credentials, only the field names are kept
+                "form": sorted(form) if form else None,
+                "status": status,
+                "final_url": self._redactor.text(final_url),
+                "headers": {
+                    name: headers[name] for name in RECORDED_HEADERS if name in headers
+                },
+                "body": self._redactor.body(body) if body is not None else None,
+                "elapsed": round(elapsed, 4),
+            }
+        )
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {"version": CASSETTE_VERSION, "interactions": self.interactions}
+
+    def save(self, path: str) -> None:
+        """Write the cassette as gzip-compressed JSON (blocking)."""
+        with gzip.open(path, "wt", encoding="utf-8") as file:
+            json.dump(self.as_dict(), file)
+
+    @classmethod
+    def load(cls, path: str) -> "Cassette":
+        """Read a cassette written by `save` (blocking)."""
+        with gzip.open(path, "rt", encoding="utf-8") as file:
+            stored = json.load(file)
+        if stored.get("version") != CASSETTE_VERSION:
+            raise ValueError(f"Unsupported cassette version {stored.get('version')}")
+        return cls(stored["interactions"])
+
+
+class _RecordingResponse:
+    """Proxy around a live response that records the body when it is read."""
+
+    def __init__(
+        self,
+        cassette: Cassette,
+        resp: aiohttp.ClientResponse,
+        method: str,
+        url: str,
+        form: Optional[Dict[str, Any]],
+        started: float,
+    ) -> None:
+        self._cassette = cassette
+        self._resp = resp
+        self._method = method
+        self._url = url
+        self._form = form
+        self._started = started
+        self._recorded = False
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._resp, name)
+
+    @property
+    def content(self) -> "_RecordingStream":
+        return _RecordingStream(self)
+
+    async def text(self, *args: Any, **kwargs: Any) -> str:
+        body = await self._resp.text(*args, **kwargs)
+        self._record(body)
+        return body
+
+    def _record(self, body: Optional[str]) -> None:
+        if self._recorded:
+            return
+        self._recorded = True
+        self._cassette.record(
+            self._method,
+            self._url,
+            self._resp.status,
+            str(self._resp.url),
+            dict(self._resp.headers),
+            body,
+            time.perf_counter() - self._started,
+            self._form,
+        )
+
+
+class _RecordingStream:
+    """Proxy around the body stream that records the body once it is read."""
+
+    def __init__(self, resp: _RecordingResponse) -> None:
+        self._resp = resp
+
+    async def iter_chunked(self, n: int) -> AsyncIterator[bytes]:
+        chunks = []
+        async for chunk in self._resp._resp.content.iter_chunked(n):
+            chunks.append(chunk)
+            yield chunk
+        self._resp._record(b"".join(chunks).decode("utf-8", errors="replace"))
+
+
+class _RecordingRequest:
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        cassette: Cassette,
+        method: str,
+        url: str,
+        kwargs: Dict[str, Any],
+    ) -> None:
+        self._session = session
+        self._cassette = cassette
+        self._method = method
+        self._url = url
+        self._kwargs = kwargs
+        self._ctx: Any = None
+        self._resp: Optional[_RecordingResponse] = None
+
+    async def __aenter__(self) -> _RecordingResponse:
+        started = time.perf_counter()
+        self._ctx = self._session.request(self._method, self._url, **self._kwargs)
+        resp = await self._ctx.__aenter__()
+        self._resp = _RecordingResponse(
+            self._cassette,
+            resp,
+            self._method,
+            self._url,
+            self._kwargs.get("data"),
+            started,
+        )
+        return self._resp
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        # Responses that are never read (redirects to the login page, 429s)
+        # are recorded without a body
+        if self._resp is not None:
+            self._resp._record(None)
+        await self._ctx.__aexit__(*exc_info)
+
+
+class RecordingSession:
+    """Client session wrapper that captures every response into a cassette."""
+
+    def __init__(self, session: aiohttp.ClientSession, cassette: Cassette) -> None:
+        self._session = session
+        self.cassette = cassette
+
+    @property
+    def closed(self) -> bool:
+        return self._session.closed
+
+    def get(self, url: str, **kwargs: Any) -> _RecordingRequest:
+        return _RecordingRequest(self._session, self.cassette, "GET", url, kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> _RecordingRequest:
+        return _RecordingRequest(self._session, self.cassette, "POST", url, kwargs)
+
+    async def close(self) -> None:
+        await self._session.close()
+
+
+class _ReplayResponse:
+    """Minimal stand-in for `aiohttp.ClientResponse` backed by a recording."""
+
+    def __init__(self, method: str, interaction: Dict[str, Any]) -> None:
+        self.method = method
+        self.status: int = interaction["status"]
+        self.url = URL(interaction["final_url"])
+        self.headers = CIMultiDictProxy(CIMultiDict(interaction["headers"]))
+        self.history: tuple = ()
+        self.request_info = aiohttp.RequestInfo(
+            URL(interaction["url"]),
+            method,
+            CIMultiDictProxy(CIMultiDict()),
+            URL(interaction["url"]),
+        )
+        self._body: Optional[str] = interaction["body"]
+        self.content_length: Optional[int] = None
+        self.charset: Optional[str] = None
+        self.content = _ReplayStream(self)
+
+    def raise_for_status(self) -> None:
+        if self.status >= 400:
+            raise aiohttp.ClientResponseError(
+                self.request_info, self.history, status=self.status
+            )
+
+    async def read(self) -> bytes:
+        return (self._body or "").encode()
+
+    async def text(self, *args: Any, **kwargs: Any) -> str:
+        return self._body or ""
+
+
+class _ReplayStream:
+    def __init__(self, resp: _ReplayResponse) -> None:
+        self._resp = resp
+
+    async def iter_chunked(self, n: int) -> AsyncIterator[bytes]:
+        body = await self._resp.read()
+        for offset in range(0, len(body), n):
+            yield body[offset : offset + n]
+
+
+class _ReplayRequest:
+    def __init__(self, session: "ReplaySession", method: str, url: str) -> None:
+        self._session = session
+        self._method = method
+        self._url = url
+
+    async def __aenter__(self) -> _ReplayResponse:
+        interaction = self._session.next_interaction(self._method, self._url)
+        if self._session.realtime and interaction["elapsed"]:
+            await asyncio.sleep(interaction["elapsed"])
+        return _ReplayResponse(self._method, interaction)
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        return None
+
+
+class ReplaySession:
+    """Client session that answers every request from a cassette.
+
+    Requests are matched by method and URL in recording order. Once the
+    recordings of a URL are used up the last one is served again, so a
+    single recorded refresh can be replayed any number of times. With
+    `realtime` the recorded response times are reproduced.
+    """
+
+    def __init__(self, cassette: Cassette, realtime: bool = False) -> None:
+        self.cassette = cassette
+        self.realtime = realtime
+        self.misses: List[str] = []
+        self._closed = False
+        self._queues: Dict[tuple, Deque[Dict[str, Any]]] = defaultdict(deque)
+        self._last: Dict[tuple, Dict[str, Any]] = {}
+        for interaction in cassette.interactions:
+            self._queues[(interaction["method"], interaction["url"])].append(
+                interaction
+            )
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def next_interaction(self, method: str, url: str) -> Dict[str, Any]:
+        key = (method, url)
+        queue = self._queues.get(key)
+        if queue:
+            self._last[key] = queue.popleft()
+        if key in self._last:
+            return self._last[key]
+        _LOGGER.warning("No recorded response for %s %s", method, url)
+        self.misses.append(url)
+        return {
+            "url": url,
+            "final_url": url,
+            "status": 404,
+            "headers": {},
+            "body": None,
+            "elapsed": 0,
+        }
+
+    def get(self, url: str, **kwargs: Any) -> _ReplayRequest:
+        return _ReplayRequest(self, "GET", url)
+
+    def post(self, url: str, **kwargs: Any) -> _ReplayRequest:
+        return _ReplayRequest(self, "POST", url)
+
+    async def close(self) -> None:
+        self._closed = True
@@ -12,6 +12,12 @@ from .const import (
     CONF_FETCH_PLAYER_INFO,
     CONF_FORCE_UPDATE,
     CONF_DYNAMIC_INTERVAL,
+    CONF_MONITOR_LOOP_LAG,
+    CONF_CAPTURE_RESPONSES,
+    CONF_DIAGNOSTICS_RESPONSES,
+    CONF_PARSE_IN_PROCESSES,
+    CONF_MAX_RESPONSE_SIZE,
+    CONF_ATTENDANCE_INTERVAL,
     CONF_PASSWORD,
     CONF_TEAM_NAME,
     CONF_UPDATE_INTERVAL,
@@ -19,6 +25,7 @@ from .const import (
     DOMAIN,
 )
 from .coordinator import validate_input, CannotConnect, InvalidAuth
+from .reader import DEFAULT_MAX_RESPONSE_MB
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -92,6 +99,32 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                         CONF_DYNAMIC_INTERVAL,
                         default=__get_option(CONF_DYNAMIC_INTERVAL, False),
                     ): bool,
+                    vol.Optional(
+                        CONF_MONITOR_LOOP_LAG,
+                        default=__get_option(CONF_MONITOR_LOOP_LAG, False),
+                    ): bool,
+                    vol.Optional(
+                        CONF_CAPTURE_RESPONSES,
+                        default=__get_option(CONF_CAPTURE_RESPONSES, False),
+                    ): bool,
+                    vol.Optional(
+                        CONF_DIAGNOSTICS_RESPONSES,
+                        default=__get_option(CONF_DIAGNOSTICS_RESPONSES, False),
+                    ): bool,
+                    vol.Optional(
+                        CONF_PARSE_IN_PROCESSES,
+                        default=__get_option(CONF_PARSE_IN_PROCESSES, False),
+                    ): bool,
+                    vol.Optional(
+                        CONF_MAX_RESPONSE_SIZE,
+                        default=__get_option(
+                            CONF_MAX_RESPONSE_SIZE, DEFAULT_MAX_RESPONSE_MB
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=50)),
+                    vol.Optional(
+                        CONF_ATTENDANCE_INTERVAL,
+                        default=__get_option(CONF_ATTENDANCE_INTERVAL, 0),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=120)),
                 },
             ),
         )
@@ -139,6 +172,7 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):  # type: ignore
                 vol.Required(CONF_FETCH_PLAYER_INFO, default=True): bool,
                 vol.Required(CONF_FETCH_COMMENTS, default=True): bool,
                 vol.Optional(CONF_DYNAMIC_INTERVAL, default=False): bool,
+                vol.Optional(CONF_MONITOR_LOOP_LAG, default=False): bool,
             },
         )
 
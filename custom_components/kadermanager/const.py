@@ -12,6 +12,21 @@ CONF_FETCH_PLAYER_INFO = "fetch_player_info"
 CONF_FETCH_COMMENTS = "fetch_comments"
 CONF_FORCE_UPDATE = "force_update"
 CONF_DYNAMIC_INTERVAL = "dynamic_interval"
+CONF_MONITOR_LOOP_LAG = "monitor_loop_lag"
+CONF_CAPTURE_RESPONSES = "capture_responses"
+CONF_DIAGNOSTICS_RESPONSES = "diagnostics_include_responses"
+CONF_PARSE_IN_PROCESSES = "parse_in_processes"
+CONF_MAX_RESPONSE_SIZE = "max_response_size"
+CONF_ATTENDANCE_INTERVAL = "attendance_interval"
 ATTR_DATA = "data"
 
+SERVICE_PROFILE_REFRESH = "profile_refresh"
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+ATTR_TOP = "top"
+ATTR_TRACE_MEMORY = "trace_memory"
+
+SERVICE_GET_EVENTS = "get_events"
+ATTR_PLAYER = "player"
+DEFAULT_PROFILE_TOP = 30
+
 PLATFORMS = ["sensor", "calendar"]
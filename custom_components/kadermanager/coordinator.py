@@ -5,8 +5,10 @@ import random
 
 from datetime import datetime, timedelta
 from homeassistant.util import dt as dt_util
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 import re
+import time
+from contextlib import contextmanager, nullcontext
 from bs4 import BeautifulSoup
 import aiohttp
 from urllib.parse import urljoin
@@ -14,7 +16,7 @@ from urllib.parse import urljoin
 from homeassistant import config_entries
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
-from homeassistant.helpers import issue_registry as ir, storage
+from homeassistant.helpers import issue_registry as ir
 
 from .const import (
     DOMAIN,
@@ -27,6 +29,50 @@ from .const import (
     CONF_FETCH_COMMENTS,
     CONF_FORCE_UPDATE,
     CONF_DYNAMIC_INTERVAL,
+    CONF_MONITOR_LOOP_LAG,
+    CONF_CAPTURE_RESPONSES,
+    CONF_MAX_RESPONSE_SIZE,
+    CONF_ATTENDANCE_INTERVAL,
+)
+from . import streaming
+from .archive import ARCHIVE_FILE, SeasonArchive
+from .breakers import CircuitBreakers, EndpointUnavailable
+from .cassette import Cassette, RecordingSession, ReplaySession
+from .demand import DataDemand, FetchNeeds
+from .fetch_plan import FetchPlan
+from .instrumentation import LoopLagMonitor, RefreshTimings
+from .models import EventIndex, KadermanagerEvent, TeamRoster
+from . import parsers
+from .parse_pool import ParsePool
+from .pipeline import (
+    REQUEST_BUDGET_BASE,
+    RETRY_BLOCKED,
+    RETRY_CONNECTION,
+    AuthStage,
+    CannotConnect,
+    CaptureStage,
+    ClassifyStage,
+    ConditionalCache,
+    InvalidAuth,
+    MetricsStage,
+    Pipeline,
+    RequestBudget,
+    RequestBudgetExceeded,
+    SessionExpired,
+    TimingStage,
+    classify_error,
+)
+from .reader import ResponseTooLarge, decode_body, max_response_bytes
+from .parsers import default_backend, make_soup
+from .responses import ResponseCapture
+from .statistics import AttendanceStatistics
+from .traffic import TrafficCounters
+from .store import (
+    KadermanagerStore,
+    SECTION_COMMENTS,
+    SECTION_GENERAL_COMMENTS,
+    SECTION_PLAYERS,
+    merge_section,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -40,10 +86,11 @@ USER_AGENTS = [
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/148.0.0.0 Safari/537.36 Edg/148.0.0.0",
 ]
 
-REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=30)
-
 ISSUE_ID_CONNECTION = "connection_error"
 
+# Shortest interval of the attendance polls between full updates
+MIN_ATTENDANCE_INTERVAL = 15
+
 
 def get_random_headers(teamname: str) -> Dict[str, str]:
     """Generate random headers to mimic a real browser."""
@@ -75,14 +122,6 @@ def get_random_headers(teamname: str) -> Dict[str, str]:
     return headers
 
 
-class CannotConnect(Exception):
-    """Error to indicate we cannot connect."""
-
-
-class InvalidAuth(Exception):
-    """Error to indicate there is invalid auth."""
-
-
 class KadermanagerDataUpdateCoordinator(DataUpdateCoordinator):
     """Class to manage fetching Kadermanager data."""
 
@@ -102,22 +141,95 @@ class KadermanagerDataUpdateCoordinator(DataUpdateCoordinator):
         config = {**entry.data, **entry.options}
         self.config_entry = entry
         self.teamname = config[CONF_TEAM_NAME]
+        self.team_url = f"https://{self.teamname.lower()}.kadermanager.de"
         self.username = config.get(CONF_USERNAME)
         self.password = config.get(CONF_PASSWORD)
         self.event_limit = config.get(CONF_EVENT_LIMIT, 5)
         self.fetch_player_info = config.get(CONF_FETCH_PLAYER_INFO, False)
         self.fetch_comments = config.get(CONF_FETCH_COMMENTS, False)
+        # Fields the added entities show, narrows down what a refresh fetches
+        self.demand = DataDemand()
+        self.fetch_needs: FetchNeeds = self.demand.needs(
+            self.fetch_player_info, self.fetch_comments
+        )
+        # BeautifulSoup backend, lxml when installed
+        self.html_backend = default_backend()
         self._force_update = entry.options.get(CONF_FORCE_UPDATE, False)
-
-        self.store: storage.Store = storage.Store(hass, 1, f"{DOMAIN}_{self.teamname}")
+        # Minutes between the widget-only attendance polls, 0 when disabled
+        self.attendance_interval = config.get(CONF_ATTENDANCE_INTERVAL, 0)
+        if 0 < self.attendance_interval < MIN_ATTENDANCE_INTERVAL:
+            _LOGGER.warning(
+                "Attendance interval of %s minutes is too low, using %s minutes",
+                self.attendance_interval,
+                MIN_ATTENDANCE_INTERVAL,
+            )
+            self.attendance_interval = MIN_ATTENDANCE_INTERVAL
+        self.last_attendance_poll: Optional[Dict[str, Any]] = None
+        # Calendar index of all upcoming events and the data it was built from
+        self._event_index: Optional[EventIndex] = None
+        self._event_index_data: Optional[Dict[str, Any]] = None
+
+        self.store = KadermanagerStore(hass, self.teamname)
+        self.roster = TeamRoster()
+        self._sections_lock = asyncio.Lock()
+        self._sections_task: Optional[asyncio.Task] = None
+        self.timings = RefreshTimings()
+        self.traffic = TrafficCounters(hass, self.teamname)
+        # Rolling attendance figures, counted once per passed event
+        self.statistics = AttendanceStatistics(hass, self.teamname, self.roster)
+        # Passed events, kept for the calendar and the attendance history
+        self.archive = SeasonArchive(
+            hass, hass.config.path(ARCHIVE_FILE), self.teamname
+        )
+        # Raw responses for parser debugging, only kept when enabled
+        self.responses: Optional[ResponseCapture] = (
+            ResponseCapture(secrets=(self.username, self.password))
+            if config.get(CONF_CAPTURE_RESPONSES, False)
+            else None
+        )
+        # Result of the last profile_refresh service call
+        self.last_profile: Optional[Dict[str, Any]] = None
+        # Result of the last profile_refresh call with trace_memory
+        self.last_memory_trace: Optional[Dict[str, Any]] = None
+        # Shared worker processes, set up by the integration when enabled
+        self.parse_pool: Optional[ParsePool] = None
+        self.loop_lag: Optional[LoopLagMonitor] = (
+            LoopLagMonitor() if config.get(CONF_MONITOR_LOOP_LAG, False) else None
+        )
 
         self.last_success: Optional[datetime] = None
+        # Whether iCal or scraping produced the events, restored with the cache
+        self.fetch_plan = FetchPlan()
         self._issue_created = False
         self._session: Optional[aiohttp.ClientSession] = None
+        self._cassette: Optional[Cassette] = None
+        self._replay = False
+        self._replay_realtime = False
         self._logged_in = False
         self._backoff_until: Optional[datetime] = None
         self._consecutive_failures = 0
         self._headers = get_random_headers(self.teamname)
+        self.request_budget = RequestBudget(REQUEST_BUDGET_BASE + self.event_limit)
+        # Endpoints that keep failing are skipped for a while
+        self.breakers = CircuitBreakers(hass, self.teamname)
+        stages: List[Any] = [
+            self.breakers,
+            self.request_budget,
+            TimingStage(),
+            ClassifyStage(),
+            ConditionalCache(),
+            AuthStage(),
+            MetricsStage(self.traffic),
+        ]
+        if self.responses is not None:
+            stages.append(CaptureStage(self.responses))
+        # Every request goes through here, pages larger than the maximum
+        # size are not read to the end
+        self.pipeline = Pipeline(
+            lambda: self._session,
+            stages,
+            max_bytes=max_response_bytes(config.get(CONF_MAX_RESPONSE_SIZE)),
+        )
 
         # Increase default update interval if it's too small
         interval = config.get(CONF_UPDATE_INTERVAL, 60)
@@ -167,30 +279,48 @@ class KadermanagerDataUpdateCoordinator(DataUpdateCoordinator):
                 )
                 return self.data
 
+        self.timings.begin()
         try:
+            # Cached details are reused per event, so the heavy sections must be
+            # in memory before the scrape compares old and new events.
+            with self.timings.phase("load_sections"):
+                await self.async_ensure_sections()
+
             # Get or create a domain-wide lock to prevent multiple Kadermanager entries
             # from scraping at the exact same time (e.g. after a HA reboot).
             domain_data = self.hass.data.setdefault(DOMAIN, {})
             scrape_lock = domain_data.setdefault("scrape_lock", asyncio.Lock())
 
+            wait_started = time.perf_counter()
             async with scrape_lock:
+                self.timings.add("schedule_wait", time.perf_counter() - wait_started)
                 # Add a significant random delay to avoid fixed-interval detection
                 if not self._force_update:
                     _LOGGER.debug("Waiting for random jitter delay (5-30s)")
-                    await asyncio.sleep(random.uniform(5.0, 30.0))
+                    with self.timings.phase("jitter"):
+                        await asyncio.sleep(random.uniform(5.0, 30.0))
                 else:
                     _LOGGER.info("Force update triggered, bypassing jitter delay")
                     self._force_update = False  # Reset for next regular update
 
-                async with asyncio.timeout(60):
-                    data = await self._async_scrape_data()
-                    self.last_success = dt_util.now()
-                    # Persist the success time to avoid aggressive scraping after restarts
-                    data["last_success"] = self.last_success.isoformat()
-                    await self.store.async_save(data)
-                    self._consecutive_failures = 0
-                    self._update_dynamic_interval(data)
-                    return data
+                if self.loop_lag:
+                    self.loop_lag.start()
+                try:
+                    async with asyncio.timeout(60):
+                        data = await self._async_scrape_data()
+                        await self._async_archive_passed(data)
+                        self.last_success = dt_util.now()
+                        # Persist the success time to avoid aggressive scraping after restarts
+                        data["last_success"] = self.last_success.isoformat()
+                        data["fetch_plan"] = self.fetch_plan.as_dict()
+                        with self._stage("save"):
+                            await self.store.async_save(data, self.roster)
+                        self._consecutive_failures = 0
+                        self._update_dynamic_interval(data)
+                        return data
+                finally:
+                    if self.loop_lag:
+                        await self.loop_lag.stop()
         except Exception as err:
             # Handle repair logic
             if self.last_success and (dt_util.now() - self.last_success) > timedelta(
@@ -208,8 +338,8 @@ class KadermanagerDataUpdateCoordinator(DataUpdateCoordinator):
                     )
                     self._issue_created = True
 
-            status = getattr(err, "status", None)
-            if status in [403, 429]:
+            retry = classify_error(err)
+            if retry == RETRY_BLOCKED:
                 self._consecutive_failures += 1
                 backoff_hours = min(24, self._consecutive_failures * 2)
                 self._backoff_until = dt_util.now() + timedelta(hours=backoff_hours)
@@ -218,17 +348,7 @@ class KadermanagerDataUpdateCoordinator(DataUpdateCoordinator):
                     getattr(err, "status", "unknown"),
                     backoff_hours,
                 )
-            elif (
-                isinstance(err, (aiohttp.ClientConnectorError, CannotConnect))
-                or "ClientConnectorError" in str(type(err))
-                or (
-                    isinstance(err, UpdateFailed)
-                    and (
-                        "Connect call failed" in str(err)
-                        or "Failed to fetch events page" in str(err)
-                    )
-                )
-            ):
+            elif retry == RETRY_CONNECTION:
                 self._consecutive_failures += 1
                 backoff_minutes = min(1440, self._consecutive_failures * 60)
                 self._backoff_until = dt_util.now() + timedelta(minutes=backoff_minutes)
@@ -242,6 +362,19 @@ class KadermanagerDataUpdateCoordinator(DataUpdateCoordinator):
                 self._consecutive_failures += 1
 
             raise UpdateFailed(f"Error communicating with API: {err}") from err
+        finally:
+            self.timings.finish()
+            try:
+                await self.traffic.async_save()
+                await self.breakers.async_save()
+                await self.statistics.async_save()
+            except Exception as err:  # pylint: disable=broad-except
+                _LOGGER.debug("Could not save traffic counters: %s", err)
+
+    def async_update_listeners(self) -> None:
+        """Update all listeners, timing the fan-out after a refresh."""
+        with self.timings.listeners():
+            super().async_update_listeners()
 
     def _update_dynamic_interval(self, data: Dict[str, Any]) -> None:
         """Update the update interval dynamically based on upcoming and recent events."""
@@ -252,7 +385,7 @@ class KadermanagerDataUpdateCoordinator(DataUpdateCoordinator):
             )
             return
 
-        events = data.get("events", [])
+        events: List[KadermanagerEvent] = data.get("events", [])
         now = dt_util.now()
 
         # Default to 12 hours
@@ -260,46 +393,36 @@ class KadermanagerDataUpdateCoordinator(DataUpdateCoordinator):
         interval_reason = "No active or upcoming events"
 
         for event in events:
-            try:
-                event_date = event.get("date")
-                event_time = event.get("time")
+            edt = event.start
+            if edt is None:
+                continue
 
-                if not event_date:
-                    continue
+            time_diff = edt - now
+
+            # 1. ACTIVE PHASE: During or shortly after (up to 3 hours after start)
+            # Use 30 minutes to catch late comments or attendance changes during the event
+            if timedelta(hours=-3) <= time_diff <= timedelta(0):
+                if min_interval > timedelta(minutes=30):
+                    min_interval = timedelta(minutes=30)
+                    interval_reason = f"Event '{event.title}' is active (started {edt})"
+
+            # 2. RECAP PHASE: 3 to 6 hours after start
+            # Use 2 hours for post-event summary/comments
+            elif timedelta(hours=-6) < time_diff < timedelta(hours=-3):
+                if min_interval > timedelta(hours=2):
+                    min_interval = timedelta(hours=2)
+                    interval_reason = (
+                        f"Event '{event.title}' finished recently (started {edt})"
+                    )
 
-                if not event_time or event_time == "Unknown":
-                    event_time = "00:00"
-
-                edt = dt_util.parse_datetime(f"{event_date} {event_time}")
-                if edt:
-                    if edt.tzinfo is None:
-                        edt = dt_util.as_local(edt)
-
-                    time_diff = edt - now
-
-                    # 1. ACTIVE PHASE: During or shortly after (up to 3 hours after start)
-                    # Use 30 minutes to catch late comments or attendance changes during the event
-                    if timedelta(hours=-3) <= time_diff <= timedelta(0):
-                        if min_interval > timedelta(minutes=30):
-                            min_interval = timedelta(minutes=30)
-                            interval_reason = f"Event '{event.get('title')}' is active (started {edt})"
-
-                    # 2. RECAP PHASE: 3 to 6 hours after start
-                    # Use 2 hours for post-event summary/comments
-                    elif timedelta(hours=-6) < time_diff < timedelta(hours=-3):
-                        if min_interval > timedelta(hours=2):
-                            min_interval = timedelta(hours=2)
-                            interval_reason = f"Event '{event.get('title')}' finished recently (started {edt})"
-
-                    # 3. PROXIMITY PHASE: Within 24 hours before start
-                    # Use 60 minutes
-                    elif timedelta(0) < time_diff <= timedelta(hours=24):
-                        if min_interval > timedelta(hours=1):
-                            min_interval = timedelta(hours=1)
-                            interval_reason = f"Event '{event.get('title')}' is upcoming (starts {edt})"
-
-            except (ValueError, TypeError):
-                continue
+            # 3. PROXIMITY PHASE: Within 24 hours before start
+            # Use 60 minutes
+            elif timedelta(0) < time_diff <= timedelta(hours=24):
+                if min_interval > timedelta(hours=1):
+                    min_interval = timedelta(hours=1)
+                    interval_reason = (
+                        f"Event '{event.title}' is upcoming (starts {edt})"
+                    )
 
         self.update_interval = min_interval
         _LOGGER.info(
@@ -311,15 +434,11 @@ class KadermanagerDataUpdateCoordinator(DataUpdateCoordinator):
     async def _async_scrape_data(self) -> Dict[str, Any]:
         """Asynchronous scraping logic."""
         if self._session is None or self._session.closed:
-            connector = aiohttp.TCPConnector(family=socket.AF_INET)
-            self._headers = get_random_headers(self.teamname)
-            self._session = aiohttp.ClientSession(
-                headers=self._headers, connector=connector
-            )
+            self._session = self._open_session()
             self._logged_in = False
+        self.request_budget.reset()
 
-        teamname_lower = self.teamname.lower()
-        team_url = f"https://{teamname_lower}.kadermanager.de"
+        team_url = self.team_url
         events_url = f"{team_url}/events"
         login_url = f"{team_url}/sessions/new"
         ical_url = f"{team_url}/calendar/ical"
@@ -328,91 +447,68 @@ class KadermanagerDataUpdateCoordinator(DataUpdateCoordinator):
 
         # 1. Login if needed
         if self.username and self.password and not self._logged_in:
-            self._logged_in = await self._async_login(login_url)
-            await asyncio.sleep(random.uniform(3.0, 5.0))
+            with self.timings.phase("login"):
+                self._logged_in = await self._async_login(login_url)
+            await self._async_pause(3.0, 5.0)
 
-        # 2. Try fetching data via iCal and Widgets (Safer path)
-        ical_events = await self._async_get_ical_data(ical_url)
-        await asyncio.sleep(random.uniform(2.0, 4.0))
-        widget_html = await self._async_get_url(events_widget_url)
-        await asyncio.sleep(random.uniform(2.0, 4.0))
-        messages_html = await self._async_get_url(messages_widget_url)
+        needs = self.fetch_needs = self.demand.needs(
+            self.fetch_player_info, self.fetch_comments
+        )
+
+        # 2. Try fetching data via iCal and Widgets (Safer path), unless it
+        # failed for this team recently
+        now = dt_util.now()
+        tried_ical = self.fetch_plan.try_ical(now)
+        ical_events = await self._async_get_ical_data(ical_url) if tried_ical else []
 
         if ical_events:
             _LOGGER.debug("Using iCal and Widget data for %s events", len(ical_events))
+            self.fetch_plan.record_ical()
+            widget_html = (
+                await self._async_get_paced(
+                    events_widget_url, "fetch_widget_events", 2.0, 4.0
+                )
+                if needs.in_count
+                else None
+            )
+            messages_html = (
+                await self._async_get_paced(
+                    messages_widget_url, "fetch_widget_messages", 2.0, 4.0
+                )
+                if needs.general_comments
+                else None
+            )
             enrollment_counts = (
-                self._parse_widget_events(widget_html) if widget_html else {}
+                await self._async_parse_list(
+                    "parse_widget", "widget", widget_html, self._parse_widget_events
+                )
+                if widget_html
+                else {}
             )
 
             # Combine iCal events with enrollment counts
-            events = []
-            now = dt_util.now()
-            today_str = now.strftime("%Y-%m-%d")
-
-            for e in ical_events:
-                if not e.get("date"):
-                    continue
-
-                # Create a key for matching: Title_DD.MM.
-                d_parts = e["date"].split("-")
-                date_key = f"{d_parts[2]}.{d_parts[1]}."
-                match_key = f"{e['title']}_{date_key}"
-
-                e["in_count"] = enrollment_counts.get(match_key)
-
-                # Check if event is in the past
-                # If time is unknown, we assume it's an all-day event and keep it for the whole day
-                event_time = e.get("time", "23:59")
-                if event_time == "Unknown":
-                    event_time = "23:59"
-
-                try:
-                    # Construct aware datetime for comparison
-                    if event_time != "23:59":
-                        event_dt = dt_util.parse_datetime(f"{e['date']} {event_time}")
-                    else:
-                        event_dt = dt_util.parse_datetime(f"{e['date']} 23:59:59")
-
-                    if event_dt and event_dt + timedelta(hours=1) < now:
-                        _LOGGER.debug(
-                            "Skipping past event: %s on %s", e["title"], e["date"]
-                        )
-                        continue
-                except (ValueError, TypeError):
-                    if e["date"] < today_str:
-                        continue
-
-                events.append(e)
-
-            # Sort events chronologically
-            events.sort(key=lambda x: (x["date"], x.get("time", "00:00")))
+            events = self._upcoming_events(ical_events)
+            self._apply_enrollment_counts(events, enrollment_counts)
 
             # Limited events
             limited_events = events[: self.event_limit]
 
             # Fetch details if needed
+            old_events = self._cached_events()
             detail_tasks = []
             for event in limited_events:
-                link = event.get("link")
-                event["players"] = {
-                    "accepted_players": [],
-                    "declined_players": [],
-                    "no_response_players": [],
-                }
-                event["comments"] = []
+                link = event.link
+                event.players = self.roster.encode({})
+                event.comments = []
 
-                if (self.fetch_player_info or self.fetch_comments) and link:
+                if needs.details and link and self.breakers.allows(link):
                     # Reuse cache logic
-                    old_events = {
-                        ev["link"]: ev
-                        for ev in ((self.data or {}).get("events") or [])
-                        if "link" in ev
-                    }
                     if link in old_events:
                         old_e = old_events[link]
-                        if old_e.get("in_count") == event.get("in_count"):
-                            event["players"] = old_e.get("players", event["players"])
-                            event["comments"] = old_e.get("comments", event["comments"])
+                        if old_e.in_count == event.in_count:
+                            event.players = old_e.players or event.players
+                            event.comments = old_e.comments or event.comments
+                            self.traffic.record_detail_cache_hit()
                             continue
 
                     detail_tasks.append(self._async_fetch_event_details(event, link))
@@ -423,111 +519,100 @@ class KadermanagerDataUpdateCoordinator(DataUpdateCoordinator):
                 async def sem_task(task):
                     async with semaphore:
                         await task
-                        await asyncio.sleep(random.uniform(3.0, 8.0))
+                        await self._async_pause(3.0, 8.0)
 
                 await asyncio.gather(*(sem_task(task) for task in detail_tasks))
 
-            data = {"events": limited_events}
-            if self.fetch_comments and messages_html:
-                data["general_comments"] = self.parse_general_comments(messages_html)
+            # Counts of the later events come with the same widget request
+            data = {
+                "events": limited_events,
+                "later_events": events[self.event_limit :],
+            }
+            if messages_html:
+                data["general_comments"] = await self._async_parse_list(
+                    "parse_general_comments",
+                    "comments",
+                    messages_html,
+                    self.parse_general_comments,
+                )
 
             self.last_success = dt_util.now()
             return data
 
         # 3. Fallback to full scraping if iCal failed
-        _LOGGER.debug("iCal fetch failed or empty, falling back to full scraping")
-        events_page = await self._async_get_url(events_url)
-        await asyncio.sleep(random.uniform(2.5, 6.0))
-        home_page = await self._async_get_url(team_url)
+        if tried_ical:
+            _LOGGER.debug("iCal fetch failed or empty, falling back to full scraping")
+            await self._async_pause(2.0, 4.0)
+        else:
+            _LOGGER.debug("iCal failed at %s, scraping", self.fetch_plan.ical_failed)
+        with self.timings.phase("fetch_events"):
+            events_page = await self._async_get_url(events_url)
+        # The home page has the enrollment counts and the team comments
+        home_page = (
+            await self._async_get_paced(team_url, "fetch_home", 2.5, 6.0)
+            if needs.in_count or needs.general_comments
+            else None
+        )
 
         if not events_page:
             # Maybe session expired? Try one re-login if we have credentials
             if self.username and self.password:
                 _LOGGER.debug("Events page fetch failed, attempting re-login")
-                await asyncio.sleep(random.uniform(2.0, 4.0))
-                self._logged_in = await self._async_login(login_url)
-                await asyncio.sleep(random.uniform(1.5, 3.0))
-                events_page = await self._async_get_url(events_url)
+                self.traffic.record_retry()
+                await self._async_pause(2.0, 4.0)
+                with self.timings.phase("login"):
+                    self._logged_in = await self._async_login(login_url)
+                await self._async_pause(1.5, 3.0)
+                with self.timings.phase("fetch_events"):
+                    events_page = await self._async_get_url(events_url)
 
             if not events_page:
                 raise UpdateFailed(
                     "Failed to fetch events page (maybe IP blocked or session expired)"
                 )
+        self.fetch_plan.record_scrape(now, tried_ical)
 
         # 3. Parse and filter events
-        all_parsed_events = self.parse_events(events_page, home_page, team_url)
-
-        events = []
-        now = dt_util.now()
-        today_str = now.strftime("%Y-%m-%d")
-
-        for e in all_parsed_events:
-            if not e.get("date"):
-                continue
-
-            # Check if event is in the past
-            event_time = e.get("time", "23:59")
-            if not event_time or event_time == "Unknown":
-                event_time = "23:59"
-
-            try:
-                # Construct aware datetime for comparison
-                if event_time != "23:59":
-                    event_dt = dt_util.parse_datetime(f"{e['date']} {event_time}")
-                else:
-                    event_dt = dt_util.parse_datetime(f"{e['date']} 23:59:59")
-
-                if event_dt and event_dt + timedelta(hours=1) < now:
-                    _LOGGER.debug(
-                        "Skipping past event: %s on %s", e["title"], e["date"]
-                    )
-                    continue
-            except (ValueError, TypeError):
-                if e["date"] < today_str:
-                    continue
-
-            events.append(e)
+        all_parsed_events = await self._async_parse_events(
+            events_page, home_page, team_url
+        )
 
-        # Sort events chronologically
-        events.sort(key=lambda x: (x["date"], x.get("time", "00:00")))
+        events = self._upcoming_events(all_parsed_events)
         limited_events = events[: self.event_limit]
 
         # 4. Fetch details for each event (Players & Comments)
         # Optimization: Only fetch details if basic info changed or data missing
-        old_events = {
-            e["link"]: e for e in ((self.data or {}).get("events") or []) if "link" in e
-        }
+        old_events = self._cached_events()
 
         detail_tasks = []
         for event in limited_events:
-            link = event.get("link")
+            link = event.link
 
             # Default empty structures
-            event["players"] = {
-                "accepted_players": [],
-                "declined_players": [],
-                "no_response_players": [],
-            }
-            event["comments"] = []
+            event.players = self.roster.encode({})
+            event.comments = []
 
             # Check if we can reuse cached details
             if link in old_events:
                 old_e = old_events[link]
-                if old_e.get("in_count") == event.get("in_count") and old_e.get(
-                    "original_date"
-                ) == event.get("original_date"):
-                    _LOGGER.debug(
-                        "Reusing cached details for event: %s", event.get("title")
-                    )
-                    event["players"] = old_e.get("players", event["players"])
-                    event["comments"] = old_e.get("comments", event["comments"])
+                if (
+                    old_e.in_count == event.in_count
+                    and old_e.original_date == event.original_date
+                ):
+                    _LOGGER.debug("Reusing cached details for event: %s", event.title)
+                    event.players = old_e.players or event.players
+                    event.comments = old_e.comments or event.comments
+                    self.traffic.record_detail_cache_hit()
                     continue
 
-            if self.fetch_player_info or self.fetch_comments:
+            if needs.details:
                 if link and link != events_url:
                     if link.startswith("/"):
                         link = f"{team_url}{link}"
-                    detail_tasks.append(self._async_fetch_event_details(event, link))
+                    if self.breakers.allows(link):
+                        detail_tasks.append(
+                            self._async_fetch_event_details(event, link)
+                        )
 
         if detail_tasks:
             _LOGGER.debug("Fetching details for %s event(s)", len(detail_tasks))
@@ -538,16 +623,23 @@ class KadermanagerDataUpdateCoordinator(DataUpdateCoordinator):
             async def sem_task(task):
                 async with semaphore:
                     await task
-                    await asyncio.sleep(
-                        random.uniform(3.0, 8.0)
-                    )  # Significant random jitter between requests
+                    # Significant random jitter between requests
+                    await self._async_pause(3.0, 8.0)
 
             await asyncio.gather(*(sem_task(task) for task in detail_tasks))
 
-        data = {"events": limited_events}
+        data = {
+            "events": limited_events,
+            "later_events": events[self.event_limit :],
+        }
 
-        if self.fetch_comments and home_page:
-            data["general_comments"] = self.parse_general_comments(home_page)
+        if needs.general_comments and home_page:
+            data["general_comments"] = await self._async_parse_list(
+                "parse_general_comments",
+                "comments",
+                home_page,
+                self.parse_general_comments,
+            )
 
         # Update success state
         self.last_success = dt_util.now()
@@ -557,12 +649,255 @@ class KadermanagerDataUpdateCoordinator(DataUpdateCoordinator):
 
         return data
 
+    async def async_poll_attendance(self, _now: Optional[datetime] = None) -> None:
+        """Update the enrollment counts from the events widget only.
+
+        The light tier between full updates: one widget request, followed by
+        detail requests only for events whose count changed. Entities are
+        updated in place, so the interval of the full update is not reset.
+        """
+        events = self.season_events()
+        events_widget_url = f"{self.team_url}/calendar/widget_iframe_events"
+        needs = self.demand.needs(self.fetch_player_info, self.fetch_comments)
+        if (
+            not events
+            or not needs.in_count
+            or (self._backoff_until and dt_util.now() < self._backoff_until)
+            or not self.breakers.allows(events_widget_url)
+        ):
+            return
+        if self._session is None or self._session.closed:
+            self._session = self._open_session()
+            self._logged_in = False
+        # Logging in is left to the full update
+        if self.username and self.password and not self._logged_in:
+            return
+
+        await asyncio.sleep(random.uniform(5.0, 30.0))
+        domain_data = self.hass.data.setdefault(DOMAIN, {})
+        async with domain_data.setdefault("scrape_lock", asyncio.Lock()):
+            self.request_budget.reset()
+            self.fetch_needs = needs
+            try:
+                widget_html = await self._async_get_url(events_widget_url)
+            except CannotConnect as err:
+                _LOGGER.debug("Attendance poll failed: %s", err)
+                return
+            if not widget_html:
+                return
+            counts = await self._async_parse_list(
+                "parse_widget", "widget", widget_html, self._parse_widget_events
+            )
+            changed = self._apply_enrollment_counts(events, counts)
+
+            details = 0
+            # Only the events within the limit have details
+            detailed = {id(event) for event in self.data["events"]}
+            if changed and needs.details:
+                await self.async_ensure_sections()
+                for event in changed:
+                    if id(event) not in detailed:
+                        continue
+                    link = event.link
+                    if link and link.startswith("/"):
+                        link = f"{self.team_url}{link}"
+                    if not link or not self.breakers.allows(link):
+                        continue
+                    await self._async_pause(3.0, 8.0)
+                    await self._async_fetch_event_details(event, link)
+                    details += 1
+
+        self.last_attendance_poll = {
+            "at": dt_util.now().isoformat(),
+            "changed": len(changed),
+            "details_fetched": details,
+        }
+        try:
+            await self.traffic.async_save()
+            if changed:
+                await self.store.async_save(self.data, self.roster)
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.debug("Could not save after attendance poll: %s", err)
+        if changed:
+            _LOGGER.debug("Attendance changed for %s event(s)", len(changed))
+            self.async_update_listeners()
+
+    @staticmethod
+    def _apply_enrollment_counts(
+        events: List[KadermanagerEvent], counts: Dict[str, int]
+    ) -> List[KadermanagerEvent]:
+        """Set the widget counts on the events, return those that changed."""
+        changed = []
+        for event in events:
+            if event.date is None:
+                continue
+            # Create a key for matching: Title_DD.MM.
+            d_parts = event.date.split("-")
+            date_key = f"{d_parts[2]}.{d_parts[1]}."
+            in_count = counts.get(f"{event.title}_{date_key}")
+            if in_count != event.in_count:
+                event.in_count = in_count
+                changed.append(event)
+        return changed
+
+    def _upcoming_events(
+        self, parsed_events: List[Dict[str, Any]]
+    ) -> List[KadermanagerEvent]:
+        """Convert parsed events, drop past ones and sort them chronologically."""
+        now = dt_util.now()
+        events = []
+        for parsed in parsed_events:
+            if not parsed.get("date"):
+                continue
+
+            event = KadermanagerEvent.from_dict(parsed)
+            # Events without a known time are all-day events and are kept for the whole day
+            if event.is_past(now):
+                _LOGGER.debug("Skipping past event: %s on %s", event.title, event.date)
+                continue
+            events.append(event)
+
+        events.sort(key=lambda event: event.sort_key)
+        return events
+
+    def season_events(self) -> List[KadermanagerEvent]:
+        """Return all upcoming events, the ones beyond the limit without details."""
+        data = self.data or {}
+        return [*(data.get("events") or []), *(data.get("later_events") or [])]
+
+    async def _async_archive_passed(self, data: Dict[str, Any]) -> None:
+        """Archive and count the last snapshot of the events that passed."""
+        kept = {
+            event.uid for event in [*data["events"], *(data.get("later_events") or [])]
+        }
+        now = dt_util.now()
+        passed = [
+            event
+            for event in self.season_events()
+            if event.uid not in kept and event.is_past(now)
+        ]
+        self.statistics.advance(now.date())
+        if not passed:
+            return
+        self.statistics.add_events(passed)
+        try:
+            count = await self.archive.async_upsert(passed, self.roster)
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.warning("Could not archive passed events: %s", err)
+            return
+        _LOGGER.debug("Archived %s passed event(s)", count)
+
+    async def async_events_between(
+        self, start: datetime, end: datetime
+    ) -> List[KadermanagerEvent]:
+        """Return the events overlapping a range, passed ones from the archive."""
+        upcoming = self.event_index().between(start, end)
+        if start >= dt_util.now():
+            return upcoming
+        try:
+            archived = await self.archive.async_between(start, end)
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.warning("Could not read the event archive: %s", err)
+            return upcoming
+        # Passed events stay in the data for an hour after they started
+        known = {event.uid for event in upcoming}
+        return [e for e in archived if e.uid not in known] + upcoming
+
+    def event_index(self) -> EventIndex:
+        """Return the calendar index of all upcoming events.
+
+        Rebuilt once per refresh; the attendance poll updates counts in place.
+        """
+        if self._event_index is None or self._event_index_data is not self.data:
+            self._event_index = EventIndex(self.season_events())
+            self._event_index_data = self.data
+        return self._event_index
+
+    def _cached_events(self) -> Dict[str, KadermanagerEvent]:
+        """Return the events of the previous refresh keyed by link."""
+        return {
+            event.link: event
+            for event in ((self.data or {}).get("events") or [])
+            if event.link
+        }
+
+    def events_for_player(self, name: str) -> List[Tuple[KadermanagerEvent, str]]:
+        """Return the cached events a player is listed in, with the zone."""
+        player_id = self.roster.lookup(name)
+        if player_id is None:
+            return []
+        matches = []
+        for event in (self.data or {}).get("events") or []:
+            zone = event.player_zone(player_id)
+            if zone is not None:
+                matches.append((event, zone))
+        return matches
+
+    def _create_session(self) -> aiohttp.ClientSession:
+        """Create a new HTTP session with fresh browser-like headers."""
+        connector = aiohttp.TCPConnector(family=socket.AF_INET)
+        self._headers = get_random_headers(self.teamname)
+        return aiohttp.ClientSession(headers=self._headers, connector=connector)
+
+    def _lag_label(self, name: str):
+        """Label synchronous work for the loop-lag monitor."""
+        return self.loop_lag.stage(name) if self.loop_lag else nullcontext()
+
+    @contextmanager
+    def _stage(self, name: str):
+        """Time a synchronous refresh phase and label it for the loop-lag monitor."""
+        with self.timings.phase(name), self._lag_label(name):
+            yield
+
+    async def _async_pause(self, low: float, high: float) -> None:
+        """Wait a random time between requests to look less like a bot."""
+        with self.timings.phase("pacing"):
+            await asyncio.sleep(random.uniform(low, high))
+
+    def _open_session(self) -> aiohttp.ClientSession:
+        """Return the session for the next scrape, honouring cassette mode."""
+        if self._cassette is None:
+            return self._create_session()
+        if self._replay:
+            return ReplaySession(  # type: ignore[return-value]
+                self._cassette, realtime=self._replay_realtime
+            )
+        return RecordingSession(  # type: ignore[return-value]
+            self._create_session(), self._cassette
+        )
+
+    async def async_use_cassette(
+        self,
+        cassette: Optional[Cassette],
+        replay: bool = False,
+        realtime: bool = False,
+    ) -> None:
+        """Record the following refreshes into `cassette` or replay from it.
+
+        Passing None returns to live requests. The current session is closed
+        so the next refresh starts (and logs in) with the new mode.
+        """
+        await self.async_close()
+        self._session = None
+        self._logged_in = False
+        if cassette is not None and not replay:
+            cassette.add_secrets(self.username, self.password)
+        self._cassette = cassette
+        self._replay = replay
+        self._replay_realtime = realtime
+
     async def _async_get_ical_data(self, url: str) -> List[Dict[str, Any]]:
         """Fetch and parse iCal data."""
-        content = await self._async_get_url(url)
+        with self.timings.phase("fetch_ical"):
+            content = await self._async_get_url(url)
         if not content:
             return []
 
+        with self._stage("parse_ical"):
+            return self.parse_ical(content)
+
+    def parse_ical(self, content: str) -> List[Dict[str, Any]]:
+        """Parse the events of an iCal feed."""
         events = []
         current_event: Dict[str, Any] = {}
         # Unfold lines (iCal lines starting with space are continuations)
@@ -598,6 +933,7 @@ class KadermanagerDataUpdateCoordinator(DataUpdateCoordinator):
 
                 parsed_events.append(
                     {
+                        "uid": e.get("UID"),
                         "title": e.get("SUMMARY", "Unknown"),
                         "link": e.get("URL", ""),
                         "location": e.get("LOCATION", "Unknown"),
@@ -612,9 +948,51 @@ class KadermanagerDataUpdateCoordinator(DataUpdateCoordinator):
 
         return parsed_events
 
+    def _parse_streaming(
+        self, name: str, streaming_parser, soup_parser, html: str
+    ) -> Any:
+        """Parse a list page with a streaming extractor.
+
+        The BeautifulSoup parser is used when the extractor fails or finds
+        nothing, so markup the extractor does not follow still gets parsed.
+        """
+        try:
+            result = streaming_parser(html)
+        except Exception as e:
+            _LOGGER.debug("Streaming %s parser failed: %s", name, e)
+            result = None
+        if not result:
+            return soup_parser(html)
+        return result
+
+    async def _async_parse_list(
+        self, phase: str, kind: str, html: str, parse: Callable[[str], Any]
+    ) -> Any:
+        """Parse a list page, in the process pool when it is enabled.
+
+        Without a result from the pool the page is parsed locally, which also
+        covers the BeautifulSoup fallback.
+        """
+        if self.parse_pool is not None:
+            with self.timings.phase(phase):
+                result = await self.parse_pool.async_parse_list(kind, html)
+            if result:
+                return result
+        with self._stage(phase):
+            return parse(html)
+
     def _parse_widget_events(self, html: str) -> Dict[str, int]:
         """Parse enrollment counts from the events widget."""
-        soup = BeautifulSoup(html, "html.parser")
+        return self._parse_streaming(
+            "widget",
+            streaming.parse_widget_events,
+            self._parse_widget_events_soup,
+            html,
+        )
+
+    def _parse_widget_events_soup(self, html: str) -> Dict[str, int]:
+        """Parse enrollment counts from the events widget with BeautifulSoup."""
+        soup = make_soup(html, self.html_backend)
         counts = {}
         event_divs = soup.find_all("div", class_="event")
         for div in event_divs:
@@ -640,11 +1018,23 @@ class KadermanagerDataUpdateCoordinator(DataUpdateCoordinator):
             await self._session.close()
 
     async def async_load_cache(self):
-        """Load cached data from storage."""
-        cache = await self.store.async_load()
+        """Load cached data from storage.
+
+        Only the core section (events and timestamps) is read here; players
+        and comments are loaded on first access via `async_ensure_sections`.
+        """
+        await self.traffic.async_load()
+        await self.breakers.async_load()
+        await self.statistics.async_load()
+        cache = await self.store.async_load_core()
         if cache:
             _LOGGER.debug("Loaded cached data for %s", self.teamname)
+            for key in ("events", "later_events"):
+                cache[key] = [
+                    KadermanagerEvent.from_dict(event) for event in cache.get(key) or []
+                ]
             self.data = cache
+            self.fetch_plan = FetchPlan.from_dict(cache.get("fetch_plan"))
             # Restore last success time to ensure restart-resistance
             if "last_success" in cache:
                 try:
@@ -652,174 +1042,182 @@ class KadermanagerDataUpdateCoordinator(DataUpdateCoordinator):
                 except (ValueError, TypeError):
                     self.last_success = None
 
-    async def _async_login(self, login_url: str) -> bool:
-        """Perform login and update session cookies."""
-        try:
-            _LOGGER.debug("Accessing login page for CSRF token")
-            assert self._session is not None
-            async with self._session.get(login_url, timeout=REQUEST_TIMEOUT) as resp:
-                resp.raise_for_status()
-                html = await resp.text()
-
-            soup = BeautifulSoup(html, "html.parser")
-            token = ""
-            token_input = soup.find("input", {"name": "authenticity_token"})
-            if token_input:
-                t_val = token_input.get("value")
-                token = str(t_val[0] if isinstance(t_val, list) else t_val or "")
-            else:
-                # Fallback to meta tag if input not found
-                token_meta = soup.find("meta", {"name": "csrf-token"})
-                if token_meta:
-                    token_val = token_meta.get("content")
-                    token = str(
-                        token_val[0] if isinstance(token_val, list) else token_val or ""
-                    )
+    def _required_sections(self) -> List[str]:
+        """Return the lazy store sections the current options make use of."""
+        sections = []
+        if self.fetch_player_info:
+            sections.append(SECTION_PLAYERS)
+        if self.fetch_comments:
+            sections.extend([SECTION_COMMENTS, SECTION_GENERAL_COMMENTS])
+        return sections
+
+    async def async_ensure_sections(self, *names: str) -> None:
+        """Load the given (or all required) store sections into the data."""
+        async with self._sections_lock:
+            for name in names or self._required_sections():
+                if self.store.is_loaded(name):
+                    continue
+                section = await self.store.async_load_section(name)
+                if self.data:
+                    merge_section(self.data, name, section, self.roster)
 
-            if not token:
-                _LOGGER.error(
-                    "Could not find authenticity_token or csrf-token on login page"
-                )
-                return False
+    def async_request_sections(self) -> None:
+        """Load the required sections in the background and notify entities."""
+        if all(self.store.is_loaded(name) for name in self._required_sections()):
+            return
+        if self._sections_task is not None and not self._sections_task.done():
+            return
 
-            payload = {
-                "authenticity_token": token,
-                "login_name": self.username,
-                "password": self.password,
-            }
+        async def _load() -> None:
+            await self.async_ensure_sections()
+            self.async_update_listeners()
+
+        self._sections_task = self.hass.async_create_task(_load())
 
-            form = soup.find("form", id="login_form") or soup.find(
-                "form", action=lambda x: x and "sessions" in x
+    async def _async_login(self, login_url: str) -> bool:
+        """Perform login and update session cookies."""
+        try:
+            await async_login(
+                self.pipeline,
+                login_url,
+                self.username,
+                self.password,
+                self._login_soup,
             )
-            post_url = login_url
-            if form and form.get("action"):
-                action = str(form.get("action"))
-                post_url = urljoin(login_url, action)
-
-            _LOGGER.debug("Submitting login form")
-            assert self._session is not None
-            await asyncio.sleep(random.uniform(1.5, 3.5))
-            async with self._session.post(
-                post_url, data=payload, timeout=REQUEST_TIMEOUT
-            ) as resp:
-                if resp.status == 200:
-                    text = await resp.text()
-                    if "Invalid login" in text or "Anmeldung fehlgeschlagen" in text:
-                        _LOGGER.error("Login failed: Invalid credentials")
-                        return False
-                    _LOGGER.debug("Login successful")
-                    return True
-                return False
+        except InvalidAuth:
+            _LOGGER.error("Login failed: Invalid credentials")
+            return False
         except Exception as e:
             _LOGGER.error("Exception during login: %s", e)
             return False
+        _LOGGER.debug("Login successful")
+        return True
+
+    def _login_soup(self, body: bytes) -> BeautifulSoup:
+        with self._lag_label("parse_login"):
+            return make_soup(body, self.html_backend)
+
+    async def _async_get_paced(
+        self, url: str, phase: str, low: float, high: float
+    ) -> Optional[str]:
+        """Pause, then fetch URL content, skipping both while its breaker is open."""
+        if not self.breakers.allows(url):
+            _LOGGER.debug("Skipping %s, its endpoint keeps failing", url)
+            return None
+        await self._async_pause(low, high)
+        with self.timings.phase(phase):
+            return await self._async_get_url(url)
 
     async def _async_get_url(self, url: str) -> Optional[str]:
         """Fetch URL content."""
-        try:
-            assert self._session is not None
-            # Use stored headers but update Referer if needed (though it's usually static enough)
-            async with self._session.get(url, timeout=REQUEST_TIMEOUT) as resp:
-                if "sessions/new" in str(resp.url) and "sessions/new" not in url:
-                    _LOGGER.debug(
-                        "Redirected to login page, session likely expired or unauthorized"
-                    )
-                    self._logged_in = False
-                    return None
+        body = await self._async_get_body(url)
+        return decode_body(body) if body is not None else None
 
-                if resp.status == 429:
-                    _LOGGER.error("Rate limit hit (429) for %s", url)
-                    raise aiohttp.ClientResponseError(
-                        resp.request_info, resp.history, status=429
-                    )
-                if resp.status == 403:
-                    _LOGGER.error(
-                        "Access forbidden (403) for %s - possibly bot detection or IP ban",
-                        url,
-                    )
-
-                resp.raise_for_status()
-                return await resp.text()
+    async def _async_get_body(self, url: str) -> Optional[bytes]:
+        """Fetch URL content as UTF-8 bytes, bounded by the maximum size."""
+        try:
+            resp = await self.pipeline.async_request("GET", url)
+        except SessionExpired:
+            _LOGGER.debug(
+                "Redirected to login page, session likely expired or unauthorized"
+            )
+            self._logged_in = False
+            return None
+        except EndpointUnavailable as e:
+            _LOGGER.debug("%s", e)
+            return None
+        except CannotConnect:
+            raise
+        except (ResponseTooLarge, RequestBudgetExceeded) as e:
+            _LOGGER.error("Aborted fetching %s: %s", url, e)
+            return None
         except aiohttp.ClientResponseError as e:
             _LOGGER.error(
                 "HTTP error fetching %s: %s (Status: %s)", url, e.message, e.status
             )
             return None
-        except aiohttp.ClientConnectorError as e:
-            _LOGGER.error(
-                "Connection error fetching %s: %s - possibly softbanned", url, e
-            )
-            raise CannotConnect(f"Connection failed: {e}") from e
         except Exception as e:
             _LOGGER.error("Failed to fetch %s: %s", url, e)
             return None
+        return resp.body
 
-    async def _async_fetch_event_details(self, event: Dict[str, Any], url: str):
+    async def _async_fetch_event_details(self, event: KadermanagerEvent, url: str):
         """Fetch and parse players/comments for a specific event."""
-        html = await self._async_get_url(url)
+        with self.timings.phase("fetch_details"):
+            html = await self._async_get_body(url)
         if not html:
             return
 
-        soup = BeautifulSoup(html, "html.parser")
+        result = None
+        if self.parse_pool is not None:
+            with self.timings.phase("parse_details"):
+                result = await self.parse_pool.async_parse_detail(
+                    html,
+                    self.html_backend,
+                    self.fetch_needs.players,
+                    self.fetch_needs.comments,
+                )
+        if result is None:
+            with self._stage("parse_details"):
+                soup = make_soup(html, self.html_backend)
+                needs = self.fetch_needs
+                result = (
+                    self.parse_event_players(soup) if needs.players else None,
+                    self.parse_event_comments(soup) if needs.comments else None,
+                )
+        players, comments = result
 
-        if self.fetch_player_info:
-            event["players"] = self.parse_event_players(soup)
+        if players is not None:
+            # Names are interned once per team, events only keep compact ID arrays
+            event.players = self.roster.encode(players)
             # Optimization: If we have the exact player list, update the in_count if it was unknown
-            accepted_count = len(event["players"].get("accepted_players", []))
+            accepted_count = len(players.get("accepted_players", []))
             if accepted_count > 0:
-                event["in_count"] = accepted_count
+                event.in_count = accepted_count
 
-        if self.fetch_comments:
-            event["comments"] = self.parse_event_comments(soup)
+        if comments is not None:
+            event.comments = comments
 
     def parse_events(
         self, events_html: str, home_html: Optional[str], team_url: str
     ) -> List[Dict[str, Any]]:
         """Parse the events list."""
-        soup = BeautifulSoup(events_html, "html.parser")
-        event_containers = soup.find_all("div", class_="event-detailed-container")
-
+        rows = self._event_rows(events_html)
         # Try to match enrollments from home page by event link/title if possible
-        enrollment_map = {}
-        if home_html:
-            home_soup = BeautifulSoup(home_html, "html.parser")
-            # The home page usually has "circle-in-enrollments" inside a container that might have a link
-            enrollment_divs = home_soup.find_all("div", class_="circle-in-enrollments")
-            for idx, div in enumerate(enrollment_divs):
-                try:
-                    count = int(div.text.strip())
-                    # Look for the closest link to this enrollment circle
-                    parent_link = div.find_parent("a", href=True)
-                    if parent_link:
-                        # Normalize link to relative path
-                        raw_href = str(parent_link["href"])
-                        link_path = (
-                            "/" + "/".join(raw_href.split("/")[3:])
-                            if "://" in raw_href
-                            else raw_href
-                        ).split("?")[0]
-                        enrollment_map[link_path] = count
-                    else:
-                        # Fallback: store by index string
-                        enrollment_map[f"idx_{idx}"] = count
-                except (ValueError, AttributeError):
-                    continue
+        enrollment_map = self._enrollments(home_html) if home_html else {}
+        return self._build_events(rows, enrollment_map, team_url)
 
+    async def _async_parse_events(
+        self, events_html: str, home_html: Optional[str], team_url: str
+    ) -> List[Dict[str, Any]]:
+        """Parse the events list, in the process pool when it is enabled."""
+        if self.parse_pool is None:
+            with self._stage("parse_events"):
+                return self.parse_events(events_html, home_html, team_url)
+        rows = await self._async_parse_list(
+            "parse_events", "events", events_html, self._event_rows
+        )
+        enrollment_map = (
+            await self._async_parse_list(
+                "parse_events", "enrollments", home_html, self._enrollments
+            )
+            if home_html
+            else {}
+        )
+        with self._stage("parse_events"):
+            return self._build_events(rows, enrollment_map, team_url)
+
+    def _build_events(
+        self,
+        rows: List[Dict[str, str]],
+        enrollment_map: Dict[str, int],
+        team_url: str,
+    ) -> List[Dict[str, Any]]:
+        """Turn extracted event rows into parsed events."""
         events = []
-        for idx, container in enumerate(event_containers):
-            title_elem = container.find("a", class_="event-title-link")
-            title = title_elem.text.strip() if title_elem else "Unknown"
-
-            link = ""
-            if title_elem and title_elem.has_attr("href"):
-                link = str(title_elem["href"])
-            else:
-                for a in container.find_all("a", href=True):
-                    href = a["href"]
-                    if "player" not in href and "/edit" not in href:
-                        link = str(href)
-                        break
-
+        for idx, row in enumerate(rows):
+            title = row["title"]
+            link = row["link"]
             if link.startswith("/"):
                 link = f"{team_url}{link}"
 
@@ -832,21 +1230,9 @@ class KadermanagerDataUpdateCoordinator(DataUpdateCoordinator):
             elif f"idx_{idx}" in enrollment_map:
                 in_count = enrollment_map[f"idx_{idx}"]
 
-            date_elem = container.find("h4")
-            raw_date_str = date_elem.text.strip() if date_elem else "Unknown"
+            raw_date_str = row["date"]
             parsed_date, parsed_time = self.parse_date_string(raw_date_str)
 
-            location = "Unknown"
-            loc_elem = container.find("div", class_="location")
-            if not loc_elem and date_elem:
-                possible_loc = date_elem.find_next_sibling("div")
-                if possible_loc and "event-latest-comment" not in (
-                    possible_loc.get("class") or []
-                ):
-                    location = possible_loc.text.strip()
-            elif loc_elem:
-                location = loc_elem.text.strip()
-
             event_type = "Unknown"
             for t in ["Training", "Spiel", "Sonstiges"]:
                 if t in title:
@@ -862,51 +1248,116 @@ class KadermanagerDataUpdateCoordinator(DataUpdateCoordinator):
                     "in_count": in_count,
                     "title": title,
                     "link": link or team_url,
-                    "location": location,
+                    "location": row["location"],
                     "type": event_type,
                 }
             )
         return events
 
+    def _event_rows(self, events_html: str) -> List[Dict[str, str]]:
+        """Extract title, link, date text and location of every event."""
+        return self._parse_streaming(
+            "events", streaming.parse_event_list, self._event_rows_soup, events_html
+        )
+
+    def _enrollments(self, home_html: str) -> Dict[str, int]:
+        """Extract the enrollment counts of the home page."""
+        return self._parse_streaming(
+            "enrollments",
+            streaming.parse_enrollments,
+            self._enrollments_soup,
+            home_html,
+        )
+
+    def _event_rows_soup(self, events_html: str) -> List[Dict[str, str]]:
+        """Extract title, link, date text and location of every event."""
+        soup = make_soup(events_html, self.html_backend)
+        rows = []
+        for container in soup.find_all("div", class_="event-detailed-container"):
+            title_elem = container.find("a", class_="event-title-link")
+            title = title_elem.text.strip() if title_elem else "Unknown"
+
+            link = ""
+            if title_elem and title_elem.has_attr("href"):
+                link = str(title_elem["href"])
+            else:
+                for a in container.find_all("a", href=True):
+                    href = a["href"]
+                    if "player" not in href and "/edit" not in href:
+                        link = str(href)
+                        break
+
+            date_elem = container.find("h4")
+            raw_date_str = date_elem.text.strip() if date_elem else "Unknown"
+
+            location = "Unknown"
+            loc_elem = container.find("div", class_="location")
+            if not loc_elem and date_elem:
+                possible_loc = date_elem.find_next_sibling("div")
+                if possible_loc and "event-latest-comment" not in (
+                    possible_loc.get("class") or []
+                ):
+                    location = possible_loc.text.strip()
+            elif loc_elem:
+                location = loc_elem.text.strip()
+
+            rows.append(
+                {
+                    "title": title,
+                    "link": link,
+                    "date": raw_date_str,
+                    "location": location,
+                }
+            )
+        return rows
+
+    def _enrollments_soup(self, home_html: str) -> Dict[str, int]:
+        """Extract the enrollment counts of the home page."""
+        enrollment_map = {}
+        home_soup = make_soup(home_html, self.html_backend)
+        # The home page usually has "circle-in-enrollments" inside a container that might have a link
+        enrollment_divs = home_soup.find_all("div", class_="circle-in-enrollments")
+        for idx, div in enumerate(enrollment_divs):
+            try:
+                count = int(div.text.strip())
+                # Look for the closest link to this enrollment circle
+                parent_link = div.find_parent("a", href=True)
+                if parent_link:
+                    # Normalize link to relative path
+                    raw_href = str(parent_link["href"])
+                    link_path = (
+                        "/" + "/".join(raw_href.split("/")[3:])
+                        if "://" in raw_href
+                        else raw_href
+                    ).split("?")[0]
+                    enrollment_map[link_path] = count
+                else:
+                    # Fallback: store by index string
+                    enrollment_map[f"idx_{idx}"] = count
+            except (ValueError, AttributeError):
+                continue
+        return enrollment_map
+
     def parse_event_players(self, soup: BeautifulSoup) -> Dict[str, List[str]]:
         """Parse player list from event page."""
-        player_types: Dict[str, List[str]] = {
-            "accepted_players": [],
-            "declined_players": [],
-            "no_response_players": [],
-        }
-        drop_zones = soup.find_all("div", class_="drop-zone")
-        for zone in drop_zones:
-            zone_id = zone.get("id")
-            players = [
-                label.text.strip()
-                for label in zone.find_all("span", class_="player_label")
-            ]
-            if zone_id == "zone_1":
-                player_types["accepted_players"] = players
-            elif zone_id == "zone_2":
-                player_types["declined_players"] = players
-            elif zone_id == "zone_3":
-                player_types["no_response_players"] = players
-        return player_types
+        return parsers.parse_event_players(soup)
 
     def parse_event_comments(self, soup: BeautifulSoup) -> List[Dict[str, str]]:
         """Parse comments from event page."""
-        comments: List[Dict[str, str]] = []
-        comment_divs = soup.find_all("div", class_="message")
-        for comment_div in reversed(comment_divs):
-            if len(comments) >= 5:
-                break
-            author_elem = comment_div.find("h5")
-            text_elem = comment_div.find("p")
-            if author_elem and text_elem:
-                author = author_elem.text.strip().split("\n")[0].strip()
-                comments.append({"author": author, "text": text_elem.text.strip()})
-        return comments
+        return parsers.parse_event_comments(soup)
 
     def parse_general_comments(self, html: str) -> List[Dict[str, str]]:
         """Parse general team comments."""
-        soup = BeautifulSoup(html, "html.parser")
+        return self._parse_streaming(
+            "comments",
+            streaming.parse_general_comments,
+            self._parse_general_comments_soup,
+            html,
+        )
+
+    def _parse_general_comments_soup(self, html: str) -> List[Dict[str, str]]:
+        """Parse general team comments with BeautifulSoup."""
+        soup = make_soup(html, self.html_backend)
         comments: List[Dict[str, str]] = []
         comment_divs = soup.find_all("div", class_="row message")
         for comment_div in reversed(comment_divs):
@@ -1023,98 +1474,109 @@ class KadermanagerDataUpdateCoordinator(DataUpdateCoordinator):
         return target_date.strftime("%Y-%m-%d"), time_part
 
 
+async def async_login(
+    pipeline: Pipeline,
+    login_url: str,
+    username: Optional[str],
+    password: Optional[str],
+    soup_factory: Callable[[bytes], BeautifulSoup] = make_soup,
+    pause: Tuple[float, float] = (1.5, 3.5),
+) -> None:
+    """Submit the login form, raise InvalidAuth if the credentials are rejected."""
+    _LOGGER.debug("Accessing login page for CSRF token")
+    resp = await pipeline.async_request("GET", login_url)
+    soup = soup_factory(resp.body)
+
+    token = ""
+    token_input = soup.find("input", {"name": "authenticity_token"})
+    if token_input:
+        t_val = token_input.get("value")
+        token = str(t_val[0] if isinstance(t_val, list) else t_val or "")
+    else:
+        # Fallback to meta tag if input not found
+        token_meta = soup.find("meta", {"name": "csrf-token"})
+        if token_meta:
+            m_val = token_meta.get("content")
+            token = str(m_val[0] if isinstance(m_val, list) else m_val or "")
+    if not token:
+        raise CannotConnect(
+            "Could not find authenticity_token or csrf-token on login page"
+        )
+
+    payload = {
+        "authenticity_token": token,
+        "login_name": username,
+        "password": password,
+    }
+    form = soup.find("form", id="login_form") or soup.find(
+        "form", action=lambda x: x and "sessions" in x
+    )
+    post_url = login_url
+    if form and form.get("action"):
+        post_url = urljoin(login_url, str(form.get("action")))
+
+    _LOGGER.debug("Submitting login form")
+    await asyncio.sleep(random.uniform(*pause))
+    resp = await pipeline.async_request(
+        "POST", post_url, data=payload, headers={"Referer": login_url}
+    )
+    if resp.status != 200:
+        raise CannotConnect(f"Login failed with status {resp.status}")
+    text = resp.text
+    if "Invalid login" in text or "Anmeldung fehlgeschlagen" in text:
+        raise InvalidAuth
+
+
 async def validate_input(hass: HomeAssistant, data: Dict[str, Any]) -> None:
     """Validate the user input allows us to connect (Shared validation)."""
     teamname = data[CONF_TEAM_NAME].lower()
     username = data.get(CONF_USERNAME)
     password = data.get(CONF_PASSWORD)
 
-    headers = get_random_headers(teamname)
+    headers = {
+        **get_random_headers(teamname),
+        "Referer": "https://www.kadermanager.de/",
+    }
     connector = aiohttp.TCPConnector(family=socket.AF_INET)
     async with aiohttp.ClientSession(headers=headers, connector=connector) as session:
+        timing = TimingStage()
+        pipeline = Pipeline(
+            lambda: session,
+            [timing, ClassifyStage()],
+            max_bytes=max_response_bytes(None),
+        )
         main_url = f"https://{teamname}.kadermanager.de"
 
         try:
-            headers = {**headers, "Referer": "https://www.kadermanager.de/"}
-            async with session.get(
-                main_url, timeout=REQUEST_TIMEOUT, headers=headers
-            ) as resp:
-                if resp.status == 403:
-                    _LOGGER.error(
-                        "Access forbidden (403) during validation - possibly IP blocked"
-                    )
-                    raise CannotConnect("IP blocked or access forbidden")
-                resp.raise_for_status()
-        except Exception as e:
-            if not isinstance(e, CannotConnect):
-                _LOGGER.error("Validation failed connecting to %s: %s", main_url, e)
-                raise CannotConnect from e
+            await pipeline.async_request("GET", main_url)
+        except CannotConnect:
             raise
+        except aiohttp.ClientResponseError as e:
+            if e.status == 403:
+                raise CannotConnect("IP blocked or access forbidden") from e
+            _LOGGER.error("Validation failed connecting to %s: %s", main_url, e)
+            raise CannotConnect from e
+        except Exception as e:
+            _LOGGER.error("Validation failed connecting to %s: %s", main_url, e)
+            raise CannotConnect from e
 
         if username and password:
-            login_url = f"{main_url}/sessions/new"
             try:
-                await asyncio.sleep(random.uniform(1.0, 3.0))
-                async with session.get(
-                    login_url, timeout=REQUEST_TIMEOUT, headers=headers
-                ) as resp:
-                    resp.raise_for_status()
-                    html = await resp.text()
-
-                soup = BeautifulSoup(html, "html.parser")
-                token_input = soup.find("input", {"name": "authenticity_token"})
-                token_val = ""
-                if token_input:
-                    t_val = token_input.get("value")
-                    token_val = str(
-                        t_val[0] if isinstance(t_val, list) else t_val or ""
-                    )
-
-                if not token_val:
-                    token_meta = soup.find("meta", {"name": "csrf-token"})
-                    if token_meta:
-                        m_val = token_meta.get("content")
-                        token_val = str(
-                            m_val[0] if isinstance(m_val, list) else m_val or ""
-                        )
-
-                payload = {
-                    "authenticity_token": token_val,
-                    "login_name": username,
-                    "password": password,
-                }
-
-                form = soup.find("form", id="login_form") or soup.find(
-                    "form", action=lambda x: x and "sessions" in x
+                await async_login(
+                    pipeline,
+                    f"{main_url}/sessions/new",
+                    username,
+                    password,
+                    pause=(1.0, 3.0),
                 )
-                post_url = (
-                    urljoin(login_url, str(form.get("action")))
-                    if form and form.get("action")
-                    else login_url
-                )
-
-                # Set referer to login page for the POST
-                post_headers = {**headers, "Referer": login_url}
-                await asyncio.sleep(random.uniform(1.0, 3.0))
-                async with session.post(
-                    post_url,
-                    data=payload,
-                    timeout=REQUEST_TIMEOUT,
-                    headers=post_headers,
-                ) as resp:
-                    if resp.status == 200:
-                        text = await resp.text()
-                        if (
-                            "Invalid login" in text
-                            or "Anmeldung fehlgeschlagen" in text
-                        ):
-                            raise InvalidAuth
-                    elif resp.status == 403:
-                        raise CannotConnect("IP blocked during login")
-                    else:
-                        raise CannotConnect(f"Login failed with status {resp.status}")
             except (InvalidAuth, CannotConnect):
                 raise
+            except aiohttp.ClientResponseError as e:
+                if e.status == 403:
+                    raise CannotConnect("IP blocked during login") from e
+                raise CannotConnect(f"Login failed with status {e.status}") from e
             except Exception as e:
                 _LOGGER.error("Validation error: %s", e)
                 raise CannotConnect from e
+
+        _LOGGER.debug("Validation requests: %s", timing.as_dict())
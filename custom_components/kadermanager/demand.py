@@ -0,0 +1,99 @@
+"""Which data fields the entities of a team consume.
+
+Every entity declares the fields it shows and registers them with the
+coordinator when it is added to Home Assistant. Entities the user disabled
+in the entity registry are never added, so they do not count. Together with
+the options this decides which pages a refresh requests: a team without
+comments does not need the messages widget, one whose entities never show
+enrollment counts does not need the events widget.
+
+Until the platforms are set up (the first refresh runs before) the demand
+is unknown and everything the options allow is fetched.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable, Dict, FrozenSet, Iterable, Optional
+
+# Title, date, type and location of the events, always fetched
+FIELD_EVENTS = "events"
+# Enrollment counts from the events widget or the home page
+FIELD_IN_COUNT = "in_count"
+# Player lists and comments of the event detail pages
+FIELD_PLAYERS = "players"
+FIELD_COMMENTS = "comments"
+# Team comments from the messages widget or the home page
+FIELD_GENERAL_COMMENTS = "general_comments"
+
+ALL_FIELDS = frozenset(
+    (
+        FIELD_EVENTS,
+        FIELD_IN_COUNT,
+        FIELD_PLAYERS,
+        FIELD_COMMENTS,
+        FIELD_GENERAL_COMMENTS,
+    )
+)
+
+
+@dataclass(frozen=True)
+class FetchNeeds:
+    """What a refresh has to request besides the event list."""
+
+    in_count: bool
+    players: bool
+    comments: bool
+    general_comments: bool
+
+    @property
+    def details(self) -> bool:
+        return self.players or self.comments
+
+
+class DataDemand:
+    """Fields registered by the entities that are currently added."""
+
+    def __init__(self) -> None:
+        self._consumers: Dict[str, FrozenSet[str]] = {}
+        # Set once the platforms are set up and all enabled entities registered
+        self.ready = False
+
+    def register(self, consumer: str, fields: Iterable[str]) -> Callable[[], None]:
+        """Declare the fields of a consumer, return the callback removing it."""
+        self._consumers[consumer] = frozenset(fields)
+
+        def _unregister() -> None:
+            self._consumers.pop(consumer, None)
+
+        return _unregister
+
+    @property
+    def fields(self) -> Optional[FrozenSet[str]]:
+        """Fields consumed by any registered entity, None while unknown."""
+        if not self.ready:
+            return None
+        return frozenset().union(*self._consumers.values())
+
+    def needs(self, fetch_player_info: bool, fetch_comments: bool) -> FetchNeeds:
+        """Combine the options with the demand into the data to fetch."""
+        fields = self.fields
+        if fields is None:
+            fields = ALL_FIELDS
+        players = fetch_player_info and FIELD_PLAYERS in fields
+        comments = fetch_comments and FIELD_COMMENTS in fields
+        return FetchNeeds(
+            # Detail pages are only fetched again when the count changed
+            in_count=FIELD_IN_COUNT in fields or players or comments,
+            players=players,
+            comments=comments,
+            general_comments=fetch_comments and FIELD_GENERAL_COMMENTS in fields,
+        )
+
+    def as_dict(self) -> Dict[str, object]:
+        return {
+            "ready": self.ready,
+            "consumers": {
+                consumer: sorted(fields) for consumer, fields in self._consumers.items()
+            },
+        }
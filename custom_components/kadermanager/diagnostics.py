@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from dataclasses import asdict
 from typing import Any
 
 from homeassistant.components.diagnostics import async_redact_data
@@ -18,15 +19,25 @@ from .const import (
     CONF_UPDATE_INTERVAL,
     CONF_FETCH_PLAYER_INFO,
     CONF_FETCH_COMMENTS,
+    CONF_MONITOR_LOOP_LAG,
+    CONF_CAPTURE_RESPONSES,
+    CONF_DIAGNOSTICS_RESPONSES,
+    CONF_PARSE_IN_PROCESSES,
+    CONF_MAX_RESPONSE_SIZE,
+    CONF_ATTENDANCE_INTERVAL,
     DOMAIN,
 )
 from .coordinator import KadermanagerDataUpdateCoordinator
+from .footprint import memory_report
+from .models import KadermanagerEvent
+from .reader import DEFAULT_MAX_RESPONSE_MB
+from .sensor import event_attributes
 
 # Fields to strip from diagnostic output before handing to the user
 TO_REDACT = {CONF_USERNAME, CONF_PASSWORD, "password", "username", "email"}
 
 
-def _summarise_events(events: list[dict[str, Any]]) -> dict[str, Any]:
+def _summarise_events(events: list[KadermanagerEvent]) -> dict[str, Any]:
     """Return a privacy-safe summary of the cached event list.
 
     Player names and comments are intentionally omitted; only aggregate
@@ -41,14 +52,12 @@ def _summarise_events(events: list[dict[str, Any]]) -> dict[str, Any]:
     player_count_total = 0
 
     for event in events:
-        event_type = event.get("type", "Unknown")
-        type_counts[event_type] = type_counts.get(event_type, 0) + 1
+        type_counts[event.type] = type_counts.get(event.type, 0) + 1
 
-        date = event.get("date")
-        if date and date != "Unknown":
-            dates.append(date)
+        if event.start is not None:
+            dates.append(event.start.date().isoformat())
 
-        players = event.get("players", {})
+        players = event.players or {}
         player_count_total += len(players.get("accepted_players", []))
 
     return {
@@ -60,6 +69,16 @@ def _summarise_events(events: list[dict[str, Any]]) -> dict[str, Any]:
     }
 
 
+async def _async_archive_stats(
+    coordinator: KadermanagerDataUpdateCoordinator,
+) -> dict[str, Any]:
+    """Return the archive size, or the error if the file cannot be read."""
+    try:
+        return await coordinator.archive.async_stats()
+    except Exception as err:  # pylint: disable=broad-except
+        return {"error": str(err)}
+
+
 async def async_get_config_entry_diagnostics(
     hass: HomeAssistant, entry: ConfigEntry
 ) -> dict[str, Any]:
@@ -89,6 +108,13 @@ async def async_get_config_entry_diagnostics(
         "update_interval_minutes": config.get(CONF_UPDATE_INTERVAL, 30),
         "fetch_player_info": config.get(CONF_FETCH_PLAYER_INFO, False),
         "fetch_comments": config.get(CONF_FETCH_COMMENTS, False),
+        "monitor_loop_lag": config.get(CONF_MONITOR_LOOP_LAG, False),
+        "capture_responses": config.get(CONF_CAPTURE_RESPONSES, False),
+        "parse_in_processes": config.get(CONF_PARSE_IN_PROCESSES, False),
+        "max_response_size_mb": config.get(
+            CONF_MAX_RESPONSE_SIZE, DEFAULT_MAX_RESPONSE_MB
+        ),
+        "attendance_interval_minutes": config.get(CONF_ATTENDANCE_INTERVAL, 0),
     }
 
     # ── Coordinator state ─────────────────────────────────────────────────────
@@ -96,8 +122,11 @@ async def async_get_config_entry_diagnostics(
         diag["coordinator"] = "not_initialized"
         return diag
 
+    # Players and comments live in lazily loaded store sections
+    await coordinator.async_ensure_sections()
+
     last_exception = coordinator.last_exception
-    raw_events: list[dict[str, Any]] = (coordinator.data or {}).get("events") or []
+    raw_events: list[KadermanagerEvent] = (coordinator.data or {}).get("events") or []
 
     diag["coordinator"] = {
         # Connection health
@@ -120,11 +149,53 @@ async def async_get_config_entry_diagnostics(
         "issue_reported": coordinator._issue_created,
         # Timing
         "update_interval": str(coordinator.update_interval),
+        # Fields declared by the added entities and what the last refresh
+        # fetched for them (diagnostics only summarise the cached data)
+        "demand": coordinator.demand.as_dict(),
+        "fetch_needs": asdict(coordinator.fetch_needs),
+        # iCal or scraping, and when iCal last failed
+        "fetch_plan": coordinator.fetch_plan.as_dict(),
+        # Days and events behind the attendance statistics
+        "statistics": coordinator.statistics.as_dict(),
+        # Passed events kept in the SQLite archive
+        "archive": await _async_archive_stats(coordinator),
+        # Widget-only enrollment count poll between the full updates
+        "last_attendance_poll": coordinator.last_attendance_poll,
+        # BeautifulSoup backend in use
+        "html_backend": coordinator.html_backend,
+        # Shared worker processes (None unless parsing in processes is enabled)
+        "parse_pool": (
+            coordinator.parse_pool.as_dict() if coordinator.parse_pool else None
+        ),
         # Data summary (privacy-safe – no names, no comments)
         "cached_events_summary": _summarise_events(raw_events),
         "general_comments_cached": len(
             (coordinator.data or {}).get("general_comments") or []
         ),
+        "roster_size": len(coordinator.roster),
+        # Requests, bytes and cache hits (today and per day)
+        "traffic": coordinator.traffic.as_dict(),
+        # Circuit breakers, request budget, per-endpoint timings and conditional cache
+        "request_pipeline": coordinator.pipeline.as_dict(),
+        # Where the time of the last refreshes went, per phase
+        "refresh_timings": coordinator.timings.as_dict(),
+        # Top entries of the last profile_refresh service call, if any
+        "profile": coordinator.last_profile,
+        # Event-loop blocking per refresh (None unless monitoring is enabled)
+        "loop_lag": coordinator.loop_lag.as_dict() if coordinator.loop_lag else None,
+    }
+
+    # ── Memory / storage footprint ───────────────────────────────────────────
+    diag["memory"] = {
+        **memory_report(coordinator, event_attributes(coordinator)),
+        # Retained allocations of the last profile_refresh with trace_memory
+        "tracemalloc": coordinator.last_memory_trace,
     }
 
+    # ── Captured raw responses (bodies only when explicitly requested) ────────
+    if coordinator.responses is not None:
+        diag["raw_responses"] = coordinator.responses.as_dict(
+            include_bodies=config.get(CONF_DIAGNOSTICS_RESPONSES, False)
+        )
+
     return diag
@@ -0,0 +1,68 @@
+"""Memory of which data path works for a team.
+
+A refresh either combines the iCal feed with the widgets or scrapes the
+`/events` and home pages. Teams whose feed is empty or behind the login
+always end up scraping, after a wasted iCal request and its pause. The path
+that produced the last events is remembered with the cached data and used
+first; iCal, the lighter path, is probed again once `PLAN_REPROBE_INTERVAL`
+has passed since it last failed.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+
+from homeassistant.util import dt as dt_util
+
+PLAN_ICAL = "ical"
+PLAN_SCRAPE = "scrape"
+
+PLAN_REPROBE_INTERVAL = timedelta(hours=24)
+
+
+class FetchPlan:
+    """The data path of a team and when iCal last failed."""
+
+    def __init__(
+        self, path: str = PLAN_ICAL, ical_failed: Optional[datetime] = None
+    ) -> None:
+        self.path = path
+        self.ical_failed = ical_failed
+
+    def try_ical(self, now: datetime) -> bool:
+        """Return whether the next refresh should start with the iCal feed."""
+        return (
+            self.path == PLAN_ICAL
+            or self.ical_failed is None
+            or now - self.ical_failed >= PLAN_REPROBE_INTERVAL
+        )
+
+    def record_ical(self) -> None:
+        """Remember the iCal path produced the events."""
+        self.path = PLAN_ICAL
+        self.ical_failed = None
+
+    def record_scrape(self, now: datetime, tried_ical: bool) -> None:
+        """Remember scraping produced the events after iCal failed or was skipped."""
+        self.path = PLAN_SCRAPE
+        if tried_ical:
+            self.ical_failed = now
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "path": self.path,
+            "ical_failed": self.ical_failed.isoformat() if self.ical_failed else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, Any]]) -> "FetchPlan":
+        if not data:
+            return cls()
+        ical_failed = None
+        if data.get("ical_failed"):
+            try:
+                ical_failed = dt_util.parse_datetime(data["ical_failed"])
+            except (ValueError, TypeError):
+                ical_failed = None
+        return cls(data.get("path", PLAN_ICAL), ical_failed)
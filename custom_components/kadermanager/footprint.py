@@ -0,0 +1,112 @@
+"""Memory and storage footprint of a team's data."""
+
+from __future__ import annotations
+
+import json
+import sys
+from array import array
+from typing import TYPE_CHECKING, Any, Dict, Iterable
+
+from .store import split_payload
+
+if TYPE_CHECKING:
+    from .coordinator import KadermanagerDataUpdateCoordinator
+
+# Immutable leaves that never reference other objects
+_ATOMIC = (str, bytes, int, float, bool, type(None), array)
+
+
+def _slot_values(obj: Any) -> Iterable[Any]:
+    for cls in type(obj).__mro__:
+        for slot in getattr(cls, "__slots__", ()):
+            if hasattr(obj, slot):
+                yield getattr(obj, slot)
+
+
+def deep_sizeof(obj: Any, seen: set[int] | None = None) -> int:
+    """Return the size in bytes of `obj` and everything it references.
+
+    Objects reachable more than once (interned strings, shared lists) are
+    counted once per call, or once across calls sharing `seen`.
+    """
+    seen = set() if seen is None else seen
+    total = 0
+    stack = [obj]
+    while stack:
+        current = stack.pop()
+        if id(current) in seen:
+            continue
+        seen.add(id(current))
+        total += sys.getsizeof(current)
+        if isinstance(current, _ATOMIC):
+            continue
+        if isinstance(current, dict):
+            stack.extend(current.keys())
+            stack.extend(current.values())
+        elif isinstance(current, (list, tuple, set, frozenset)):
+            stack.extend(current)
+        elif hasattr(type(current), "__slots__"):
+            stack.extend(_slot_values(current))
+        elif hasattr(current, "__dict__"):
+            stack.append(vars(current))
+    return total
+
+
+def _json_size(value: Any) -> int:
+    return len(json.dumps(value, separators=(",", ":"), default=str).encode())
+
+
+def memory_report(
+    coordinator: KadermanagerDataUpdateCoordinator, attributes: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Return memory, store and attribute sizes in bytes.
+
+    `attributes` are the main sensor's state attributes; their JSON size is
+    roughly what the recorder writes for every state change.
+    """
+    data = coordinator.data or {}
+    events = data.get("events") or []
+
+    # Details first, so the event figure only covers the remaining fields
+    seen: set[int] = set()
+    players = deep_sizeof([event.players for event in events], seen)
+    roster = deep_sizeof(coordinator.roster, seen)
+    comments = deep_sizeof([event.comments for event in events], seen)
+    general_comments = deep_sizeof(data.get("general_comments"), seen)
+    core = deep_sizeof(data, seen)
+    # Only the index's own lists, the events were counted above
+    calendar_index = deep_sizeof(coordinator.event_index(), seen)
+
+    store_core, store_sections = split_payload(data, coordinator.roster)
+    attribute_events = attributes.get("events") or []
+
+    return {
+        "options": {
+            "event_limit": coordinator.event_limit,
+            "fetch_player_info": coordinator.fetch_player_info,
+            "fetch_comments": coordinator.fetch_comments,
+        },
+        "event_count": len(events),
+        "later_event_count": len(data.get("later_events") or []),
+        "coordinator_data_bytes": {
+            "events": core,
+            "players": players,
+            "roster": roster,
+            "comments": comments,
+            "general_comments": general_comments,
+            "calendar_index": calendar_index,
+            "total": (
+                core + players + roster + comments + general_comments + calendar_index
+            ),
+        },
+        "store_json_bytes": {
+            "core": _json_size(store_core),
+            **{name: _json_size(section) for name, section in store_sections.items()},
+        },
+        "sensor_attributes_json_bytes": {
+            "players": _json_size([e.get("players") for e in attribute_events]),
+            "comments": _json_size([e.get("comments") for e in attribute_events]),
+            "general_comments": _json_size(attributes.get("comments")),
+            "total": _json_size(attributes),
+        },
+    }
@@ -0,0 +1,258 @@
+"""Runtime instrumentation of coordinator refreshes."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import statistics
+import time
+from array import array
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+from homeassistant.util import dt as dt_util
+
+_LOGGER = logging.getLogger(__name__)
+
+# How often the probe expects to be scheduled during a refresh
+LOOP_LAG_INTERVAL = 0.02
+# Lag above this is logged, it is noticeable as a stuttering UI
+LOOP_LAG_WARNING = 0.1
+
+STAGE_IDLE = "network"
+
+# Refreshes kept for the rolling percentiles
+REFRESH_HISTORY = 50
+
+# Phases of a refresh in the order they usually run. "login" covers the whole
+# login flow, "pacing" collects the random anti-bot pauses between requests
+# and "listeners" the entity updates after the refresh returned.
+PHASES = (
+    "schedule_wait",
+    "load_sections",
+    "jitter",
+    "login",
+    "fetch_ical",
+    "parse_ical",
+    "fetch_widget_events",
+    "parse_widget",
+    "fetch_widget_messages",
+    "fetch_events",
+    "fetch_home",
+    "parse_events",
+    "fetch_details",
+    "parse_details",
+    "parse_general_comments",
+    "pacing",
+    "save",
+    "listeners",
+    "total",
+)
+_PHASE_INDEX = {name: idx for idx, name in enumerate(PHASES)}
+
+
+class RefreshTimings:
+    """Per-phase durations of the last refreshes.
+
+    Every refresh is one row of `len(PHASES)` seconds in a flat
+    ``array("d")`` used as ring buffer, so keeping the history costs a fixed
+    `REFRESH_HISTORY * len(PHASES) * 8` bytes. Phases that run several times
+    (detail fetches, pauses) are summed.
+    """
+
+    def __init__(self, size: int = REFRESH_HISTORY) -> None:
+        self.size = size
+        self._buffer = array("d", bytes(8 * size * len(PHASES)))
+        self._count = 0
+        self._current: Optional[array] = None
+        self._started = 0.0
+        self._awaiting_listeners = False
+
+    @property
+    def refreshes(self) -> int:
+        """Number of refreshes currently held in the buffer."""
+        return min(self._count, self.size)
+
+    def begin(self) -> None:
+        """Start timing a refresh."""
+        self._current = array("d", bytes(8 * len(PHASES)))
+        self._started = time.perf_counter()
+        self._awaiting_listeners = False
+
+    def add(self, name: str, seconds: float) -> None:
+        """Add `seconds` to a phase of the running refresh."""
+        if self._current is not None:
+            self._current[_PHASE_INDEX[name]] += seconds
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time the block as (part of) a phase of the running refresh."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - start)
+
+    def finish(self) -> None:
+        """Store the running refresh in the ring buffer."""
+        current = self._current
+        if current is None:
+            return
+        current[_PHASE_INDEX["total"]] = time.perf_counter() - self._started
+        offset = (self._count % self.size) * len(PHASES)
+        self._buffer[offset : offset + len(PHASES)] = current
+        self._count += 1
+        self._current = None
+        self._awaiting_listeners = True
+
+    @contextmanager
+    def listeners(self) -> Iterator[None]:
+        """Time the listener fan-out that follows a finished refresh."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            if self._awaiting_listeners:
+                self._awaiting_listeners = False
+                offset = ((self._count - 1) % self.size) * len(PHASES)
+                self._buffer[offset + _PHASE_INDEX["listeners"]] = (
+                    time.perf_counter() - start
+                )
+
+    def _column(self, name: str) -> List[float]:
+        idx = _PHASE_INDEX[name]
+        return [self._buffer[row * len(PHASES) + idx] for row in range(self.refreshes)]
+
+    @property
+    def last(self) -> Optional[Dict[str, float]]:
+        """Seconds per phase of the most recent refresh."""
+        if not self._count:
+            return None
+        offset = ((self._count - 1) % self.size) * len(PHASES)
+        return {
+            name: round(self._buffer[offset + idx], 3)
+            for idx, name in enumerate(PHASES)
+        }
+
+    def percentiles(self, name: str) -> Optional[Dict[str, float]]:
+        """Median, p95 and max seconds of a phase over the buffered refreshes."""
+        values = self._column(name)
+        if not values:
+            return None
+        p95 = (
+            statistics.quantiles(values, n=20, method="inclusive")[-1]
+            if len(values) >= 2
+            else values[0]
+        )
+        return {
+            "p50": round(statistics.median(values), 3),
+            "p95": round(p95, 3),
+            "max": round(max(values), 3),
+        }
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "refreshes": self.refreshes,
+            "last_seconds": self.last,
+            "rolling_seconds": {name: self.percentiles(name) for name in PHASES},
+        }
+
+
+class LoopLagMonitor:
+    """Measure how long a refresh keeps the event loop from running.
+
+    While a refresh runs, a probe task asks to be woken every
+    `LOOP_LAG_INTERVAL` seconds; the delay beyond that is time in which the
+    loop was blocked. Synchronous work (parsers, serialisation) is wrapped in
+    `stage()` so a blocked stretch can be attributed to the stage that ran
+    in it. Without any stage the loop was only waiting on the network.
+    """
+
+    def __init__(self, interval: float = LOOP_LAG_INTERVAL) -> None:
+        self.interval = interval
+        self.last: Optional[Dict[str, Any]] = None
+        self.worst: Optional[Dict[str, Any]] = None
+        self._samples: List[float] = []
+        self._stage_lag: Dict[str, float] = {}
+        self._stage = STAGE_IDLE
+        self._stages_since_tick: List[str] = []
+        self._task: Optional[asyncio.Task] = None
+        self._stop: Optional[asyncio.Event] = None
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Label the code run inside the block."""
+        previous = self._stage
+        self._stage = name
+        self._stages_since_tick.append(name)
+        try:
+            yield
+        finally:
+            self._stage = previous
+
+    def start(self) -> None:
+        """Start probing, must be called from the event loop."""
+        self._samples = []
+        self._stage_lag = {}
+        self._stage = STAGE_IDLE
+        self._stages_since_tick = []
+        self._stop = asyncio.Event()
+        self._task = asyncio.get_running_loop().create_task(self._probe(self._stop))
+
+    async def stop(self) -> Optional[Dict[str, Any]]:
+        """Stop probing and return the figures of the refresh."""
+        if self._task is None or self._stop is None:
+            return None
+        self._stop.set()
+        await self._task
+        self._task = None
+
+        samples = self._samples
+        max_lag = max(samples, default=0.0)
+        p95 = (
+            statistics.quantiles(samples, n=20, method="inclusive")[-1]
+            if len(samples) >= 2
+            else max_lag
+        )
+        worst_stage = (
+            max(self._stage_lag, key=self._stage_lag.__getitem__)
+            if self._stage_lag
+            else None
+        )
+        self.last = {
+            "max_ms": round(max_lag * 1000, 1),
+            "p95_ms": round(p95 * 1000, 1),
+            "worst_stage": worst_stage,
+            "stages_ms": {
+                name: round(lag * 1000, 1) for name, lag in self._stage_lag.items()
+            },
+            "samples": len(samples),
+            "measured_at": dt_util.now().isoformat(),
+        }
+        if self.worst is None or self.last["max_ms"] >= self.worst["max_ms"]:
+            self.worst = self.last
+        if max_lag > LOOP_LAG_WARNING:
+            _LOGGER.warning(
+                "Refresh blocked the event loop for %.0f ms (stage: %s)",
+                max_lag * 1000,
+                worst_stage,
+            )
+        return self.last
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {"last_refresh": self.last, "worst_refresh": self.worst}
+
+    async def _probe(self, stop: asyncio.Event) -> None:
+        loop = asyncio.get_running_loop()
+        while not stop.is_set():
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, loop.time() - expected)
+            self._samples.append(lag)
+            # Sync stages have usually finished by the time the probe runs,
+            # so the stretch belongs to the stages entered since the last tick
+            stages = self._stages_since_tick or [self._stage]
+            self._stages_since_tick = []
+            stage = "+".join(dict.fromkeys(stages))
+            if lag > self._stage_lag.get(stage, 0.0):
+                self._stage_lag[stage] = lag
@@ -0,0 +1,255 @@
+"""Data model for Kadermanager events."""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Iterable, List, Mapping, Optional
+
+from homeassistant.util import dt as dt_util
+
+UNKNOWN = "Unknown"
+
+# Default duration of a timed event, Kadermanager does not publish end times
+EVENT_DURATION = timedelta(hours=2)
+
+# Timed events are kept for one hour after they started
+PAST_EVENT_GRACE = timedelta(hours=1)
+
+PLAYER_ZONES = ("accepted_players", "declined_players", "no_response_players")
+
+# Compact per-zone player ID arrays (unsigned 16 bit)
+PlayerIds = Dict[str, "array[int]"]
+
+
+class TeamRoster:
+    """Table of player names, each interned once under a stable integer ID."""
+
+    __slots__ = ("names", "_ids")
+
+    def __init__(self, names: Iterable[str] = ()) -> None:
+        """Initialize the roster, IDs are the positions in `names`."""
+        self.names: List[str] = []
+        self._ids: Dict[str, int] = {}
+        for name in names:
+            self.intern(name)
+
+    def __len__(self) -> int:
+        """Return the number of known players."""
+        return len(self.names)
+
+    def intern(self, name: str) -> int:
+        """Return the ID of a player, assigning a new one on first sight."""
+        player_id = self._ids.get(name)
+        if player_id is None:
+            player_id = len(self.names)
+            self.names.append(name)
+            self._ids[name] = player_id
+        return player_id
+
+    def lookup(self, name: str) -> Optional[int]:
+        """Return the ID of a known player."""
+        return self._ids.get(name)
+
+    def encode(self, zones: Mapping[str, Iterable[str]]) -> PlayerIds:
+        """Turn per-zone name lists into per-zone ID arrays."""
+        return {
+            zone: array("H", (self.intern(name) for name in zones.get(zone, ())))
+            for zone in PLAYER_ZONES
+        }
+
+    def expand(self, players: PlayerIds) -> Dict[str, List[str]]:
+        """Turn per-zone ID arrays back into name lists for presentation."""
+        names = self.names
+        return {zone: [names[pid] for pid in ids] for zone, ids in players.items()}
+
+
+class KadermanagerEvent:
+    """A single scraped event with its start and end parsed exactly once."""
+
+    __slots__ = (
+        "uid",
+        "title",
+        "link",
+        "location",
+        "type",
+        "date",
+        "time",
+        "original_date",
+        "in_count",
+        "players",
+        "comments",
+        "start",
+        "end",
+        "all_day",
+    )
+
+    def __init__(
+        self,
+        *,
+        title: str,
+        link: str,
+        date: Optional[str],
+        time: Optional[str],
+        original_date: str,
+        location: str = UNKNOWN,
+        type: str = UNKNOWN,
+        in_count: Optional[int] = None,
+        uid: Optional[str] = None,
+        players: Optional[PlayerIds] = None,
+        comments: Optional[List[Dict[str, str]]] = None,
+    ) -> None:
+        """Initialize the event and precompute its aware start/end."""
+        self.uid = uid or link
+        self.title = title
+        self.link = link
+        self.location = location
+        self.type = type
+        self.date = date
+        self.time = time
+        self.original_date = original_date
+        self.in_count = in_count
+        # None means "not fetched/loaded", an empty structure means "none found"
+        self.players = players
+        self.comments = comments
+
+        self.start: Optional[datetime] = None
+        self.end: Optional[datetime] = None
+        self.all_day = True
+        self._parse_times()
+
+    def _parse_times(self) -> None:
+        """Turn the local date/time strings into aware datetimes."""
+        if not self.date or self.date == UNKNOWN:
+            return
+        try:
+            if self.time and self.time != UNKNOWN:
+                naive = datetime.strptime(f"{self.date} {self.time}", "%Y-%m-%d %H:%M")
+                self.start = naive.replace(tzinfo=dt_util.DEFAULT_TIME_ZONE)
+                self.end = self.start + EVENT_DURATION
+                self.all_day = False
+            else:
+                naive = datetime.strptime(self.date, "%Y-%m-%d")
+                self.start = naive.replace(tzinfo=dt_util.DEFAULT_TIME_ZONE)
+                self.end = self.start + timedelta(days=1)
+        except ValueError:
+            self.start = self.end = None
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> KadermanagerEvent:
+        """Create an event from a parser or storage dict.
+
+        Players are never part of these dicts, they are restored from the
+        roster-encoded players section.
+        """
+        return cls(
+            uid=data.get("uid"),
+            title=data.get("title", UNKNOWN),
+            link=data.get("link", ""),
+            location=data.get("location", UNKNOWN),
+            type=data.get("type", UNKNOWN),
+            date=data.get("date"),
+            time=data.get("time"),
+            original_date=data.get("original_date", UNKNOWN),
+            in_count=data.get("in_count"),
+            comments=data.get("comments"),
+        )
+
+    def as_dict(
+        self, roster: Optional[TeamRoster] = None, details: bool = True
+    ) -> Dict[str, Any]:
+        """Return the attribute/storage representation of the event.
+
+        Player IDs are only expanded to names when a roster is given; with
+        `details` disabled players and comments are left out entirely.
+        """
+        data: Dict[str, Any] = {
+            "uid": self.uid,
+            "original_date": self.original_date,
+            "date": self.date,
+            "time": self.time,
+            "in_count": self.in_count,
+            "title": self.title,
+            "link": self.link,
+            "location": self.location,
+            "type": self.type,
+        }
+        if not details:
+            return data
+        if self.players is not None and roster is not None:
+            data["players"] = roster.expand(self.players)
+        if self.comments is not None:
+            data["comments"] = self.comments
+        return data
+
+    def player_zone(self, player_id: int) -> Optional[str]:
+        """Return the zone a player is listed in, if any."""
+        for zone, ids in (self.players or {}).items():
+            if player_id in ids:
+                return zone
+        return None
+
+    @property
+    def start_date(self) -> Optional[date]:
+        """Return the local start date."""
+        return self.start.date() if self.start else None
+
+    @property
+    def sort_key(self) -> datetime:
+        """Return a key that orders events chronologically."""
+        return self.start or datetime.max.replace(tzinfo=dt_util.DEFAULT_TIME_ZONE)
+
+    def is_past(self, now: datetime) -> bool:
+        """Return True once the event is no longer relevant.
+
+        Events without a known time are treated as all-day events and kept
+        for the whole day.
+        """
+        if self.start is None or self.end is None:
+            return False
+        if self.all_day:
+            return self.end + PAST_EVENT_GRACE <= now
+        return self.start + PAST_EVENT_GRACE < now
+
+    def __repr__(self) -> str:
+        """Return a debug representation without player names."""
+        return f"KadermanagerEvent({self.uid!r}, {self.type!r}, {self.start})"
+
+
+class EventIndex:
+    """Upcoming events ordered by start, for the range queries of the calendar.
+
+    Holds references to the coordinator's events, so counts updated in place
+    show up without rebuilding the index.
+    """
+
+    __slots__ = ("_events", "_starts", "_longest")
+
+    def __init__(self, events: Iterable[KadermanagerEvent]) -> None:
+        """Index the events that have a start and an end."""
+        timed = [
+            (e.start, e.end, e)
+            for e in events
+            if e.start is not None and e.end is not None
+        ]
+        timed.sort(key=lambda item: item[0])
+        self._events = [event for _, _, event in timed]
+        self._starts = [start for start, _, _ in timed]
+        # Events starting up to this long before a range can still overlap it
+        self._longest = max(
+            (end - start for start, end, _ in timed), default=timedelta(0)
+        )
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def between(self, start: datetime, end: datetime) -> List[KadermanagerEvent]:
+        """Return the events overlapping the range, in chronological order."""
+        low = bisect_left(self._starts, start - self._longest)
+        high = bisect_left(self._starts, end)
+        return [
+            event
+            for event in self._events[low:high]
+            if event.end is not None and event.end > start
+        ]
@@ -0,0 +1,196 @@
+"""Optional process pool for parsing pages outside the event loop process.
+
+HTML parsing is pure Python and holds the GIL, so several teams refreshing
+at once are parsed one after another no matter how many threads are used.
+With the pool, page bodies are sent to worker processes as UTF-8 bytes and
+compact records come back: player names as one tuple per zone and comments
+as ``(author, text)`` tuples. One pool is shared by all config entries that
+enable it and is shut down when the last of them unloads.
+
+Workers are started with the ``spawn`` method, forking the multi-threaded
+Home Assistant process is not safe. Each worker imports this integration
+once, which is the startup cost the pool has to earn back.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
+
+from homeassistant.core import HomeAssistant
+
+from . import streaming
+from .const import DOMAIN
+from .models import PLAYER_ZONES
+from .parsers import make_soup, parse_event_comments, parse_event_players
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_PARSE_POOL = "parse_pool"
+
+# Leave one core to Home Assistant itself
+PARSE_POOL_WORKERS = max(1, min(4, (os.cpu_count() or 2) - 1))
+
+PlayerRecord = Tuple[Tuple[str, ...], ...]
+CommentRecord = Tuple[Tuple[str, str], ...]
+DetailResult = Tuple[Optional[Dict[str, List[str]]], Optional[List[Dict[str, str]]]]
+
+_LIST_PARSERS: Dict[str, Callable[[str], Any]] = {
+    "widget": streaming.parse_widget_events,
+    "comments": streaming.parse_general_comments,
+    "events": streaming.parse_event_list,
+    "enrollments": streaming.parse_enrollments,
+}
+
+
+def _warm_up() -> int:
+    return os.getpid()
+
+
+def _parse_list(kind: str, body: bytes) -> Any:
+    return _LIST_PARSERS[kind](body.decode())
+
+
+def _parse_detail(
+    body: bytes, backend: str, players: bool, comments: bool
+) -> Tuple[Optional[PlayerRecord], Optional[CommentRecord]]:
+    soup = make_soup(body, backend)
+    player_record = None
+    if players:
+        zones = parse_event_players(soup)
+        player_record = tuple(tuple(zones[zone]) for zone in PLAYER_ZONES)
+    comment_record = None
+    if comments:
+        comment_record = tuple(
+            (comment["author"], comment["text"])
+            for comment in parse_event_comments(soup)
+        )
+    return player_record, comment_record
+
+
+class ParsePool:
+    """Worker processes shared by the config entries that enable them."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        workers: int = PARSE_POOL_WORKERS,
+        initializer: Optional[Callable[[], Any]] = None,
+    ) -> None:
+        self.hass = hass
+        self.workers = workers
+        self.users: Set[str] = set()
+        # Set when the workers could not be started, pages are parsed locally
+        self.failed = False
+        self._initializer = initializer
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def running(self) -> bool:
+        return self._executor is not None
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "workers": self.workers,
+            "running": self.running,
+            "failed": self.failed,
+            "teams": len(self.users),
+        }
+
+    def start(self) -> None:
+        """Start all workers and wait until they are ready (blocking)."""
+        executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=self._initializer,
+        )
+        try:
+            for future in [executor.submit(_warm_up) for _ in range(self.workers)]:
+                future.result()
+        except Exception:
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        self._executor = executor
+
+    async def async_start(self) -> None:
+        """Start the workers in the executor unless they are running."""
+        async with self._lock:
+            if self._executor is not None or self.failed:
+                return
+            try:
+                await self.hass.async_add_executor_job(self.start)
+            except Exception as e:
+                _LOGGER.warning(
+                    "Could not start the parse pool, parsing in-process: %s", e
+                )
+                self.failed = True
+
+    def shutdown(self) -> None:
+        """Stop the workers without waiting for them."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    async def async_run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run `func` in a worker, return None if the pool failed."""
+        await self.async_start()
+        if self._executor is None:
+            return None
+        try:
+            return await asyncio.wrap_future(self._executor.submit(func, *args))
+        except Exception as e:
+            # A crashed worker breaks the whole pool, start a new one next time
+            _LOGGER.warning("Parsing in the process pool failed: %s", e)
+            self.shutdown()
+            return None
+
+    async def async_parse_list(self, kind: str, html: str) -> Any:
+        """Parse a list page with its streaming extractor."""
+        return await self.async_run(_parse_list, kind, html.encode())
+
+    async def async_parse_detail(
+        self, html: Union[str, bytes], backend: str, players: bool, comments: bool
+    ) -> Optional[DetailResult]:
+        """Parse an event detail page, None if the pool failed."""
+        body = html if isinstance(html, bytes) else html.encode()
+        result = await self.async_run(_parse_detail, body, backend, players, comments)
+        if result is None:
+            return None
+        player_record, comment_record = result
+        zones = None
+        if player_record is not None:
+            zones = {
+                zone: list(names) for zone, names in zip(PLAYER_ZONES, player_record)
+            }
+        comment_list = None
+        if comment_record is not None:
+            comment_list = [
+                {"author": author, "text": text} for author, text in comment_record
+            ]
+        return zones, comment_list
+
+
+async def async_acquire_parse_pool(hass: HomeAssistant, entry_id: str) -> ParsePool:
+    """Return the shared pool, starting it for the first entry."""
+    pool: Optional[ParsePool] = hass.data[DOMAIN].get(DATA_PARSE_POOL)
+    if pool is None:
+        pool = hass.data[DOMAIN][DATA_PARSE_POOL] = ParsePool(hass)
+    pool.users.add(entry_id)
+    await pool.async_start()
+    return pool
+
+
+async def async_release_parse_pool(hass: HomeAssistant, entry_id: str) -> None:
+    """Release the pool of an entry, shutting it down after the last one."""
+    pool: Optional[ParsePool] = hass.data.get(DOMAIN, {}).get(DATA_PARSE_POOL)
+    if pool is None or entry_id not in pool.users:
+        return
+    pool.users.discard(entry_id)
+    if not pool.users:
+        hass.data[DOMAIN].pop(DATA_PARSE_POOL)
+        await hass.async_add_executor_job(pool.shutdown)
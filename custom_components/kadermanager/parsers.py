@@ -0,0 +1,80 @@
+"""BeautifulSoup backend selection and the event detail page parsers.
+
+The detail parsers are module functions so they also run in the worker
+processes of the optional parse pool.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Dict, List, Optional, Union
+
+from bs4 import BeautifulSoup
+from bs4.builder import builder_registry
+
+# Fastest first, html.parser ships with Python and is always available
+PARSER_BACKENDS = ("lxml", "html.parser")
+
+
+def available_backends() -> List[str]:
+    """Return the installed backends, fastest first."""
+    return [
+        name for name in PARSER_BACKENDS if builder_registry.lookup(name) is not None
+    ]
+
+
+@lru_cache(maxsize=1)
+def default_backend() -> str:
+    """Return the fastest installed backend."""
+    return available_backends()[0]
+
+
+def make_soup(
+    markup: Union[str, bytes], backend: Optional[str] = None
+) -> BeautifulSoup:
+    """Parse `markup` with `backend`, by default the fastest installed one.
+
+    Bytes must be UTF-8 (see `reader.read_body`), they are passed on without
+    encoding detection.
+    """
+    backend = backend or default_backend()
+    if isinstance(markup, bytes):
+        return BeautifulSoup(markup, backend, from_encoding="utf-8")
+    return BeautifulSoup(markup, backend)
+
+
+def parse_event_players(soup: BeautifulSoup) -> Dict[str, List[str]]:
+    """Parse player list from event page."""
+    player_types: Dict[str, List[str]] = {
+        "accepted_players": [],
+        "declined_players": [],
+        "no_response_players": [],
+    }
+    drop_zones = soup.find_all("div", class_="drop-zone")
+    for zone in drop_zones:
+        zone_id = zone.get("id")
+        players = [
+            label.text.strip() for label in zone.find_all("span", class_="player_label")
+        ]
+        if zone_id == "zone_1":
+            player_types["accepted_players"] = players
+        elif zone_id == "zone_2":
+            player_types["declined_players"] = players
+        elif zone_id == "zone_3":
+            player_types["no_response_players"] = players
+    return player_types
+
+
+def parse_event_comments(soup: BeautifulSoup) -> List[Dict[str, str]]:
+    """Parse comments from event page."""
+    comments: List[Dict[str, str]] = []
+    comment_divs = soup.find_all("div", class_="message")
+    for comment_div in reversed(comment_divs):
+        if len(comments) >= 5:
+            break
+        author_elem = comment_div.find("h5")
+        text_elem = comment_div.find("p")
+        if author_elem and text_elem:
+            author = author_elem.text.strip().split("\n")[0].strip()
+            comments.append({"author": author, "text": text_elem.text.strip()})
+    return comments
@@ -0,0 +1,387 @@
+"""Request pipeline every HTTP request of the integration goes through.
+
+A request is passed through a chain of stages, each an async callable that
+gets the request and the next handler, like aiohttp's server middlewares.
+The innermost handler sends it with the current session and reads the body
+with `read_body`. The coordinator builds its chain from the options, the
+config flow uses a shorter one, so timing, status handling and login are the
+same for every endpoint.
+
+Stages, outermost first, as the coordinator orders them:
+
+- `RequestBudget` refuses requests above the budget of a refresh
+- `TimingStage` collects the request durations per endpoint
+- `ClassifyStage` turns error statuses and connection errors into exceptions
+- `ConditionalCache` revalidates bodies with ``ETag``/``Last-Modified``
+- `AuthStage` detects expired sessions (redirects to the login page)
+- `MetricsStage` feeds the traffic counters
+- `CaptureStage` keeps the raw responses for debugging
+
+Cassette recording and replay stay below the pipeline: they replace the
+session the innermost handler uses.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from functools import partial
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+)
+
+import aiohttp
+from homeassistant.helpers.update_coordinator import UpdateFailed
+
+from .reader import decode_body, read_body
+from .responses import ResponseCapture
+from .traffic import TrafficCounters, endpoint_for
+
+_LOGGER = logging.getLogger(__name__)
+
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=30)
+
+# Requests of a refresh besides the event details: login (2), iCal, both
+# widgets, events and home page, and a re-login with one retry (3)
+REQUEST_BUDGET_BASE = 10
+
+# Bodies kept for conditional requests
+CONDITIONAL_CACHE_BYTES = 2_000_000
+
+# Kinds of failures, they decide how long the coordinator backs off
+RETRY_BLOCKED = "blocked"
+RETRY_CONNECTION = "connection"
+
+
+class CannotConnect(Exception):
+    """Error to indicate we cannot connect."""
+
+
+class InvalidAuth(Exception):
+    """Error to indicate there is invalid auth."""
+
+
+class SessionExpired(Exception):
+    """Error to indicate a request was redirected to the login page."""
+
+
+class RequestBudgetExceeded(Exception):
+    """Error to indicate a refresh sent more requests than it may."""
+
+
+@dataclass
+class Request:
+    """A request passed down the pipeline."""
+
+    method: str
+    url: str
+    data: Optional[Dict[str, Any]] = None
+    headers: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def endpoint(self) -> str:
+        return endpoint_for(self.url)
+
+
+@dataclass
+class Response:
+    """A response with its body read, passed back up the pipeline."""
+
+    url: str
+    status: int
+    body: bytes
+    headers: Mapping[str, str]
+    content_length: Optional[int] = None
+    request_info: Any = None
+    history: tuple = ()
+    # Set when the body came from the conditional cache
+    from_cache: bool = False
+
+    @property
+    def text(self) -> str:
+        return decode_body(self.body)
+
+    def raise_for_status(self) -> None:
+        if self.status >= 400:
+            raise aiohttp.ClientResponseError(
+                self.request_info, self.history, status=self.status
+            )
+
+
+Handler = Callable[[Request], Awaitable[Response]]
+Stage = Callable[[Request, Handler], Awaitable[Response]]
+
+
+def classify_error(err: BaseException) -> Optional[str]:
+    """Return whether a failed refresh was blocked, lost its connection or neither."""
+    if getattr(err, "status", None) in (403, 429):
+        return RETRY_BLOCKED
+    if (
+        isinstance(err, (aiohttp.ClientConnectorError, CannotConnect))
+        or "ClientConnectorError" in str(type(err))
+        or (
+            isinstance(err, UpdateFailed)
+            and (
+                "Connect call failed" in str(err)
+                or "Failed to fetch events page" in str(err)
+            )
+        )
+    ):
+        return RETRY_CONNECTION
+    return None
+
+
+class RequestBudget:
+    """Refuse requests once a refresh used up its budget."""
+
+    name = "budget"
+
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+        self.used = 0
+
+    def reset(self) -> None:
+        """Start the budget of a new refresh."""
+        self.used = 0
+
+    async def __call__(self, request: Request, handler: Handler) -> Response:
+        if self.used >= self.limit:
+            raise RequestBudgetExceeded(
+                f"{self.limit} requests per refresh used, not fetching {request.url}"
+            )
+        self.used += 1
+        return await handler(request)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {"limit": self.limit, "used": self.used}
+
+
+class TimingStage:
+    """Count requests and their durations per endpoint."""
+
+    name = "timing"
+
+    def __init__(self) -> None:
+        self.stats: Dict[str, List[float]] = {}
+
+    async def __call__(self, request: Request, handler: Handler) -> Response:
+        started = time.perf_counter()
+        try:
+            return await handler(request)
+        finally:
+            elapsed = time.perf_counter() - started
+            # count, total and maximum seconds
+            stats = self.stats.setdefault(request.endpoint, [0, 0.0, 0.0])
+            stats[0] += 1
+            stats[1] += elapsed
+            stats[2] = max(stats[2], elapsed)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            endpoint: {
+                "count": int(count),
+                "mean_ms": round(total / count * 1000, 1),
+                "max_ms": round(longest * 1000, 1),
+            }
+            for endpoint, (count, total, longest) in self.stats.items()
+        }
+
+
+class ClassifyStage:
+    """Raise for error statuses and connection failures.
+
+    Rate limits and forbidden responses are logged as the signs of a block
+    they usually are; `classify_error` decides how long to back off.
+    """
+
+    name = "classify"
+
+    async def __call__(self, request: Request, handler: Handler) -> Response:
+        try:
+            resp = await handler(request)
+        except aiohttp.ClientConnectorError as e:
+            _LOGGER.error(
+                "Connection error fetching %s: %s - possibly softbanned",
+                request.url,
+                e,
+            )
+            raise CannotConnect(f"Connection failed: {e}") from e
+        if resp.status == 429:
+            _LOGGER.error("Rate limit hit (429) for %s", request.url)
+        elif resp.status == 403:
+            _LOGGER.error(
+                "Access forbidden (403) for %s - possibly bot detection or IP ban",
+                request.url,
+            )
+        resp.raise_for_status()
+        return resp
+
+
+class ConditionalCache:
+    """Revalidate GET responses instead of downloading unchanged bodies.
+
+    Bodies are kept per URL with their validators, least recently used ones
+    are dropped beyond `max_bytes`. A ``304`` is answered with the kept body.
+    """
+
+    name = "conditional_cache"
+
+    def __init__(self, max_bytes: int = CONDITIONAL_CACHE_BYTES) -> None:
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = 0
+        self._entries: OrderedDict[str, tuple[Dict[str, str], bytes]] = OrderedDict()
+
+    async def __call__(self, request: Request, handler: Handler) -> Response:
+        if request.method != "GET":
+            return await handler(request)
+        entry = self._entries.get(request.url)
+        if entry is not None:
+            request.headers.update(entry[0])
+        resp = await handler(request)
+        if resp.status == 304 and entry is not None:
+            self.hits += 1
+            self._entries.move_to_end(request.url)
+            resp.status = 200
+            resp.body = entry[1]
+            resp.from_cache = True
+            return resp
+        if resp.status == 200:
+            self._store(request.url, resp)
+        return resp
+
+    def _store(self, url: str, resp: Response) -> None:
+        validators = {}
+        if "ETag" in resp.headers:
+            validators["If-None-Match"] = resp.headers["ETag"]
+        if "Last-Modified" in resp.headers:
+            validators["If-Modified-Since"] = resp.headers["Last-Modified"]
+        old = self._entries.pop(url, None)
+        if old is not None:
+            self.size -= len(old[1])
+        if not validators or len(resp.body) > self.max_bytes:
+            return
+        self._entries[url] = (validators, resp.body)
+        self.size += len(resp.body)
+        while self.size > self.max_bytes:
+            _, (_, body) = self._entries.popitem(last=False)
+            self.size -= len(body)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {"entries": len(self._entries), "bytes": self.size, "hits": self.hits}
+
+
+class AuthStage:
+    """Raise `SessionExpired` when a page redirects to the login page."""
+
+    name = "auth"
+
+    async def __call__(self, request: Request, handler: Handler) -> Response:
+        resp = await handler(request)
+        if "sessions/new" in resp.url and "sessions/new" not in request.url:
+            raise SessionExpired(f"{request.url} redirected to the login page")
+        return resp
+
+
+class MetricsStage:
+    """Feed every request and body into the traffic counters."""
+
+    name = "metrics"
+
+    def __init__(self, traffic: TrafficCounters) -> None:
+        self.traffic = traffic
+
+    async def __call__(self, request: Request, handler: Handler) -> Response:
+        resp = await handler(request)
+        self.traffic.record_request(request.url, resp.status)
+        if resp.status != 304:
+            self.traffic.record_body(request.url, resp.body, resp.content_length)
+        return resp
+
+
+class CaptureStage:
+    """Keep the raw responses for parser debugging."""
+
+    name = "capture"
+
+    def __init__(self, capture: ResponseCapture) -> None:
+        self.capture = capture
+
+    async def __call__(self, request: Request, handler: Handler) -> Response:
+        resp = await handler(request)
+        if resp.status != 304:
+            self.capture.capture(request.url, resp.status, resp.text)
+        return resp
+
+
+class Pipeline:
+    """Send requests with the current session through a chain of stages."""
+
+    def __init__(
+        self,
+        session: Callable[[], Any],
+        stages: Sequence[Stage],
+        max_bytes: int,
+    ) -> None:
+        self._session = session
+        self.stages = list(stages)
+        self.max_bytes = max_bytes
+        handler: Handler = self._send
+        for stage in reversed(self.stages):
+            handler = partial(stage, handler=handler)
+        self._handler = handler
+
+    def stage(self, name: str) -> Any:
+        """Return the stage called `name`, None if it is not in the chain."""
+        return next(
+            (stage for stage in self.stages if getattr(stage, "name", None) == name),
+            None,
+        )
+
+    async def async_request(
+        self,
+        method: str,
+        url: str,
+        data: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Response:
+        """Send a request through all stages and return the read response."""
+        return await self._handler(Request(method, url, data, dict(headers or {})))
+
+    async def _send(self, request: Request) -> Response:
+        session = self._session()
+        assert session is not None
+        kwargs: Dict[str, Any] = {"timeout": REQUEST_TIMEOUT}
+        if request.headers:
+            kwargs["headers"] = request.headers
+        if request.method == "POST":
+            ctx = session.post(request.url, data=request.data, **kwargs)
+        else:
+            ctx = session.get(request.url, **kwargs)
+        async with ctx as resp:
+            body = b"" if resp.status == 304 else await read_body(resp, self.max_bytes)
+            return Response(
+                url=str(resp.url),
+                status=resp.status,
+                body=body,
+                headers=resp.headers,
+                content_length=resp.content_length,
+                request_info=resp.request_info,
+                history=resp.history,
+            )
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            stage.name: stage.as_dict()
+            for stage in self.stages
+            if hasattr(stage, "as_dict")
+        }
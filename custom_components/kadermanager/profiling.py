@@ -0,0 +1,175 @@
+"""Profile a single refresh on demand."""
+
+from __future__ import annotations
+
+import cProfile
+import importlib.util
+import logging
+import os
+import pstats
+import time
+import tracemalloc
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
+
+from homeassistant.util import dt as dt_util
+
+from .const import DEFAULT_PROFILE_TOP
+
+if TYPE_CHECKING:
+    from .coordinator import KadermanagerDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _short_path(path: str) -> str:
+    """Strip installation prefixes so only package-relative paths remain."""
+    for marker in ("site-packages" + os.sep, "custom_components" + os.sep):
+        if marker in path:
+            return path.split(marker, 1)[1]
+    return os.path.basename(path)
+
+
+def _cprofile_stats(profiler: cProfile.Profile, top: int) -> List[Dict[str, Any]]:
+    stats = pstats.Stats(profiler)
+    rows: List[Tuple[float, Dict[str, Any]]] = []
+    # Only code locations and counters are kept, never arguments or values,
+    # so nothing scraped (player names, comments) can end up in the output
+    entries = stats.stats.items()  # type: ignore[attr-defined]
+    for (path, line, func), (_, calls, tottime, cumtime, _) in entries:
+        rows.append(
+            (
+                cumtime,
+                {
+                    "location": f"{_short_path(path)}:{line}({func})",
+                    "calls": calls,
+                    "own_ms": round(tottime * 1000, 2),
+                    "cumulative_ms": round(cumtime * 1000, 2),
+                },
+            )
+        )
+    rows.sort(key=lambda row: row[0], reverse=True)
+    return [row for _, row in rows[:top]]
+
+
+def _pyinstrument_stats(session: Any, top: int) -> List[Dict[str, Any]]:
+    totals: Dict[str, Dict[str, Any]] = {}
+
+    def walk(frame: Any, active: frozenset) -> None:
+        location = (
+            f"{_short_path(frame.file_path or '')}:{frame.line_no}({frame.function})"
+        )
+        row = totals.setdefault(
+            location,
+            {"location": location, "calls": 0, "own_ms": 0.0, "cumulative_ms": 0.0},
+        )
+        row["calls"] += 1
+        row["own_ms"] += frame.total_self_time * 1000
+        # Recursive frames are only counted once towards the cumulative time
+        if location not in active:
+            row["cumulative_ms"] += frame.time * 1000
+        for child in frame.children:
+            walk(child, active | {location})
+
+    root = session.root_frame()
+    if root is not None:
+        walk(root, frozenset())
+    rows = sorted(totals.values(), key=lambda row: row["cumulative_ms"], reverse=True)
+    for row in rows:
+        row["own_ms"] = round(row["own_ms"], 2)
+        row["cumulative_ms"] = round(row["cumulative_ms"], 2)
+    return rows[:top]
+
+
+async def async_profile_refresh(
+    coordinator: KadermanagerDataUpdateCoordinator, top: int = DEFAULT_PROFILE_TOP
+) -> Dict[str, Any]:
+    """Run one forced refresh under a profiler and return the top entries.
+
+    pyinstrument (a sampling profiler) is used when it is installed,
+    otherwise cProfile. Both observe the whole event loop thread, so work of
+    other integrations running at the same time shows up as well.
+    """
+    coordinator._force_update = True
+    started = time.perf_counter()
+
+    profiler_name = "cprofile"
+    stats: List[Dict[str, Any]]
+    if importlib.util.find_spec("pyinstrument") is not None:
+        from pyinstrument import Profiler  # pylint: disable=import-outside-toplevel
+
+        profiler_name = "pyinstrument"
+        sampler = Profiler(async_mode="disabled")
+        sampler.start()
+        try:
+            await coordinator.async_refresh()
+        finally:
+            session = sampler.stop()
+        stats = _pyinstrument_stats(session, top)
+    else:
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            await coordinator.async_refresh()
+        finally:
+            profiler.disable()
+        stats = _cprofile_stats(profiler, top)
+
+    profile = {
+        "profiler": profiler_name,
+        "captured_at": dt_util.now().isoformat(),
+        "duration_s": round(time.perf_counter() - started, 3),
+        "refresh_succeeded": coordinator.last_update_success,
+        "top": stats,
+    }
+    _LOGGER.info(
+        "Profiled refresh of %s in %.1f s, the result is part of the next "
+        "diagnostics download",
+        coordinator.teamname,
+        profile["duration_s"],
+    )
+    return profile
+
+
+async def async_trace_refresh_memory(
+    coordinator: KadermanagerDataUpdateCoordinator, top: int = DEFAULT_PROFILE_TOP
+) -> Dict[str, Any]:
+    """Run one forced refresh under tracemalloc and return the retained growth.
+
+    The result lists the code locations whose allocations are still alive
+    after the refresh, i.e. what the refresh added to the memory footprint.
+    """
+    coordinator._force_update = True
+    started_tracing = not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        await coordinator.async_refresh()
+        after = tracemalloc.take_snapshot()
+    finally:
+        if started_tracing:
+            tracemalloc.stop()
+
+    ignore = (
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+    )
+    diff = after.filter_traces(ignore).compare_to(
+        before.filter_traces(ignore), "lineno"
+    )
+    return {
+        "captured_at": dt_util.now().isoformat(),
+        "refresh_succeeded": coordinator.last_update_success,
+        "retained_kib": round(sum(stat.size_diff for stat in diff) / 1024, 1),
+        "top": [
+            {
+                "location": (
+                    f"{_short_path(stat.traceback[0].filename)}"
+                    f":{stat.traceback[0].lineno}"
+                ),
+                "size_diff_kib": round(stat.size_diff / 1024, 1),
+                "count_diff": stat.count_diff,
+            }
+            for stat in diff[:top]
+        ],
+    }
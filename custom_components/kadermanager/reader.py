@@ -0,0 +1,61 @@
+"""Bounded reading of response bodies.
+
+`aiohttp.ClientResponse.text()` buffers the whole body without a limit and,
+when the server declares no charset, runs charset detection over it. Pages
+are read here chunk by chunk instead, aborting once a maximum size is
+exceeded, and normalised to UTF-8 bytes: Kadermanager serves UTF-8, so the
+declared charset is trusted and no detection runs. The same bytes object is
+handed to the traffic counters and to the parsers.
+"""
+
+from __future__ import annotations
+
+from typing import Any, List, Optional
+
+CHUNK_SIZE = 65536
+
+DEFAULT_MAX_RESPONSE_MB = 5
+
+_UTF8 = ("utf-8", "utf8")
+
+
+class ResponseTooLarge(Exception):
+    """Error to indicate a response exceeded the maximum size."""
+
+
+async def read_body(resp: Any, max_bytes: int) -> bytes:
+    """Read the body of `resp` as UTF-8 bytes, at most `max_bytes` of them."""
+    if resp.content_length is not None and resp.content_length > max_bytes:
+        raise ResponseTooLarge(
+            f"Content-Length {resp.content_length} exceeds {max_bytes} bytes"
+        )
+    chunks: List[bytes] = []
+    size = 0
+    async for chunk in resp.content.iter_chunked(CHUNK_SIZE):
+        size += len(chunk)
+        if size > max_bytes:
+            raise ResponseTooLarge(f"Body exceeds {max_bytes} bytes")
+        chunks.append(chunk)
+    # Joining a single chunk returns it without a copy
+    body = b"".join(chunks)
+    charset = getattr(resp, "charset", None)
+    if charset and charset.lower() not in _UTF8:
+        body = _transcode(body, charset)
+    return body
+
+
+def _transcode(body: bytes, charset: str) -> bytes:
+    try:
+        return body.decode(charset, errors="replace").encode()
+    except LookupError:
+        return body
+
+
+def decode_body(body: bytes) -> str:
+    """Decode a body returned by `read_body`."""
+    return body.decode("utf-8", errors="replace")
+
+
+def max_response_bytes(megabytes: Optional[int]) -> int:
+    """Return the size limit in bytes for the configured megabytes."""
+    return (megabytes or DEFAULT_MAX_RESPONSE_MB) * 1024 * 1024
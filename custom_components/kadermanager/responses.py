@@ -0,0 +1,97 @@
+"""Optional capture of raw responses for parser debugging."""
+
+from __future__ import annotations
+
+import zlib
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, List, Optional
+
+from homeassistant.util import dt as dt_util
+
+from .cassette import Redactor
+from .traffic import endpoint_for
+
+# Responses kept per endpoint type and the cap on all compressed bodies
+RESPONSES_PER_ENDPOINT = 3
+RESPONSES_MAX_BYTES = 1_000_000
+
+
+class ResponseCapture:
+    """Ring buffer of the last raw responses, zlib-compressed and redacted.
+
+    Bodies are redacted before they are stored: configured credentials,
+    e-mail addresses and CSRF tokens are removed and player and comment
+    author names are replaced by stable pseudonyms, so the HTML structure
+    the parsers see is kept. The oldest responses are dropped once an
+    endpoint has `per_endpoint` entries or all bodies together exceed
+    `max_bytes` compressed.
+    """
+
+    def __init__(
+        self,
+        secrets: Iterable[Optional[str]] = (),
+        per_endpoint: int = RESPONSES_PER_ENDPOINT,
+        max_bytes: int = RESPONSES_MAX_BYTES,
+    ) -> None:
+        self.per_endpoint = per_endpoint
+        self.max_bytes = max_bytes
+        self._redactor = Redactor(secrets)
+        self._entries: Deque[Dict[str, Any]] = deque()
+        self._bytes = 0
+
+    @property
+    def size(self) -> int:
+        """Compressed bytes currently held."""
+        return self._bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def redact(self, body: str) -> str:
+        """Return `body` without credentials, tokens and names."""
+        return self._redactor.body(body)
+
+    def capture(self, url: str, status: int, body: str) -> None:
+        """Store one response, evicting the oldest ones beyond the limits."""
+        compressed = zlib.compress(self.redact(body).encode())
+        if len(compressed) > self.max_bytes:
+            return
+        endpoint = endpoint_for(url)
+        same_endpoint = [e for e in self._entries if e["endpoint"] == endpoint]
+        excess = len(same_endpoint) - self.per_endpoint + 1
+        for entry in same_endpoint[: max(0, excess)]:
+            self._remove(entry)
+
+        self._entries.append(
+            {
+                "endpoint": endpoint,
+                "url": self._redactor.text(url),
+                "status": status,
+                "captured_at": dt_util.now().isoformat(),
+                "size": len(body),
+                "body": compressed,
+            }
+        )
+        self._bytes += len(compressed)
+        while self._bytes > self.max_bytes:
+            self._remove(self._entries[0])
+
+    def _remove(self, entry: Dict[str, Any]) -> None:
+        self._entries.remove(entry)
+        self._bytes -= len(entry["body"])
+
+    def as_dict(self, include_bodies: bool = False) -> Dict[str, Any]:
+        """Return the captured responses, decompressing bodies on request."""
+        responses: List[Dict[str, Any]] = []
+        for entry in self._entries:
+            item = {k: v for k, v in entry.items() if k != "body"}
+            item["compressed_size"] = len(entry["body"])
+            if include_bodies:
+                item["body"] = zlib.decompress(entry["body"]).decode()
+            responses.append(item)
+        return {
+            "count": len(self._entries),
+            "compressed_bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "responses": responses,
+        }
@@ -2,17 +2,44 @@ import logging
 from typing import Optional, cast
 
 from homeassistant import config_entries
-from homeassistant.components.sensor import SensorEntity
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorStateClass,
+)
+from homeassistant.const import EntityCategory, UnitOfTime
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN, CONF_TEAM_NAME
 from .coordinator import KadermanagerDataUpdateCoordinator
+from .demand import ALL_FIELDS, FIELD_EVENTS, FIELD_IN_COUNT, FIELD_PLAYERS
+from .instrumentation import PHASES
+from .statistics import AttendanceStatistics
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def event_attributes(coordinator: KadermanagerDataUpdateCoordinator) -> dict:
+    """Return the state attributes of the main sensor."""
+    data = coordinator.data or {}
+    attrs = {
+        "events": [
+            event.as_dict(coordinator.roster) for event in data.get("events", [])
+        ],
+        "last_updated": (
+            coordinator.last_success.isoformat() if coordinator.last_success else None
+        ),
+    }
+    if "general_comments" in data:
+        attrs["comments"] = data["general_comments"]
+    elif "comments" not in attrs:
+        attrs["comments"] = []
+
+    return attrs
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: config_entries.ConfigEntry,
@@ -20,7 +47,18 @@ async def async_setup_entry(
 ):
     """Setup sensors from a config entry created in the integrations UI."""
     coordinator: KadermanagerDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
-    async_add_entities([KadermanagerSensor(coordinator, entry)])
+    entities: list[SensorEntity] = [KadermanagerSensor(coordinator, entry)]
+    if coordinator.loop_lag is not None:
+        entities.append(KadermanagerLoopLagSensor(coordinator, entry))
+    entities.append(KadermanagerTrafficSensor(coordinator, entry))
+    entities.extend(
+        KadermanagerAttendanceSensor(coordinator, entry, window)
+        for window in coordinator.statistics.windows
+    )
+    entities.extend(
+        KadermanagerRefreshPhaseSensor(coordinator, entry, phase) for phase in PHASES
+    )
+    async_add_entities(entities)
 
 
 class KadermanagerSensor(CoordinatorEntity, SensorEntity):
@@ -36,6 +74,14 @@ class KadermanagerSensor(CoordinatorEntity, SensorEntity):
         self._name = f"Kadermanager {self.teamname}"
         self._entry_id = entry.entry_id
 
+    async def async_added_to_hass(self) -> None:
+        """Load the cached players and comments once the sensor is shown."""
+        await super().async_added_to_hass()
+        coordinator = cast(KadermanagerDataUpdateCoordinator, self.coordinator)
+        # The attributes show everything that is fetched
+        self.async_on_remove(coordinator.demand.register(self.unique_id, ALL_FIELDS))
+        coordinator.async_request_sections()
+
     @property
     def name(self):
         return self._name
@@ -62,28 +108,13 @@ class KadermanagerSensor(CoordinatorEntity, SensorEntity):
         if not events:
             return "No events found"
 
-        return events[0]["original_date"]
+        return events[0].original_date
 
     @property
     def extra_state_attributes(self):
-        coordinator: KadermanagerDataUpdateCoordinator = cast(
-            KadermanagerDataUpdateCoordinator, self.coordinator
+        return event_attributes(
+            cast(KadermanagerDataUpdateCoordinator, self.coordinator)
         )
-        data = coordinator.data or {}
-        attrs = {
-            "events": data.get("events", []),
-            "last_updated": (
-                coordinator.last_success.isoformat()
-                if coordinator.last_success
-                else None
-            ),
-        }
-        if "general_comments" in data:
-            attrs["comments"] = data["general_comments"]
-        elif "comments" not in attrs:
-            attrs["comments"] = []
-
-        return attrs
 
     @property
     def available(self) -> bool:
@@ -105,3 +136,175 @@ class KadermanagerSensor(CoordinatorEntity, SensorEntity):
             "model": "Team Schedule",
             "configuration_url": f"https://{self.teamname.lower()}.kadermanager.de",
         }
+
+
+class KadermanagerLoopLagSensor(CoordinatorEntity, SensorEntity):
+    """Longest event-loop block of the last refresh."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_icon = "mdi:timer-sand"
+
+    def __init__(
+        self,
+        coordinator: KadermanagerDataUpdateCoordinator,
+        entry: config_entries.ConfigEntry,
+    ):
+        super().__init__(coordinator)
+        self.teamname = entry.data[CONF_TEAM_NAME]
+        self._attr_name = f"Kadermanager {self.teamname} loop lag"
+        self._attr_unique_id = f"{entry.entry_id}_loop_lag"
+
+    @property
+    def native_value(self) -> Optional[float]:
+        monitor = cast(KadermanagerDataUpdateCoordinator, self.coordinator).loop_lag
+        if monitor is None or monitor.last is None:
+            return None
+        return monitor.last["max_ms"]
+
+    @property
+    def extra_state_attributes(self):
+        monitor = cast(KadermanagerDataUpdateCoordinator, self.coordinator).loop_lag
+        last = (monitor.last if monitor else None) or {}
+        worst = (monitor.worst if monitor else None) or {}
+        return {
+            "p95_ms": last.get("p95_ms"),
+            "worst_stage": last.get("worst_stage"),
+            "stages_ms": last.get("stages_ms"),
+            "measured_at": last.get("measured_at"),
+            "worst_max_ms": worst.get("max_ms"),
+            "worst_max_stage": worst.get("worst_stage"),
+        }
+
+    @property
+    def device_info(self):
+        """Return device information about this entity."""
+        return {"identifiers": {(DOMAIN, self.teamname)}}
+
+
+class KadermanagerTrafficSensor(CoordinatorEntity, SensorEntity):
+    """Requests sent to Kadermanager today, with the daily traffic counters."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_state_class = SensorStateClass.TOTAL
+    _attr_native_unit_of_measurement = "requests"
+    _attr_icon = "mdi:swap-vertical"
+
+    def __init__(
+        self,
+        coordinator: KadermanagerDataUpdateCoordinator,
+        entry: config_entries.ConfigEntry,
+    ):
+        super().__init__(coordinator)
+        self.teamname = entry.data[CONF_TEAM_NAME]
+        self._attr_name = f"Kadermanager {self.teamname} requests today"
+        self._attr_unique_id = f"{entry.entry_id}_requests_today"
+
+    @property
+    def native_value(self) -> int:
+        traffic = cast(KadermanagerDataUpdateCoordinator, self.coordinator).traffic
+        return sum(traffic.today["requests"].values())
+
+    @property
+    def extra_state_attributes(self):
+        return cast(KadermanagerDataUpdateCoordinator, self.coordinator).traffic.today
+
+    @property
+    def device_info(self):
+        """Return device information about this entity."""
+        return {"identifiers": {(DOMAIN, self.teamname)}}
+
+
+class KadermanagerRefreshPhaseSensor(CoordinatorEntity, SensorEntity):
+    """Duration of one refresh phase, disabled unless enabled by the user."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = UnitOfTime.SECONDS
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_icon = "mdi:timer-outline"
+
+    def __init__(
+        self,
+        coordinator: KadermanagerDataUpdateCoordinator,
+        entry: config_entries.ConfigEntry,
+        phase: str,
+    ):
+        super().__init__(coordinator)
+        self.teamname = entry.data[CONF_TEAM_NAME]
+        self.phase = phase
+        self._attr_name = f"Kadermanager {self.teamname} refresh {phase}"
+        self._attr_unique_id = f"{entry.entry_id}_refresh_{phase}"
+
+    @property
+    def native_value(self) -> Optional[float]:
+        last = cast(KadermanagerDataUpdateCoordinator, self.coordinator).timings.last
+        return last[self.phase] if last else None
+
+    @property
+    def extra_state_attributes(self):
+        timings = cast(KadermanagerDataUpdateCoordinator, self.coordinator).timings
+        return {
+            "refreshes": timings.refreshes,
+            **(timings.percentiles(self.phase) or {}),
+        }
+
+    @property
+    def device_info(self):
+        """Return device information about this entity."""
+        return {"identifiers": {(DOMAIN, self.teamname)}}
+
+
+class KadermanagerAttendanceSensor(CoordinatorEntity, SensorEntity):
+    """Average turnout of the events that passed within a rolling window."""
+
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = "players"
+    _attr_icon = "mdi:account-group"
+
+    def __init__(
+        self,
+        coordinator: KadermanagerDataUpdateCoordinator,
+        entry: config_entries.ConfigEntry,
+        window: int,
+    ):
+        super().__init__(coordinator)
+        self.teamname = entry.data[CONF_TEAM_NAME]
+        self.window = window
+        self._attr_name = f"Kadermanager {self.teamname} attendance {window} days"
+        self._attr_unique_id = f"{entry.entry_id}_attendance_{window}d"
+
+    async def async_added_to_hass(self) -> None:
+        """Declare the enrollment counts and players the statistics count."""
+        await super().async_added_to_hass()
+        coordinator = cast(KadermanagerDataUpdateCoordinator, self.coordinator)
+        self.async_on_remove(
+            coordinator.demand.register(
+                self._attr_unique_id, (FIELD_EVENTS, FIELD_IN_COUNT, FIELD_PLAYERS)
+            )
+        )
+
+    @property
+    def _statistics(self) -> AttendanceStatistics:
+        return cast(KadermanagerDataUpdateCoordinator, self.coordinator).statistics
+
+    @property
+    def native_value(self) -> Optional[float]:
+        return self._statistics.turnout(self.window)["average"]
+
+    @property
+    def extra_state_attributes(self):
+        statistics = self._statistics
+        turnout = statistics.turnout(self.window)
+        return {
+            "events": turnout["events"],
+            "by_type": turnout["by_type"],
+            "players": statistics.attendance(self.window),
+        }
+
+    @property
+    def device_info(self):
+        """Return device information about this entity."""
+        return {"identifiers": {(DOMAIN, self.teamname)}}
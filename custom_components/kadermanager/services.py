@@ -0,0 +1,119 @@
+"""Services of the Kadermanager integration."""
+
+from __future__ import annotations
+
+import voluptuous as vol
+
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+)
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.service import async_register_admin_service
+
+from .const import (
+    ATTR_CONFIG_ENTRY_ID,
+    ATTR_PLAYER,
+    ATTR_TOP,
+    ATTR_TRACE_MEMORY,
+    DEFAULT_PROFILE_TOP,
+    DOMAIN,
+    SERVICE_GET_EVENTS,
+    SERVICE_PROFILE_REFRESH,
+)
+
+PROFILE_REFRESH_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_TOP, default=DEFAULT_PROFILE_TOP): vol.All(
+            vol.Coerce(int), vol.Range(min=5, max=200)
+        ),
+        vol.Optional(ATTR_TRACE_MEMORY, default=False): cv.boolean,
+    }
+)
+
+GET_EVENTS_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_PLAYER): cv.string,
+    }
+)
+
+
+def _coordinator(hass: HomeAssistant, entry_id: str):
+    coordinator = hass.data.get(DOMAIN, {}).get(entry_id)
+    if coordinator is None:
+        raise ServiceValidationError(f"No loaded Kadermanager entry {entry_id}")
+    return coordinator
+
+
+async def _async_profile_refresh(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Profile one forced refresh and keep the result for diagnostics."""
+    # Imported on use so profiling adds nothing while the service is idle
+    from .profiling import async_profile_refresh, async_trace_refresh_memory
+
+    coordinator = _coordinator(hass, call.data[ATTR_CONFIG_ENTRY_ID])
+    if call.data[ATTR_TRACE_MEMORY]:
+        coordinator.last_memory_trace = await async_trace_refresh_memory(
+            coordinator, call.data[ATTR_TOP]
+        )
+    else:
+        coordinator.last_profile = await async_profile_refresh(
+            coordinator, call.data[ATTR_TOP]
+        )
+
+
+def _get_events(hass: HomeAssistant, call: ServiceCall) -> ServiceResponse:
+    """Return the cached upcoming events, no request is made.
+
+    Events beyond the event limit only have their enrollment counts. With a
+    player only the events within the limit can match, as only those have
+    player lists.
+    """
+    coordinator = _coordinator(hass, call.data[ATTR_CONFIG_ENTRY_ID])
+    player = call.data.get(ATTR_PLAYER)
+    if player is None:
+        events = [event.as_dict(details=False) for event in coordinator.season_events()]
+    else:
+        events = [
+            {**event.as_dict(details=False), "zone": zone}
+            for event, zone in coordinator.events_for_player(player)
+        ]
+    return {"events": events}
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration services once."""
+    if hass.services.has_service(DOMAIN, SERVICE_PROFILE_REFRESH):
+        return
+
+    async def handle_profile_refresh(call: ServiceCall) -> None:
+        await _async_profile_refresh(hass, call)
+
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_PROFILE_REFRESH,
+        handle_profile_refresh,
+        schema=PROFILE_REFRESH_SCHEMA,
+    )
+
+    def handle_get_events(call: ServiceCall) -> ServiceResponse:
+        return _get_events(hass, call)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_EVENTS,
+        handle_get_events,
+        schema=GET_EVENTS_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+
+def async_unload_services(hass: HomeAssistant) -> None:
+    """Remove the services after the last entry was unloaded."""
+    hass.services.async_remove(DOMAIN, SERVICE_PROFILE_REFRESH)
+    hass.services.async_remove(DOMAIN, SERVICE_GET_EVENTS)
@@ -0,0 +1,248 @@
+"""Rolling attendance statistics, updated as events pass.
+
+An event is added once, when a refresh drops it as passed. Each day with
+events has a bucket: per event type the number of events and the summed
+enrollment counts, per player (by roster ID) how often they were listed on
+an event and how often they accepted. Every window keeps running totals:
+adding an event adds its counts, and once a day falls out of a window its
+bucket is subtracted again. Reading a statistic never walks the history.
+"""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, insort
+from datetime import date
+from typing import Any, Dict, Iterable, List, Optional
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import storage
+
+from .const import DOMAIN
+from .models import PLAYER_ZONES, KadermanagerEvent, TeamRoster
+
+STATISTICS_STORAGE_VERSION = 1
+# Rolling windows in days, the longest one decides how long buckets are kept
+STATISTICS_WINDOWS = (30, 365)
+
+
+def _grow(counts: "array[int]", size: int) -> None:
+    if len(counts) < size:
+        counts.extend(bytes(size - len(counts)))
+
+
+class _Counts:
+    """Counters of one day, or the running totals of a window."""
+
+    __slots__ = ("types", "listed", "accepted")
+
+    def __init__(self) -> None:
+        # Event type -> [events with a count, summed enrollment counts]
+        self.types: Dict[str, "array[int]"] = {}
+        # Indexed by roster ID
+        self.listed: "array[int]" = array("L")
+        self.accepted: "array[int]" = array("L")
+
+    def add_event(self, event: KadermanagerEvent) -> None:
+        if event.in_count is not None:
+            counts = self.types.setdefault(event.type, array("L", (0, 0)))
+            counts[0] += 1
+            counts[1] += event.in_count
+        zones = event.players or {}
+        for zone in PLAYER_ZONES:
+            for player_id in zones.get(zone, ()):
+                _grow(self.listed, player_id + 1)
+                self.listed[player_id] += 1
+                if zone == "accepted_players":
+                    _grow(self.accepted, player_id + 1)
+                    self.accepted[player_id] += 1
+
+    def merge(self, other: _Counts, sign: int = 1) -> None:
+        """Add (or with a negative sign subtract) the counters of another."""
+        for event_type, (events, enrolled) in other.types.items():
+            counts = self.types.setdefault(event_type, array("L", (0, 0)))
+            counts[0] += sign * events
+            counts[1] += sign * enrolled
+            if not counts[0]:
+                del self.types[event_type]
+        pairs = ((self.listed, other.listed), (self.accepted, other.accepted))
+        for mine, theirs in pairs:
+            _grow(mine, len(theirs))
+            for player_id, count in enumerate(theirs):
+                if count:
+                    mine[player_id] += sign * count
+
+    def as_dict(self, roster: TeamRoster) -> Dict[str, Any]:
+        return {
+            "types": {event_type: list(c) for event_type, c in self.types.items()},
+            "listed": _by_name(self.listed, roster),
+            "accepted": _by_name(self.accepted, roster),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], roster: TeamRoster) -> _Counts:
+        counts = cls()
+        counts.types = {
+            event_type: array("L", values)
+            for event_type, values in data.get("types", {}).items()
+        }
+        targets = ((counts.listed, "listed"), (counts.accepted, "accepted"))
+        for target, key in targets:
+            for name, count in data.get(key, {}).items():
+                player_id = roster.intern(name)
+                _grow(target, player_id + 1)
+                target[player_id] += count
+        return counts
+
+
+def _by_name(counts: "array[int]", roster: TeamRoster) -> Dict[str, int]:
+    return {roster.names[pid]: count for pid, count in enumerate(counts) if count}
+
+
+class AttendanceStatistics:
+    """Turnout per event type and attendance per player over rolling windows."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        teamname: str,
+        roster: TeamRoster,
+        windows: Iterable[int] = STATISTICS_WINDOWS,
+    ) -> None:
+        self._store = storage.Store(
+            hass, STATISTICS_STORAGE_VERSION, f"{DOMAIN}_{teamname}_statistics"
+        )
+        self.roster = roster
+        self.windows = tuple(sorted(windows))
+        self._buckets: Dict[int, _Counts] = {}
+        # Days with a bucket in ascending order, and the events counted per day
+        self._days: List[int] = []
+        self._uids: Dict[int, List[str]] = {}
+        self._counted: set[str] = set()
+        self._totals = {window: _Counts() for window in self.windows}
+        # First day (ordinal) inside each window, None until the first advance
+        self._first: Dict[int, Optional[int]] = dict.fromkeys(self.windows)
+        self.today: Optional[date] = None
+
+    def advance(self, today: date) -> None:
+        """Move the windows to end at `today`, subtracting the expired days."""
+        self.today = today
+        day = today.toordinal()
+        for window in self.windows:
+            first = day - window + 1
+            previous = self._first[window]
+            if previous is None or first > previous:
+                low = 0 if previous is None else bisect_left(self._days, previous)
+                high = bisect_left(self._days, first)
+                for expired in self._days[low:high]:
+                    self._totals[window].merge(self._buckets[expired], -1)
+                self._first[window] = first
+
+        # Days older than the longest window are not needed any more
+        oldest = day - self.windows[-1] + 1
+        stale = self._days[: bisect_left(self._days, oldest)]
+        for expired in stale:
+            del self._buckets[expired]
+            self._counted.difference_update(self._uids.pop(expired, ()))
+        del self._days[: len(stale)]
+
+    def add_events(self, events: Iterable[KadermanagerEvent]) -> int:
+        """Count passed events that were not counted before, return how many."""
+        added = 0
+        for event in events:
+            if not event.uid or event.uid in self._counted or event.start is None:
+                continue
+            day = event.start.date().toordinal()
+            oldest = self._first[self.windows[-1]]
+            if oldest is not None and day < oldest:
+                continue
+            bucket = self._buckets.get(day)
+            if bucket is None:
+                bucket = self._buckets[day] = _Counts()
+                insort(self._days, day)
+            bucket.add_event(event)
+            self._uids.setdefault(day, []).append(event.uid)
+            self._counted.add(event.uid)
+            for window in self.windows:
+                first = self._first[window]
+                if first is None or day >= first:
+                    self._totals[window].add_event(event)
+            added += 1
+        return added
+
+    def turnout(self, window: int) -> Dict[str, Any]:
+        """Return the average enrollment count, overall and per event type."""
+        types = self._totals[window].types
+        events = sum(counts[0] for counts in types.values())
+        enrolled = sum(counts[1] for counts in types.values())
+        return {
+            "events": events,
+            "average": round(enrolled / events, 1) if events else None,
+            "by_type": {
+                event_type: {
+                    "events": counts[0],
+                    "average": round(counts[1] / counts[0], 1),
+                }
+                for event_type, counts in sorted(types.items())
+            },
+        }
+
+    def attendance(self, window: int) -> Dict[str, Dict[str, Any]]:
+        """Return per player how often they were listed and accepted."""
+        totals = self._totals[window]
+        accepted = totals.accepted
+        result = {}
+        for player_id, listed in enumerate(totals.listed):
+            if not listed:
+                continue
+            count = accepted[player_id] if player_id < len(accepted) else 0
+            result[self.roster.names[player_id]] = {
+                "listed": listed,
+                "accepted": count,
+                "ratio": round(count / listed, 3),
+            }
+        return result
+
+    async def async_load(self) -> None:
+        """Restore the day buckets and rebuild the window totals from them."""
+        stored = await self._store.async_load()
+        if not stored:
+            return
+        for key, bucket in stored.get("days", {}).items():
+            day = int(key)
+            self._buckets[day] = _Counts.from_dict(bucket, self.roster)
+            self._uids[day] = bucket.get("uids", [])
+            self._counted.update(self._uids[day])
+        self._days = sorted(self._buckets)
+        if stored.get("today"):
+            today = date.fromisoformat(stored["today"])
+            day = today.toordinal()
+            for window in self.windows:
+                first = self._first[window] = day - window + 1
+                for bucket_day in self._days[bisect_left(self._days, first) :]:
+                    self._totals[window].merge(self._buckets[bucket_day])
+            self.today = today
+
+    async def async_save(self) -> None:
+        """Persist the day buckets, players by name."""
+        await self._store.async_save(
+            {
+                "today": self.today.isoformat() if self.today else None,
+                "days": {
+                    str(day): {
+                        **self._buckets[day].as_dict(self.roster),
+                        "uids": self._uids.get(day, []),
+                    }
+                    for day in self._days
+                },
+            }
+        )
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "days": len(self._days),
+            "events": len(self._counted),
+            "windows": {
+                window: self.turnout(window)["events"] for window in self.windows
+            },
+        }
@@ -0,0 +1,228 @@
+"""Sectioned persistent storage for Kadermanager."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from array import array
+from typing import Any, Dict, List, Optional, Tuple
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import storage
+
+from .const import DOMAIN
+from .models import KadermanagerEvent, TeamRoster
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 2
+SECTION_STORAGE_VERSION = 1
+PLAYERS_STORAGE_VERSION = 2
+
+SECTION_PLAYERS = "players"
+SECTION_COMMENTS = "comments"
+SECTION_GENERAL_COMMENTS = "general_comments"
+
+# Heavy sections that are kept in their own store files and only loaded
+# once something actually needs them.
+LAZY_SECTIONS = (SECTION_PLAYERS, SECTION_COMMENTS, SECTION_GENERAL_COMMENTS)
+
+
+def split_payload(
+    data: Dict[str, Any], roster: TeamRoster
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Split a coordinator payload into the core part and the heavy sections.
+
+    Player ID arrays and comments are keyed by event link, which is the same
+    key the coordinator uses to reuse cached event details between refreshes.
+    """
+    players: Dict[str, Any] = {}
+    comments: Dict[str, Any] = {}
+    core_events: List[Dict[str, Any]] = []
+
+    for event in data.get("events") or []:
+        core_events.append(event.as_dict(details=False))
+        if not event.link:
+            continue
+        if event.players and any(event.players.values()):
+            players[event.link] = {
+                zone: ids.tolist() for zone, ids in event.players.items()
+            }
+        if event.comments:
+            comments[event.link] = event.comments
+
+    core = {
+        k: v
+        for k, v in data.items()
+        if k not in ("events", "later_events", "general_comments")
+    }
+    core["events"] = core_events
+    # Events beyond the limit never have details
+    core["later_events"] = [
+        event.as_dict(details=False) for event in data.get("later_events") or []
+    ]
+
+    sections = {
+        SECTION_PLAYERS: {"roster": list(roster.names), "events": players},
+        SECTION_COMMENTS: comments,
+        SECTION_GENERAL_COMMENTS: data.get("general_comments") or [],
+    }
+    return core, sections
+
+
+def _encode_legacy_players(
+    legacy: Dict[str, Dict[str, List[str]]],
+) -> Dict[str, Any]:
+    """Convert a {link: {zone: [names]}} mapping to the roster layout."""
+    roster = TeamRoster()
+    return {
+        "roster": roster.names,
+        "events": {
+            link: {zone: ids.tolist() for zone, ids in roster.encode(zones).items()}
+            for link, zones in legacy.items()
+        },
+    }
+
+
+def merge_section(
+    data: Dict[str, Any], name: str, section: Any, roster: TeamRoster
+) -> None:
+    """Merge a loaded section into the coordinator's events in place."""
+    if name == SECTION_GENERAL_COMMENTS:
+        if section and "general_comments" not in data:
+            data["general_comments"] = section
+        return
+
+    if not section:
+        return
+
+    if name == SECTION_PLAYERS:
+        # Stored IDs refer to the stored roster; re-intern so they stay valid
+        # even if names were added to the live roster in the meantime.
+        id_map = [roster.intern(player) for player in section.get("roster", [])]
+        stored = section.get("events", {})
+        for event in data.get("events") or []:
+            if event.link in stored and event.players is None:
+                event.players = {
+                    zone: array("H", (id_map[pid] for pid in ids))
+                    for zone, ids in stored[event.link].items()
+                }
+        return
+
+    for event in data.get("events") or []:
+        if event.link in section and getattr(event, name) is None:
+            setattr(event, name, section[event.link])
+
+
+class _CoreStore(storage.Store):
+    """Core store that migrates the legacy single-file layout."""
+
+    def __init__(self, hass: HomeAssistant, key: str) -> None:
+        """Initialize the core store."""
+        super().__init__(hass, STORAGE_VERSION, key)
+        self.migrated_sections: Optional[Dict[str, Any]] = None
+
+    async def _async_migrate_func(
+        self, old_major_version: int, old_minor_version: int, old_data: Any
+    ) -> Dict[str, Any]:
+        """Split a version 1 payload into core and sections."""
+        if old_major_version == 1:
+            _LOGGER.debug("Migrating %s to sectioned storage", self.key)
+            old_data = old_data or {}
+            legacy_players = {
+                event["link"]: event["players"]
+                for event in old_data.get("events") or []
+                if event.get("link") and event.get("players")
+            }
+            events = [
+                KadermanagerEvent.from_dict(event)
+                for event in old_data.get("events") or []
+            ]
+            core, self.migrated_sections = split_payload(
+                {**old_data, "events": events}, TeamRoster()
+            )
+            self.migrated_sections[SECTION_PLAYERS] = _encode_legacy_players(
+                legacy_players
+            )
+            return core
+        raise NotImplementedError
+
+
+class _PlayersStore(storage.Store):
+    """Players section store that migrates name lists to roster IDs."""
+
+    def __init__(self, hass: HomeAssistant, key: str) -> None:
+        """Initialize the players store."""
+        super().__init__(hass, PLAYERS_STORAGE_VERSION, key)
+
+    async def _async_migrate_func(
+        self, old_major_version: int, old_minor_version: int, old_data: Any
+    ) -> Dict[str, Any]:
+        """Encode version 1 name lists with a roster."""
+        if old_major_version == 1:
+            return _encode_legacy_players(old_data or {})
+        raise NotImplementedError
+
+
+class KadermanagerStore:
+    """Persist coordinator data as one eager core file plus lazy sections."""
+
+    def __init__(self, hass: HomeAssistant, teamname: str) -> None:
+        """Initialize the store files for a team."""
+        key = f"{DOMAIN}_{teamname}"
+        self._core = _CoreStore(hass, key)
+        self._section_stores: Dict[str, storage.Store] = {
+            name: storage.Store(hass, SECTION_STORAGE_VERSION, f"{key}_{name}")
+            for name in LAZY_SECTIONS
+            if name != SECTION_PLAYERS
+        }
+        self._section_stores[SECTION_PLAYERS] = _PlayersStore(
+            hass, f"{key}_{SECTION_PLAYERS}"
+        )
+        self._sections: Dict[str, Any] = {}
+        # Sections split off a legacy file, handed out on first access so
+        # they are merged like sections read from disk
+        self._migrated: Dict[str, Any] = {}
+        self._lock = asyncio.Lock()
+
+    def is_loaded(self, name: str) -> bool:
+        """Return True if a section has already been read from disk."""
+        return name in self._sections
+
+    async def async_load_core(self) -> Optional[Dict[str, Any]]:
+        """Load the core section (events without players or comments)."""
+        core = await self._core.async_load()
+        if self._core.migrated_sections is not None:
+            # Write the sections extracted from the legacy file right away so
+            # the next start only needs the small core file.
+            for name, section in self._core.migrated_sections.items():
+                self._migrated[name] = section
+                await self._section_stores[name].async_save(section)
+            self._core.migrated_sections = None
+        return core
+
+    async def async_load_section(self, name: str) -> Any:
+        """Return a heavy section, reading it from disk on first access."""
+        if name in self._sections:
+            return self._sections[name]
+
+        async with self._lock:
+            if name in self._migrated:
+                self._sections[name] = self._migrated.pop(name)
+            elif name not in self._sections:
+                section = await self._section_stores[name].async_load()
+                if section is None:
+                    section = [] if name == SECTION_GENERAL_COMMENTS else {}
+                self._sections[name] = section
+                _LOGGER.debug("Loaded %s section from %s", name, self._core.key)
+        return self._sections[name]
+
+    async def async_save(self, data: Dict[str, Any], roster: TeamRoster) -> None:
+        """Save the core file and every section whose content changed."""
+        core, sections = split_payload(data, roster)
+        await self._core.async_save(core)
+        for name, section in sections.items():
+            if self._sections.get(name) == section:
+                continue
+            self._sections[name] = section
+            await self._section_stores[name].async_save(section)
@@ -0,0 +1,346 @@
+"""Streaming extractors for the list pages.
+
+The widget, messages and events pages are large but only a few elements of
+them are used. Instead of building a BeautifulSoup tree for the whole page,
+these extractors follow the open elements with `html.parser.HTMLParser`
+callbacks and only collect the text of the elements they need. Results are
+the same as those of the BeautifulSoup parsers in the coordinator, which stay
+in place as fallback.
+
+Unclosed elements are handled like BeautifulSoup's ``html.parser`` builder
+does: an end tag closes everything opened after the matching start tag, end
+tags without a matching start tag are ignored, and void elements are never
+opened.
+"""
+
+from __future__ import annotations
+
+import re
+from collections import deque
+from html.parser import HTMLParser
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from .models import UNKNOWN
+
+VOID_ELEMENTS = frozenset(
+    (
+        "area",
+        "base",
+        "br",
+        "col",
+        "embed",
+        "hr",
+        "img",
+        "input",
+        "link",
+        "meta",
+        "param",
+        "source",
+        "track",
+        "wbr",
+    )
+)
+
+# Size of the slices fed to the parser
+CHUNK_SIZE = 16384
+
+# Number of general comments kept, the newest are at the end of the page
+GENERAL_COMMENTS = 5
+
+_DATE_KEY_RE = re.compile(r"(\d{2}\.\d{2}\.)")
+_COUNT_RE = re.compile(r"(\d+)")
+
+
+def _classes(attrs: Dict[str, Optional[str]]) -> List[str]:
+    return (attrs.get("class") or "").split()
+
+
+class _StreamingExtractor(HTMLParser):
+    """Track the open elements and collect the text of selected ones."""
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self._stack: List[str] = []
+        self._texts: Dict[str, Tuple[int, List[str]]] = {}
+
+    @property
+    def depth(self) -> int:
+        """Number of open elements."""
+        return len(self._stack)
+
+    def capture(self, key: str) -> None:
+        """Collect the text of the element that was just opened as `key`."""
+        self._texts[key] = (len(self._stack), [])
+
+    def capturing(self, key: str) -> bool:
+        return key in self._texts
+
+    def start(self, tag: str, attrs: Dict[str, Optional[str]]) -> None:
+        """Handle an opened element, `depth` already includes it."""
+
+    def end(self, depth: int) -> None:
+        """Handle the close of the element at `depth`."""
+
+    def text(self, key: str, value: str) -> None:
+        """Handle the complete text of a captured element."""
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        if tag in VOID_ELEMENTS:
+            return
+        self._stack.append(tag)
+        self.start(tag, dict(attrs))
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag not in self._stack:
+            return
+        while self._stack:
+            name = self._stack[-1]
+            self._close()
+            if name == tag:
+                break
+
+    def handle_data(self, data: str) -> None:
+        for _, parts in self._texts.values():
+            parts.append(data)
+
+    def close(self) -> None:
+        super().close()
+        while self._stack:
+            self._close()
+
+    def _close(self) -> None:
+        depth = len(self._stack)
+        for key in [key for key, (d, _) in self._texts.items() if d == depth]:
+            _, parts = self._texts.pop(key)
+            self.text(key, "".join(parts))
+        self.end(depth)
+        self._stack.pop()
+
+    def run(self, html: str) -> "_StreamingExtractor":
+        """Feed the page in slices and finish parsing."""
+        for offset in range(0, len(html), CHUNK_SIZE):
+            self.feed(html[offset : offset + CHUNK_SIZE])
+        self.close()
+        return self
+
+
+class WidgetEventsExtractor(_StreamingExtractor):
+    """Enrollment counts of the `calendar/widget_iframe_events` page."""
+
+    _FIELDS = {("div", "what"), ("span", "date"), ("span", "enrolled_in")}
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.counts: Dict[str, int] = {}
+        self._event: Optional[int] = None
+        self._values: Dict[str, str] = {}
+
+    def start(self, tag: str, attrs: Dict[str, Optional[str]]) -> None:
+        classes = _classes(attrs)
+        if self._event is None:
+            if tag == "div" and "event" in classes:
+                self._event = self.depth
+                self._values = {}
+            return
+        for css_class in classes:
+            if (tag, css_class) in self._FIELDS and not (
+                css_class in self._values or self.capturing(css_class)
+            ):
+                self.capture(css_class)
+
+    def text(self, key: str, value: str) -> None:
+        self._values[key] = value
+
+    def end(self, depth: int) -> None:
+        if depth != self._event:
+            return
+        self._event = None
+        values = self._values
+        if len(values) < 3:
+            return
+        date_match = _DATE_KEY_RE.search(values["date"])
+        count_match = _COUNT_RE.search(values["enrolled_in"])
+        if date_match and count_match:
+            title = values["what"].strip()
+            self.counts[f"{title}_{date_match.group(1)}"] = int(count_match.group(1))
+
+
+class MessagesExtractor(_StreamingExtractor):
+    """The last comments of a messages widget or home page, newest first."""
+
+    def __init__(self, css_class: str = "row message", limit: int = 5) -> None:
+        super().__init__()
+        self.css_class = css_class
+        self._comments: Deque[Dict[str, str]] = deque(maxlen=limit)
+        self._message: Optional[int] = None
+        self._values: Dict[str, str] = {}
+
+    @property
+    def comments(self) -> List[Dict[str, str]]:
+        return list(reversed(self._comments))
+
+    def start(self, tag: str, attrs: Dict[str, Optional[str]]) -> None:
+        if self._message is None:
+            if tag == "div" and " ".join(_classes(attrs)) == self.css_class:
+                self._message = self.depth
+                self._values = {}
+            return
+        if tag in ("h5", "p") and not (tag in self._values or self.capturing(tag)):
+            self.capture(tag)
+
+    def text(self, key: str, value: str) -> None:
+        self._values[key] = value
+
+    def end(self, depth: int) -> None:
+        if depth != self._message:
+            return
+        self._message = None
+        if "h5" in self._values and "p" in self._values:
+            author = self._values["h5"].strip().split("\n")[0].strip()
+            text = self._values["p"].strip()
+            self._comments.append({"author": author, "text": text})
+
+
+class EventListExtractor(_StreamingExtractor):
+    """Title, link, date text and location of every event on `/events`.
+
+    The location is the first ``div.location`` of the event, otherwise the
+    first ``div`` sibling after the date heading unless it is the latest
+    comment preview.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.rows: List[Dict[str, str]] = []
+        self._event: Optional[int] = None
+        self._row: Dict[str, Any] = {}
+        self._date: Optional[int] = None
+        # Depth of the date heading's parent while its next div is searched
+        self._sibling_parent: Optional[int] = None
+
+    def start(self, tag: str, attrs: Dict[str, Optional[str]]) -> None:
+        if self._event is None:
+            if tag == "div" and "event-detailed-container" in _classes(attrs):
+                self._event = self.depth
+                self._row = {}
+                self._date = None
+            return
+        row = self._row
+        if tag == "a":
+            href = attrs.get("href")
+            if "event-title-link" in _classes(attrs) and "title" not in row:
+                row["title"] = ""
+                row["title_href"] = href
+                self.capture("title")
+            if (
+                href is not None
+                and "fallback_href" not in row
+                and "player" not in href
+                and "/edit" not in href
+            ):
+                row["fallback_href"] = href
+        elif tag == "h4" and "date" not in row:
+            row["date"] = ""
+            self._date = self.depth
+            self.capture("date")
+        elif tag == "div":
+            if "location" in _classes(attrs) and "location" not in row:
+                row["location"] = ""
+                self.capture("location")
+            if self._sibling_parent == self.depth - 1:
+                self._sibling_parent = None
+                row["sibling_classes"] = _classes(attrs)
+                row["sibling"] = ""
+                self.capture("sibling")
+
+    def text(self, key: str, value: str) -> None:
+        self._row[key] = value
+
+    def end(self, depth: int) -> None:
+        if self._event is None:
+            return
+        if depth == self._date:
+            # The date heading closed, the location may be its next div sibling
+            self._date = None
+            self._sibling_parent = depth - 1
+        elif self._sibling_parent is not None and depth <= self._sibling_parent:
+            self._sibling_parent = None
+        if depth == self._event:
+            self._event = None
+            self._sibling_parent = None
+            self.rows.append(self._finish(self._row))
+
+    @staticmethod
+    def _finish(row: Dict[str, Any]) -> Dict[str, str]:
+        title = row.get("title")
+        link = row.get("title_href")
+        if link is None:
+            link = row.get("fallback_href", "")
+        location = UNKNOWN
+        if "location" in row:
+            location = row["location"].strip()
+        elif "sibling" in row and "event-latest-comment" not in row["sibling_classes"]:
+            location = row["sibling"].strip()
+        return {
+            "title": title.strip() if title is not None else UNKNOWN,
+            "link": link,
+            "date": row["date"].strip() if "date" in row else UNKNOWN,
+            "location": location,
+        }
+
+
+class EnrollmentsExtractor(_StreamingExtractor):
+    """Enrollment circles of the home page by event link path (or position)."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.counts: Dict[str, int] = {}
+        self._links: List[Tuple[int, str]] = []
+        self._index = 0
+
+    def start(self, tag: str, attrs: Dict[str, Optional[str]]) -> None:
+        if tag == "a" and attrs.get("href") is not None:
+            self._links.append((self.depth, str(attrs["href"])))
+        elif tag == "div" and "circle-in-enrollments" in _classes(attrs):
+            self.capture(f"circle_{self._index}")
+            self._index += 1
+
+    def text(self, key: str, value: str) -> None:
+        try:
+            count = int(value.strip())
+        except ValueError:
+            return
+        if self._links:
+            raw_href = self._links[-1][1]
+            link_path = (
+                "/" + "/".join(raw_href.split("/")[3:])
+                if "://" in raw_href
+                else raw_href
+            ).split("?")[0]
+            self.counts[link_path] = count
+        else:
+            self.counts[f"idx_{key.split('_')[1]}"] = count
+
+    def end(self, depth: int) -> None:
+        if self._links and self._links[-1][0] == depth:
+            self._links.pop()
+
+
+def parse_widget_events(html: str) -> Dict[str, int]:
+    """Return the enrollment counts of the events widget by title and date."""
+    return WidgetEventsExtractor().run(html).counts
+
+
+def parse_general_comments(html: str) -> List[Dict[str, str]]:
+    """Return the last `GENERAL_COMMENTS` team comments, newest first."""
+    return MessagesExtractor(limit=GENERAL_COMMENTS).run(html).comments
+
+
+def parse_event_list(html: str) -> List[Dict[str, str]]:
+    """Return the raw fields of every event container of the events page."""
+    return EventListExtractor().run(html).rows
+
+
+def parse_enrollments(html: str) -> Dict[str, int]:
+    """Return the enrollment counts of the home page."""
+    return EnrollmentsExtractor().run(html).counts
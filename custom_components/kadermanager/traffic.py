@@ -0,0 +1,129 @@
+"""Daily counters of the traffic sent to kadermanager.de."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import storage
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+TRAFFIC_STORAGE_VERSION = 1
+# Days of counters kept on disk
+TRAFFIC_HISTORY_DAYS = 30
+
+
+def endpoint_for(url: str) -> str:
+    """Return the endpoint type of a Kadermanager URL."""
+    path = urlsplit(url).path.rstrip("/")
+    if path == "/calendar/ical":
+        return "ical"
+    if path == "/calendar/widget_iframe_events":
+        return "widget_events"
+    if path == "/messages/widget_iframe_messages":
+        return "widget_messages"
+    if path == "/events":
+        return "events"
+    if path.startswith("/events/"):
+        return "detail"
+    if path.startswith("/sessions"):
+        return "login"
+    if path == "":
+        return "home"
+    return "other"
+
+
+def _empty_day() -> Dict[str, Any]:
+    return {
+        "requests": {},
+        "statuses": {},
+        "bytes_compressed": 0,
+        "bytes_decompressed": 0,
+        "not_modified": 0,
+        "content_hash_hits": 0,
+        "detail_cache_hits": 0,
+        "retries": 0,
+    }
+
+
+class TrafficCounters:
+    """Count requests, bytes and cache hits per day and persist them per team.
+
+    A content-hash hit is a response whose body is identical to the previous
+    response of the same URL, i.e. traffic a conditional request could have
+    saved. Compressed bytes come from ``Content-Length``; responses without
+    it are counted with their decompressed size.
+    """
+
+    def __init__(self, hass: HomeAssistant, teamname: str) -> None:
+        self._store = storage.Store(
+            hass, TRAFFIC_STORAGE_VERSION, f"{DOMAIN}_{teamname}_traffic"
+        )
+        self.days: Dict[str, Dict[str, Any]] = {}
+        self._hashes: Dict[str, bytes] = {}
+
+    @property
+    def today(self) -> Dict[str, Any]:
+        """Counters of the current day."""
+        return self.days.setdefault(dt_util.now().date().isoformat(), _empty_day())
+
+    def record_request(self, url: str, status: int) -> None:
+        """Count one request and the status of its response."""
+        day = self.today
+        endpoint = endpoint_for(url)
+        day["requests"][endpoint] = day["requests"].get(endpoint, 0) + 1
+        key = str(status)
+        day["statuses"][key] = day["statuses"].get(key, 0) + 1
+        if status == 304:
+            day["not_modified"] += 1
+
+    def record_body(
+        self, url: str, body: bytes, content_length: Optional[int] = None
+    ) -> None:
+        """Count the size of a response body and whether it changed."""
+        day = self.today
+        day["bytes_decompressed"] += len(body)
+        day["bytes_compressed"] += (
+            content_length if content_length is not None else len(body)
+        )
+        digest = hashlib.blake2b(body, digest_size=16).digest()
+        if self._hashes.get(url) == digest:
+            day["content_hash_hits"] += 1
+        self._hashes[url] = digest
+
+    def record_detail_cache_hit(self) -> None:
+        """Count an event whose details were reused instead of fetched."""
+        self.today["detail_cache_hits"] += 1
+
+    def record_retry(self) -> None:
+        """Count a request repeated after a failure (e.g. a re-login)."""
+        self.today["retries"] += 1
+
+    async def async_load(self) -> None:
+        """Restore the stored days."""
+        stored = await self._store.async_load()
+        if stored:
+            self.days = {**stored.get("days", {}), **self.days}
+
+    async def async_save(self) -> None:
+        """Persist the counters of the last `TRAFFIC_HISTORY_DAYS` days."""
+        for day in sorted(self.days)[:-TRAFFIC_HISTORY_DAYS]:
+            del self.days[day]
+        await self._store.async_save({"days": self.days})
+
+    def as_dict(self, days: int = 7) -> Dict[str, Any]:
+        """Return today's counters and request totals of the previous days."""
+        recent = sorted(self.days)[-days:]
+        return {
+            "today": self.today,
+            "requests_per_day": {
+                day: sum(self.days[day]["requests"].values()) for day in recent
+            },
+        }
@@ -0,0 +1,97 @@
+"""Configuration for the parser benchmark suite.
+
+Benchmarks only run with ``pytest tests/benchmarks --benchmark-only``. Each
+result is normalized by a calibration workload measured on the same machine
+and compared against ``baselines.json``; a run fails if it is slower than the
+baseline by more than the regression threshold (default 50%).
+
+Environment variables:
+    KADERMANAGER_BENCHMARK_THRESHOLD: allowed slowdown, e.g. ``0.5`` for 50%.
+    KADERMANAGER_BENCHMARK_UPDATE: set to ``1`` to rewrite the baselines.
+"""
+
+import importlib.util
+import json
+import os
+import statistics
+import time
+from pathlib import Path
+
+import pytest
+
+BASELINES_FILE = Path(__file__).parent / "baselines.json"
+ROUNDS = 5
+
+HAS_BENCHMARK = importlib.util.find_spec("pytest_benchmark") is not None
+collect_ignore_glob = [] if HAS_BENCHMARK else ["test_*.py"]
+
+_results: dict[str, float] = {}
+
+
+def _calibration_workload():
+    return sorted(str(i * 7919 % 100003) for i in range(100000))
+
+
+@pytest.fixture(scope="session")
+def calibration():
+    """Return the median runtime of a fixed pure-Python workload."""
+    timings = []
+    for _ in range(5):
+        start = time.perf_counter()
+        _calibration_workload()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+@pytest.fixture(scope="session")
+def baselines():
+    if BASELINES_FILE.exists():
+        return json.loads(BASELINES_FILE.read_text(encoding="utf-8"))
+    return {}
+
+
+@pytest.fixture(autouse=True)
+def _require_benchmark_only(request):
+    if not request.config.getoption("benchmark_only", False):
+        pytest.skip("benchmarks only run with --benchmark-only")
+
+
+@pytest.fixture
+def bench(benchmark, request, calibration, baselines):
+    """Benchmark a callable and check it against the stored baseline."""
+
+    def run(func, *args):
+        result = benchmark.pedantic(
+            func, args=args, rounds=ROUNDS, warmup_rounds=1, iterations=1
+        )
+        name = request.node.name
+        normalized = benchmark.stats.stats.median / calibration
+        _results[name] = round(normalized, 4)
+        benchmark.extra_info["normalized"] = normalized
+
+        baseline = baselines.get(name)
+        threshold = float(os.environ.get("KADERMANAGER_BENCHMARK_THRESHOLD", "0.5"))
+        if (
+            baseline
+            and not os.environ.get("KADERMANAGER_BENCHMARK_UPDATE")
+            and normalized > baseline * (1 + threshold)
+        ):
+            pytest.fail(
+                f"{name} regressed: {normalized:.3f} vs. baseline {baseline:.3f} "
+                f"(threshold {threshold:.0%})"
+            )
+        return result
+
+    return run
+
+
+def pytest_sessionfinish(session, exitstatus):
+    if os.environ.get("KADERMANAGER_BENCHMARK_UPDATE") and _results:
+        stored = {}
+        if BASELINES_FILE.exists():
+            stored = json.loads(BASELINES_FILE.read_text(encoding="utf-8"))
+        stored.update(_results)
+        BASELINES_FILE.write_text(
+            json.dumps(dict(sorted(stored.items())), indent=2) + "\n",
+            encoding="utf-8",
+        )
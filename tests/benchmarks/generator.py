@@ -0,0 +1,227 @@
+"""Synthetic Kadermanager pages for large clubs.
+
+All generators are deterministic for a given seed so benchmark runs are
+comparable with the stored baselines.
+"""
+
+from __future__ import annotations
+
+import random
+from datetime import datetime, timedelta
+from html import escape
+
+EVENT_TYPES = ("Training", "Spiel", "Sonstiges")
+LOCATIONS = (
+    "Musterstraße 1, 12345 Musterstadt",
+    "Stadionweg 99, 54321 Beispielhausen",
+    "Sporthalle Nord, Hallenweg 3, 12345 Musterstadt",
+)
+WEEKDAYS = ("Mo", "Di", "Mi", "Do", "Fr", "Sa", "So")
+FIRST_NAMES = ("Anna", "Ben", "Clara", "David", "Emma", "Felix", "Greta", "Hans")
+LAST_NAMES = ("Müller", "Schmidt", "Schneider", "Fischer", "Weber", "Meyer")
+
+TEAM_URL = "https://bigclub.kadermanager.de"
+
+
+def player_names(count: int, seed: int = 1) -> list[str]:
+    """Return `count` unique, realistic player names."""
+    rng = random.Random(seed)
+    names: list[str] = []
+    while len(names) < count:
+        name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)} {len(names)}"
+        names.append(name)
+    return names
+
+
+def events(
+    historical: int = 5000,
+    upcoming: int = 40,
+    now: datetime | None = None,
+    seed: int = 1,
+) -> list[dict]:
+    """Return raw event descriptions, oldest first."""
+    rng = random.Random(seed)
+    now = now or datetime(2024, 1, 1, 12, 0)
+    result = []
+    for idx in range(historical + upcoming):
+        offset = idx - historical
+        start = (
+            now + timedelta(days=offset // 2, hours=rng.choice((-3, 0, 2)))
+        ).replace(minute=rng.choice((0, 15, 30)), second=0)
+        event_type = EVENT_TYPES[idx % 3]
+        result.append(
+            {
+                "id": 100000 + idx,
+                "type": event_type,
+                "title": f"{event_type} Gruppe {idx % 7}",
+                "start": start,
+                "location": LOCATIONS[idx % len(LOCATIONS)],
+                "in_count": rng.randint(0, 30),
+            }
+        )
+    return result
+
+
+def attendance(
+    event_list: list[dict], players: int = 25, seed: int = 5
+) -> list[dict[str, list[str]]]:
+    """Return the player lists (names per zone) of each event."""
+    rng = random.Random(seed)
+    names = player_names(players)
+    zones = ("accepted_players", "declined_players", "no_response_players")
+    result = []
+    for _ in event_list:
+        lists: dict[str, list[str]] = {zone: [] for zone in zones}
+        for name in rng.sample(names, rng.randint(min(5, players), players)):
+            lists[rng.choice(zones)].append(name)
+        result.append(lists)
+    return result
+
+
+def ical_feed(event_list: list[dict], team_url: str = TEAM_URL) -> str:
+    """Return an iCal feed with folded lines like the real export."""
+    lines = ["BEGIN:VCALENDAR", "VERSION:2.0", "PRODID:-//Kadermanager//DE"]
+    for event in event_list:
+        description = "Treffpunkt 15 Minuten vorher\\, bitte pünktlich sein. " * 3
+        lines.extend(
+            [
+                "BEGIN:VEVENT",
+                f"UID:event-{event['id']}@kadermanager.de",
+                f"DTSTART:{event['start'].strftime('%Y%m%dT%H%M%S')}Z",
+                f"DTEND:{(event['start'] + timedelta(hours=2)).strftime('%Y%m%dT%H%M%S')}Z",
+                f"SUMMARY:{event['title']}",
+                f"CATEGORIES:{event['type']}",
+                f"LOCATION:{event['location'].replace(',', chr(92) + ',')}",
+                f"URL:{team_url}/events/{event['id']}",
+                # Long values are folded onto continuation lines
+                f"DESCRIPTION:{description[:60]}",
+                f" {description[60:]}",
+                "END:VEVENT",
+            ]
+        )
+    lines.append("END:VCALENDAR")
+    return "\r\n".join(lines) + "\r\n"
+
+
+def _page(body: str) -> str:
+    head = (
+        "<head><title>Bigclub Kadermanager.de</title>"
+        '<meta name="csrf-token" content="token">'
+        + '<link rel="stylesheet" href="/assets/app.css">' * 10
+        + "</head>"
+    )
+    nav = "".join(
+        f'<li><a href="/section/{idx}">Bereich {idx}</a></li>' for idx in range(30)
+    )
+    return (
+        f'<!DOCTYPE HTML><html lang="de">{head}<body>'
+        f'<div id="header"><ul class="nav">{nav}</ul></div>{body}'
+        '<div class="footer">Kadermanager</div></body></html>'
+    )
+
+
+def events_page(event_list: list[dict]) -> str:
+    """Return an `/events` page with one detailed container per event."""
+    parts = []
+    for event in event_list:
+        start = event["start"]
+        parts.append(
+            '<div class="row event-detailed-container">'
+            '<div class="event-detailed-label">'
+            f'<a class="event-title-link" href="/events/{event["id"]}">{event["type"]} &middot; '
+            f'<span class="event-information">{escape(event["title"])}</span></a>'
+            f'<a href="/events/{event["id"]}/edit">Bearbeiten</a></div>'
+            '<div class="event-information-container">'
+            f'<a href="/events/{event["id"]}">'
+            f"<h4>{WEEKDAYS[start.weekday()]} {start.strftime('%d.%m.%Y')} um {start.strftime('%H:%M')}</h4>"
+            f"<div>{escape(event['location'])}</div></a>"
+            '<div class="event-latest-comment">Letzter Kommentar</div>'
+            "</div></div>"
+        )
+    return _page("".join(parts))
+
+
+def home_page(
+    event_list: list[dict], messages: int = 200, team_url: str = TEAM_URL
+) -> str:
+    """Return a team home page with enrollment circles and messages."""
+    parts = [
+        f'<a href="{team_url}/events/{event["id"]}?ref=home">'
+        f'<div class="circle-in-enrollments">{event["in_count"]}</div></a>'
+        for event in event_list
+    ]
+    return _page("".join(parts) + _messages(messages, "row message"))
+
+
+def events_widget(event_list: list[dict]) -> str:
+    """Return the `calendar/widget_iframe_events` page."""
+    parts = []
+    for event in event_list:
+        start = event["start"]
+        parts.append(
+            '<div class="event">'
+            f'<div class="what">{escape(event["title"])}</div>'
+            f'<span class="date">{WEEKDAYS[start.weekday()]} {start.strftime("%d.%m.")}</span>'
+            f'<span class="time">{start.strftime("%H:%M")}</span>'
+            f'<span class="enrolled_in">(Teilnehmer: {event["in_count"]})</span>'
+            "</div>"
+        )
+    return _page("".join(parts))
+
+
+def _messages(count: int, css_class: str, seed: int = 2) -> str:
+    rng = random.Random(seed)
+    names = player_names(60)
+    return "".join(
+        f'<div class="{css_class}"><h5>{escape(rng.choice(names))}\n'
+        f"<small>vor {idx} Tagen</small></h5>"
+        f"<p>{'Wer kommt heute noch mit? ' * rng.randint(1, 6)}</p></div>"
+        for idx in range(count)
+    )
+
+
+def messages_widget(messages: int = 200) -> str:
+    """Return the `messages/widget_iframe_messages` page."""
+    return _page(_messages(messages, "row message"))
+
+
+def detail_page(players: int = 60, comments: int = 50, seed: int = 3) -> str:
+    """Return an event detail page with all three drop zones filled."""
+    rng = random.Random(seed)
+    names = player_names(players)
+    zones: dict[int, list[str]] = {1: [], 2: [], 3: []}
+    for name in names:
+        zones[rng.choice((1, 1, 2, 3))].append(name)
+    zone_html = "".join(
+        f'<div class="drop-zone" id="zone_{zone}">'
+        + "".join(
+            f'<div class="player"><span class="player_label">{escape(name)}</span>'
+            '<img src="/assets/avatar.png"></div>'
+            for name in zone_names
+        )
+        + "</div>"
+        for zone, zone_names in zones.items()
+    )
+    return _page(zone_html + _messages(comments, "message"))
+
+
+def date_strings(count: int = 5000, seed: int = 4) -> list[str]:
+    """Return a mix of the date formats `parse_date_string` handles."""
+    rng = random.Random(seed)
+    months = ("Januar", "März", "Mai", "Juli", "Oktober", "Dezember")
+    samples = []
+    for idx in range(count):
+        day = rng.randint(1, 28)
+        month = rng.randint(1, 12)
+        kind = idx % 5
+        if kind == 0:
+            samples.append(f"Montag, {day:02d}.{month:02d}.2024 um 19:00")
+        elif kind == 1:
+            samples.append(f"{WEEKDAYS[idx % 7]} {day:02d}.{month:02d}. um 18:30")
+        elif kind == 2:
+            samples.append(f"{day} {rng.choice(months)}")
+        elif kind == 3:
+            samples.append("Heute um 20:00")
+        else:
+            samples.append("Morgen um 08:00")
+    return samples
@@ -0,0 +1,54 @@
+from datetime import timedelta
+from unittest.mock import MagicMock
+
+import pytest
+
+from custom_components.kadermanager.models import KadermanagerEvent, TeamRoster
+from custom_components.kadermanager.statistics import AttendanceStatistics
+from tests.benchmarks import generator
+
+
+@pytest.fixture(scope="module")
+def seasons():
+    """Seven seasons of passed events (two per day) with 60 players each."""
+    roster = TeamRoster()
+    raw_events = generator.events(historical=5000, upcoming=0)
+    days: dict = {}
+    for raw, zones in zip(raw_events, generator.attendance(raw_events, players=60)):
+        start = raw["start"]
+        event = KadermanagerEvent.from_dict(
+            {
+                "uid": f"event-{raw['id']}",
+                "title": raw["title"],
+                "type": raw["type"],
+                "date": start.strftime("%Y-%m-%d"),
+                "time": start.strftime("%H:%M"),
+                "original_date": start.strftime("%d.%m.%Y %H:%M"),
+                "in_count": raw["in_count"],
+            }
+        )
+        event.players = roster.encode(zones)
+        days.setdefault(start.date(), []).append(event)
+    return roster, days
+
+
+def _refreshes(roster, days):
+    """One refresh per day, each adding the events that passed the day before."""
+    statistics = AttendanceStatistics(MagicMock(), "bigclub", roster)
+    day = min(days) + timedelta(days=1)
+    end = max(days) + timedelta(days=1)
+    while day <= end:
+        statistics.advance(day)
+        statistics.add_events(days.get(day - timedelta(days=1), ()))
+        for window in statistics.windows:
+            statistics.turnout(window)
+            statistics.attendance(window)
+        day += timedelta(days=1)
+    return statistics
+
+
+def test_attendance_statistics_seasons(bench, seasons):
+    statistics = bench(_refreshes, *seasons)
+    # Only the last year is kept, whatever the history
+    assert statistics.as_dict()["days"] <= 365
+    assert statistics.turnout(365)["events"] > 700
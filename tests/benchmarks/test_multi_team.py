@@ -0,0 +1,105 @@
+"""20 teams parsing their pages at once, in-process against the parse pool.
+
+Compare ``test_twenty_teams_in_process`` with ``test_twenty_teams_pool`` for
+the throughput gain and ``test_parse_pool_startup`` for the one-off cost of
+spawning the workers. The gain grows with the number of cores; on a single
+core the pool is only overhead.
+"""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from custom_components.kadermanager.coordinator import KadermanagerDataUpdateCoordinator
+from custom_components.kadermanager.parse_pool import PARSE_POOL_WORKERS, ParsePool
+from custom_components.kadermanager.parsers import make_soup
+from tests.benchmarks import generator
+from tests.standin.harness import install_stubs
+
+TEAMS = 20
+DETAIL_PAGES = 5
+
+
+@pytest.fixture(scope="module")
+def pages():
+    event_list = generator.events(historical=0, upcoming=40)
+    return {
+        "detail": generator.detail_page(players=60, comments=50),
+        "widget": generator.events_widget(event_list),
+        "messages": generator.messages_widget(200),
+    }
+
+
+@pytest.fixture(scope="module")
+def loop():
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+def _hass(loop):
+    hass = MagicMock()
+    hass.async_add_executor_job = lambda func, *args: loop.run_in_executor(
+        None, func, *args
+    )
+    return hass
+
+
+@pytest.fixture
+def coordinator():
+    hass = MagicMock()
+    entry = MagicMock()
+    entry.data = {"teamname": "bigclub"}
+    entry.options = {}
+    return KadermanagerDataUpdateCoordinator(hass, entry)
+
+
+@pytest.fixture(scope="module")
+def pool(loop):
+    pool = ParsePool(_hass(loop), initializer=install_stubs)
+    loop.run_until_complete(pool.async_start())
+    yield pool
+    pool.shutdown()
+
+
+def test_twenty_teams_in_process(bench, coordinator, pages, loop):
+    async def team():
+        for _ in range(DETAIL_PAGES):
+            soup = make_soup(pages["detail"], coordinator.html_backend)
+            coordinator.parse_event_players(soup)
+            coordinator.parse_event_comments(soup)
+        coordinator._parse_widget_events(pages["widget"])
+        return coordinator.parse_general_comments(pages["messages"])
+
+    async def refresh_all():
+        return await asyncio.gather(*(team() for _ in range(TEAMS)))
+
+    results = bench(lambda: loop.run_until_complete(refresh_all()))
+    assert len(results) == TEAMS
+
+
+def test_twenty_teams_pool(bench, coordinator, pool, pages, loop):
+    async def team():
+        for _ in range(DETAIL_PAGES):
+            await pool.async_parse_detail(
+                pages["detail"], coordinator.html_backend, True, True
+            )
+        await pool.async_parse_list("widget", pages["widget"])
+        return await pool.async_parse_list("comments", pages["messages"])
+
+    async def refresh_all():
+        return await asyncio.gather(*(team() for _ in range(TEAMS)))
+
+    results = bench(lambda: loop.run_until_complete(refresh_all()))
+    assert all(len(comments) == 5 for comments in results)
+
+
+def test_parse_pool_startup(bench, loop):
+    def start_and_stop():
+        pool = ParsePool(_hass(loop), initializer=install_stubs)
+        pool.start()
+        pool.shutdown()
+        return pool.workers
+
+    assert bench(start_and_stop) == PARSE_POOL_WORKERS
@@ -0,0 +1,175 @@
+import asyncio
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from bs4 import BeautifulSoup
+
+from custom_components.kadermanager.calendar import KadermanagerCalendar
+from custom_components.kadermanager.coordinator import KadermanagerDataUpdateCoordinator
+from custom_components.kadermanager.models import KadermanagerEvent
+from custom_components.kadermanager.parsers import (
+    PARSER_BACKENDS,
+    available_backends,
+    make_soup,
+)
+from tests.benchmarks import generator
+
+
+@pytest.fixture(scope="module")
+def club():
+    event_list = generator.events(historical=5000, upcoming=40)
+    return {
+        "events": event_list,
+        "ical": generator.ical_feed(event_list),
+        "events_page": generator.events_page(event_list),
+        "home_page": generator.home_page(event_list, messages=200),
+        "events_widget": generator.events_widget(event_list[-200:]),
+        "messages_widget": generator.messages_widget(200),
+        "detail_page": generator.detail_page(players=60, comments=50),
+        "date_strings": generator.date_strings(5000),
+    }
+
+
+@pytest.fixture
+def coordinator():
+    hass = MagicMock()
+    entry = MagicMock()
+    entry.data = {"teamname": "bigclub"}
+    entry.options = {"fetch_player_info": True, "fetch_comments": True}
+    return KadermanagerDataUpdateCoordinator(hass, entry)
+
+
+@pytest.fixture
+def soup_coordinator(coordinator):
+    """Coordinator that parses the list pages with BeautifulSoup only."""
+    coordinator._parse_streaming = lambda name, stream, soup, html: soup(html)
+    return coordinator
+
+
+def test_ical_data(bench, coordinator, club):
+    coordinator._async_get_url = AsyncMock(return_value=club["ical"])
+    loop = asyncio.new_event_loop()
+    try:
+        events = bench(
+            lambda: loop.run_until_complete(coordinator._async_get_ical_data("ical"))
+        )
+    finally:
+        loop.close()
+    assert len(events) == len(club["events"])
+
+
+def test_parse_events(bench, coordinator, club):
+    events = bench(
+        coordinator.parse_events,
+        club["events_page"],
+        club["home_page"],
+        generator.TEAM_URL,
+    )
+    assert len(events) == len(club["events"])
+    assert events[-1]["in_count"] == club["events"][-1]["in_count"]
+
+
+def test_parse_events_soup(bench, soup_coordinator, club):
+    events = bench(
+        soup_coordinator.parse_events,
+        club["events_page"],
+        club["home_page"],
+        generator.TEAM_URL,
+    )
+    assert len(events) == len(club["events"])
+    assert events[-1]["in_count"] == club["events"][-1]["in_count"]
+
+
+def test_parse_widget_events(bench, coordinator, club):
+    counts = bench(coordinator._parse_widget_events, club["events_widget"])
+    assert counts
+
+
+def test_parse_widget_events_soup(bench, soup_coordinator, club):
+    counts = bench(soup_coordinator._parse_widget_events, club["events_widget"])
+    assert counts
+
+
+def test_parse_event_players(bench, coordinator, club):
+    players = bench(
+        lambda html: coordinator.parse_event_players(
+            BeautifulSoup(html, "html.parser")
+        ),
+        club["detail_page"],
+    )
+    assert sum(len(zone) for zone in players.values()) == 60
+
+
+def test_parse_event_comments(bench, coordinator, club):
+    comments = bench(
+        lambda html: coordinator.parse_event_comments(
+            BeautifulSoup(html, "html.parser")
+        ),
+        club["detail_page"],
+    )
+    assert len(comments) == 5
+
+
+def test_parse_general_comments(bench, coordinator, club):
+    comments = bench(coordinator.parse_general_comments, club["messages_widget"])
+    assert len(comments) == 5
+
+
+def test_parse_general_comments_soup(bench, soup_coordinator, club):
+    comments = bench(soup_coordinator.parse_general_comments, club["messages_widget"])
+    assert len(comments) == 5
+
+
+@pytest.mark.parametrize("backend", PARSER_BACKENDS)
+def test_soup_backend(bench, coordinator, club, backend):
+    """Build the trees of the pages still parsed with BeautifulSoup."""
+    if backend not in available_backends():
+        pytest.skip(f"{backend} is not installed")
+
+    def parse(pages):
+        soups = [make_soup(html, backend) for html in pages]
+        return coordinator.parse_event_players(soups[0]), len(soups)
+
+    players, _ = bench(parse, [club["detail_page"], club["events_page"]])
+    assert sum(len(zone) for zone in players.values()) == 60
+
+
+def test_parse_date_string(bench, coordinator, club):
+    results = bench(
+        lambda samples: [coordinator.parse_date_string(s) for s in samples],
+        club["date_strings"],
+    )
+    assert all(date for date, _ in results)
+
+
+def test_calendar_async_get_events(bench, coordinator, club):
+    parsed = [
+        {
+            "title": event["title"],
+            "link": f"{generator.TEAM_URL}/events/{event['id']}",
+            "type": event["type"],
+            "location": event["location"],
+            "date": event["start"].strftime("%Y-%m-%d"),
+            "time": event["start"].strftime("%H:%M"),
+            "original_date": event["start"].strftime("%d.%m.%Y %H:%M"),
+        }
+        for event in club["events"]
+    ]
+    coordinator.data = {"events": [KadermanagerEvent.from_dict(e) for e in parsed]}
+    entry = MagicMock()
+    entry.data = {"teamname": "bigclub"}
+    calendar = KadermanagerCalendar(coordinator, entry)
+
+    start = datetime(2023, 6, 1, tzinfo=timezone.utc)
+    end = datetime(2023, 9, 1, tzinfo=timezone.utc)
+    loop = asyncio.new_event_loop()
+    try:
+        events = bench(
+            lambda: loop.run_until_complete(
+                calendar.async_get_events(MagicMock(), start, end)
+            )
+        )
+    finally:
+        loop.close()
+    assert events
@@ -0,0 +1,15 @@
+import asyncio
+
+import pytest
+
+from tests.standin.replay import record_standin, replay
+
+
+@pytest.fixture(scope="module")
+def cassette():
+    return asyncio.run(record_standin(historical=5000, upcoming=40, players=60))
+
+
+def test_replay_refresh(bench, cassette):
+    durations, data = bench(lambda: asyncio.run(replay(cassette)))
+    assert len(data["events"]) == 5
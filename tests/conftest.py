@@ -1,4 +1,5 @@
 import sys
+import json
 from unittest.mock import MagicMock
 import datetime
 
@@ -16,6 +17,41 @@ sys.modules["homeassistant.helpers.event"] = MagicMock()
 sys.modules["homeassistant.helpers.typing"] = MagicMock()
 sys.modules["homeassistant.helpers.frame"] = MagicMock()
 
+
+# Define an in-memory Store that serializes like the real one on disk
+class MockStore:
+    disk: dict = {}
+
+    def __init__(self, hass, version, key, *args, **kwargs):
+        self.hass = hass
+        self.version = version
+        self.key = key
+
+    async def async_load(self):
+        raw = self.disk.get(self.key)
+        if raw is None:
+            return None
+        stored = json.loads(raw)
+        if stored["version"] != self.version:
+            data = await self._async_migrate_func(stored["version"], 1, stored["data"])
+            await self.async_save(data)
+            return data
+        return stored["data"]
+
+    async def async_save(self, data):
+        self.disk[self.key] = json.dumps(
+            {"version": self.version, "key": self.key, "data": data}
+        )
+
+    async def _async_migrate_func(self, old_major_version, old_minor_version, data):
+        raise NotImplementedError
+
+
+storage_mock = MagicMock()
+storage_mock.Store = MockStore
+sys.modules["homeassistant.helpers.storage"] = storage_mock
+sys.modules["homeassistant.helpers"].storage = storage_mock
+
 # Update Coordinator
 update_coordinator_mock = MagicMock()
 sys.modules["homeassistant.helpers.update_coordinator"] = update_coordinator_mock
@@ -47,8 +83,13 @@ sys.modules["homeassistant.util.dt"] = dt_mock
 # Link them
 util_mock.dt = dt_mock
 # Mock DEFAULT_TIME_ZONE
-dt_mock.now.return_value = datetime.datetime(2024, 1, 1, 12, 0, 0)
+dt_mock.now.return_value = datetime.datetime(
+    2024, 1, 1, 12, 0, 0, tzinfo=datetime.timezone.utc
+)
 dt_mock.DEFAULT_TIME_ZONE = datetime.timezone.utc
+dt_mock.UTC = datetime.timezone.utc
+dt_mock.as_local.side_effect = lambda value: value.astimezone(datetime.timezone.utc)
+dt_mock.parse_datetime.side_effect = datetime.datetime.fromisoformat
 
 sys.modules["homeassistant.config_entries"] = MagicMock()
 sys.modules["homeassistant.core"] = MagicMock()
@@ -0,0 +1,258 @@
+"""Run many coordinators against the stand-in server and report the load.
+
+Usage (the Home Assistant test stubs from ``tests/conftest.py`` are used):
+
+    python -m tests.standin.harness --teams 20 --refreshes 2 --latency 0.05
+
+The report contains per-team refresh latency, request counts per endpoint,
+response statuses and the worst event-loop lag seen during the run.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import random
+import socket
+import statistics
+import tempfile
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any
+from unittest.mock import MagicMock
+
+import aiohttp
+from aiohttp.abc import AbstractResolver
+
+from tests.standin.server import Faults, StandinServer, TeamSite
+
+LAG_PROBE_INTERVAL = 0.01
+
+
+class _LocalResolver(AbstractResolver):
+    """Resolve every team subdomain to the local stand-in server."""
+
+    async def resolve(
+        self, host: str, port: int = 0, family: int = socket.AF_INET
+    ) -> list[dict[str, Any]]:
+        return [
+            {
+                "hostname": host,
+                "host": "127.0.0.1",
+                "port": port,
+                "family": socket.AF_INET,
+                "proto": 0,
+                "flags": socket.AI_NUMERICHOST,
+            }
+        ]
+
+    async def close(self) -> None:
+        return None
+
+
+class _ScaledRandom(random.Random):
+    """Random source that shrinks the coordinator's anti-bot sleeps."""
+
+    def __init__(self, scale: float) -> None:
+        super().__init__(0)
+        self.scale = scale
+
+    def uniform(self, a: float, b: float) -> float:
+        return super().uniform(a, b) * self.scale
+
+
+def install_stubs() -> None:
+    """Install the Home Assistant test stubs in a spawned worker process."""
+    import tests.conftest  # noqa: F401
+
+
+def create_coordinator(server: StandinServer, site: TeamSite, **options: Any):
+    """Return a coordinator whose requests go to the stand-in server."""
+    from custom_components.kadermanager.coordinator import (
+        KadermanagerDataUpdateCoordinator,
+    )
+
+    class StandinCoordinator(KadermanagerDataUpdateCoordinator):
+        def _create_session(self) -> aiohttp.ClientSession:
+            connector = aiohttp.TCPConnector(resolver=_LocalResolver())
+            return aiohttp.ClientSession(headers=self._headers, connector=connector)
+
+    hass = MagicMock()
+    hass.data = {}
+    config_dir = tempfile.mkdtemp(prefix="kadermanager-standin-")
+    hass.config.path = lambda *parts: os.path.join(config_dir, *parts)
+    hass.async_add_executor_job = lambda func, *args: (
+        asyncio.get_running_loop().run_in_executor(None, func, *args)
+    )
+    entry = MagicMock()
+    entry.data = {
+        "teamname": site.name,
+        "username": site.username,
+        "password": site.password,
+    }
+    entry.options = {
+        "fetch_player_info": True,
+        "fetch_comments": True,
+        "event_limit": 5,
+        **options,
+    }
+    coordinator = StandinCoordinator(hass, entry)
+    coordinator.team_url = server.team_url(site.name)
+    return coordinator
+
+
+@dataclass
+class RefreshResult:
+    team: str
+    duration: float
+    success: bool
+    events: int = 0
+    error: str | None = None
+
+
+@dataclass
+class HarnessReport:
+    results: list[RefreshResult] = field(default_factory=list)
+    requests: Counter[str] = field(default_factory=Counter)
+    statuses: Counter[int] = field(default_factory=Counter)
+    lag_samples: list[float] = field(default_factory=list)
+
+    @property
+    def max_loop_lag(self) -> float:
+        return max(self.lag_samples, default=0.0)
+
+    @property
+    def p95_loop_lag(self) -> float:
+        if len(self.lag_samples) < 2:
+            return self.max_loop_lag
+        return statistics.quantiles(self.lag_samples, n=20)[-1]
+
+    def format(self) -> str:
+        durations = [r.duration for r in self.results]
+        failed = [r for r in self.results if not r.success]
+        lines = [
+            f"refreshes: {len(self.results)} ({len(failed)} failed)",
+            f"refresh latency: median {statistics.median(durations):.3f}s, "
+            f"max {max(durations):.3f}s",
+            "requests: "
+            + ", ".join(f"{k}={v}" for k, v in sorted(self.requests.items())),
+            "statuses: "
+            + ", ".join(f"{k}={v}" for k, v in sorted(self.statuses.items())),
+            f"loop lag: max {self.max_loop_lag * 1000:.1f} ms, "
+            f"p95 {self.p95_loop_lag * 1000:.1f} ms",
+        ]
+        lines.extend(f"  {r.team}: {r.error}" for r in failed)
+        return "\n".join(lines)
+
+
+async def _probe_loop_lag(samples: list[float], stop: asyncio.Event) -> None:
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        expected = loop.time() + LAG_PROBE_INTERVAL
+        await asyncio.sleep(LAG_PROBE_INTERVAL)
+        samples.append(max(0.0, loop.time() - expected))
+
+
+async def _refresh(coordinator: Any) -> RefreshResult:
+    # Clear the restart-resistance marker so every call performs a scrape
+    coordinator.last_success = None
+    start = time.perf_counter()
+    try:
+        data = await coordinator._async_update_data()
+    except Exception as err:  # noqa: BLE001 - reported, not raised
+        return RefreshResult(
+            coordinator.teamname, time.perf_counter() - start, False, error=str(err)
+        )
+    coordinator.data = data
+    return RefreshResult(
+        coordinator.teamname,
+        time.perf_counter() - start,
+        True,
+        events=len((data or {}).get("events", [])),
+    )
+
+
+async def run_harness(
+    teams: int = 5,
+    refreshes: int = 1,
+    faults: Faults | None = None,
+    delay_scale: float = 0.0,
+    **site_options: Any,
+) -> HarnessReport:
+    """Refresh `teams` coordinators `refreshes` times against a stand-in."""
+    from custom_components.kadermanager import coordinator as coordinator_module
+
+    sites = [TeamSite(f"team{idx}", **site_options) for idx in range(teams)]
+    server = StandinServer(sites, faults)
+    await server.start()
+
+    original_random = coordinator_module.random
+    coordinator_module.random = _ScaledRandom(delay_scale)  # type: ignore[assignment]
+    report = HarnessReport()
+    stop = asyncio.Event()
+    probe = asyncio.create_task(_probe_loop_lag(report.lag_samples, stop))
+    coordinators = [create_coordinator(server, site) for site in sites]
+    # All coordinators of one HA instance share the domain-wide scrape lock
+    shared_data: dict[str, Any] = {}
+    for coordinator in coordinators:
+        coordinator.hass.data = shared_data
+
+    try:
+        for _ in range(refreshes):
+            report.results.extend(
+                await asyncio.gather(*(_refresh(c) for c in coordinators))
+            )
+    finally:
+        stop.set()
+        await probe
+        coordinator_module.random = original_random  # type: ignore[assignment]
+        for coordinator in coordinators:
+            await coordinator.async_close()
+        await server.close()
+
+    for (_, endpoint), count in server.requests.items():
+        report.requests[endpoint] += count
+    report.statuses.update(server.statuses)
+    return report
+
+
+def main(argv: list[str] | None = None) -> None:
+    import tests.conftest  # noqa: F401 - installs the Home Assistant stubs
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--teams", type=int, default=5)
+    parser.add_argument("--refreshes", type=int, default=1)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-status", type=int, default=429)
+    parser.add_argument(
+        "--delay-scale",
+        type=float,
+        default=0.0,
+        help="factor applied to the coordinator's anti-bot sleeps (1.0 = real)",
+    )
+    parser.add_argument("--private", action="store_true")
+    args = parser.parse_args(argv)
+
+    faults = Faults(
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+    )
+    site_options: dict[str, Any] = {}
+    if args.private:
+        site_options = {"private": True, "username": "user", "password": "secret"}
+    report = asyncio.run(
+        run_harness(
+            args.teams, args.refreshes, faults, args.delay_scale, **site_options
+        )
+    )
+    print(report.format())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""Capture a refresh into a cassette and replay it offline.
+
+Usage (the Home Assistant test stubs from ``tests/conftest.py`` are used):
+
+    # Capture one refresh of a real club (uses the normal anti-bot pacing)
+    python -m tests.standin.replay record myclub.json.gz --team myclub \\
+        --username me --password secret
+
+    # Capture from the local stand-in instead
+    python -m tests.standin.replay record bigclub.json.gz --standin
+
+    # Replay without network access, optionally with the recorded timings
+    python -m tests.standin.replay replay myclub.json.gz --refreshes 20 --profile
+
+Cassettes contain no credentials or player names, see
+``custom_components/kadermanager/cassette.py``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import cProfile
+import pstats
+import time
+from typing import Any
+from unittest.mock import MagicMock
+
+from yarl import URL
+
+from tests.standin.harness import _ScaledRandom, create_coordinator
+from tests.standin.server import StandinServer, TeamSite
+
+
+def _coordinator(teamname: str, username: str | None, password: str | None):
+    from custom_components.kadermanager.coordinator import (
+        KadermanagerDataUpdateCoordinator,
+    )
+
+    hass = MagicMock()
+    hass.data = {}
+    entry = MagicMock()
+    entry.data = {"teamname": teamname, "username": username, "password": password}
+    entry.options = {"fetch_player_info": True, "fetch_comments": True}
+    return KadermanagerDataUpdateCoordinator(hass, entry)
+
+
+async def record_standin(**site_options: Any):
+    """Return a cassette with one refresh of a stand-in team."""
+    from custom_components.kadermanager.cassette import Cassette
+    from custom_components.kadermanager import coordinator as coordinator_module
+
+    site = TeamSite("bigclub", **site_options)
+    server = StandinServer([site])
+    await server.start()
+    cassette = Cassette()
+    coordinator = create_coordinator(server, site)
+    await coordinator.async_use_cassette(cassette)
+    original_random = coordinator_module.random
+    coordinator_module.random = _ScaledRandom(0.0)  # type: ignore[assignment]
+    try:
+        await coordinator._async_scrape_data()
+    finally:
+        coordinator_module.random = original_random  # type: ignore[assignment]
+        await coordinator.async_close()
+        await server.close()
+    return cassette
+
+
+async def record_live(teamname: str, username: str | None, password: str | None):
+    """Return a cassette with one refresh of a real club."""
+    from custom_components.kadermanager.cassette import Cassette
+
+    cassette = Cassette()
+    coordinator = _coordinator(teamname, username, password)
+    await coordinator.async_use_cassette(cassette)
+    try:
+        await coordinator._async_scrape_data()
+    finally:
+        await coordinator.async_close()
+    return cassette
+
+
+async def replay(
+    cassette, refreshes: int = 1, realtime: bool = False
+) -> tuple[list[float], dict[str, Any]]:
+    """Replay `refreshes` refreshes, return their durations and the last data."""
+    from custom_components.kadermanager import coordinator as coordinator_module
+
+    first = URL(cassette.interactions[0]["url"])
+    has_login = any(i["method"] == "POST" for i in cassette.interactions)
+    credentials = ("replay", "replay") if has_login else (None, None)
+    coordinator = _coordinator(first.host.split(".")[0], *credentials)
+    coordinator.team_url = str(first.origin())
+    await coordinator.async_use_cassette(cassette, replay=True, realtime=realtime)
+
+    original_random = coordinator_module.random
+    coordinator_module.random = _ScaledRandom(0.0)  # type: ignore[assignment]
+    durations = []
+    try:
+        for _ in range(refreshes):
+            # Drop the previous result so every refresh fetches all details
+            coordinator.data = {}
+            start = time.perf_counter()
+            coordinator.data = await coordinator._async_scrape_data()
+            durations.append(time.perf_counter() - start)
+    finally:
+        coordinator_module.random = original_random  # type: ignore[assignment]
+        await coordinator.async_close()
+    return durations, coordinator.data
+
+
+def main(argv: list[str] | None = None) -> None:
+    import tests.conftest  # noqa: F401 - installs the Home Assistant stubs
+    from custom_components.kadermanager.cassette import Cassette
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    record_parser = commands.add_parser("record")
+    record_parser.add_argument("cassette")
+    record_parser.add_argument("--standin", action="store_true")
+    record_parser.add_argument("--team")
+    record_parser.add_argument("--username")
+    record_parser.add_argument("--password")
+    replay_parser = commands.add_parser("replay")
+    replay_parser.add_argument("cassette")
+    replay_parser.add_argument("--refreshes", type=int, default=1)
+    replay_parser.add_argument("--realtime", action="store_true")
+    replay_parser.add_argument("--profile", action="store_true")
+    args = parser.parse_args(argv)
+
+    if args.command == "record":
+        if args.standin:
+            cassette = asyncio.run(record_standin())
+        elif args.team:
+            cassette = asyncio.run(record_live(args.team, args.username, args.password))
+        else:
+            parser.error("record needs --team or --standin")
+        cassette.save(args.cassette)
+        print(f"recorded {len(cassette.interactions)} responses to {args.cassette}")
+        return
+
+    cassette = Cassette.load(args.cassette)
+    profiler = cProfile.Profile() if args.profile else None
+    if profiler:
+        profiler.enable()
+    durations, _ = asyncio.run(replay(cassette, args.refreshes, args.realtime))
+    if profiler:
+        profiler.disable()
+        pstats.Stats(profiler).sort_stats("cumulative").print_stats(25)
+    print(
+        f"replayed {len(durations)} refreshes: "
+        f"min {min(durations):.3f}s, max {max(durations):.3f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
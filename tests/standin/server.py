@@ -0,0 +1,249 @@
+"""Local stand-in for kadermanager.de team sites.
+
+The server emulates everything the coordinator talks to: team subdomains
+(routed by the ``Host`` header), the CSRF login flow, ``/calendar/ical``, both
+widgets, ``/events``, the home page and event detail pages. Latency, error
+statuses and session expiry can be injected, and every response carries an
+ETag so conditional requests are answered with ``304``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import random
+import secrets
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Iterable
+
+from aiohttp import web
+
+from tests.benchmarks import generator
+
+DOMAIN_SUFFIX = "kadermanager.test"
+SESSION_COOKIE = "_kadermanager_session"
+
+# Endpoints that redirect to the login page for private teams
+PROTECTED = {"ical", "widget_events", "widget_messages", "events", "detail"}
+
+
+def endpoint_for(path: str) -> str:
+    """Classify a request path like the integration's request counters do."""
+    if path == "/calendar/ical":
+        return "ical"
+    if path == "/calendar/widget_iframe_events":
+        return "widget_events"
+    if path == "/messages/widget_iframe_messages":
+        return "widget_messages"
+    if path == "/events":
+        return "events"
+    if path.startswith("/events/"):
+        return "detail"
+    if path.startswith("/sessions"):
+        return "login"
+    if path == "/":
+        return "home"
+    return "other"
+
+
+@dataclass
+class TeamSite:
+    """Content and credentials of one emulated team."""
+
+    name: str
+    historical: int = 200
+    upcoming: int = 20
+    players: int = 30
+    messages: int = 50
+    username: str | None = None
+    password: str | None = None
+    private: bool = False
+    now: datetime = datetime(2024, 1, 1, 12, 0)
+    _pages: dict[str, str] = field(default_factory=dict, repr=False)
+
+    def __post_init__(self) -> None:
+        self.events = generator.events(self.historical, self.upcoming, now=self.now)
+        self.upcoming_events = [e for e in self.events if e["start"] >= self.now]
+
+    def page(self, endpoint: str, team_url: str) -> str:
+        """Return (and cache) the body for an endpoint."""
+        if endpoint not in self._pages:
+            builders = {
+                "ical": lambda: generator.ical_feed(self.events, team_url),
+                "widget_events": lambda: generator.events_widget(self.upcoming_events),
+                "widget_messages": lambda: generator.messages_widget(self.messages),
+                "events": lambda: generator.events_page(self.upcoming_events),
+                "home": lambda: generator.home_page(
+                    self.upcoming_events, self.messages, team_url
+                ),
+                "detail": lambda: generator.detail_page(self.players),
+            }
+            self._pages[endpoint] = builders[endpoint]()
+        return self._pages[endpoint]
+
+
+@dataclass
+class Faults:
+    """Latency and failure injection settings."""
+
+    latency: float = 0.0
+    jitter: float = 0.0
+    # Probability of answering any request with `error_status`
+    error_rate: float = 0.0
+    error_status: int = 429
+    # Fixed statuses per endpoint, e.g. {"widget_messages": 404}
+    endpoint_status: dict[str, int] = field(default_factory=dict)
+    # Probability that a logged-in session expires on a request
+    session_expiry_rate: float = 0.0
+
+
+class StandinServer:
+    """aiohttp application serving any number of emulated team sites."""
+
+    def __init__(
+        self, teams: Iterable[TeamSite], faults: Faults | None = None, seed: int = 0
+    ) -> None:
+        self.teams = {team.name.lower(): team for team in teams}
+        self.faults = faults or Faults()
+        self.requests: Counter[tuple[str, str]] = Counter()
+        self.statuses: Counter[int] = Counter()
+        self._sessions: dict[str, dict[str, object]] = {}
+        self._rng = random.Random(seed)
+        self._runner: web.AppRunner | None = None
+        self.port = 0
+
+        self.app = web.Application(middlewares=[self._middleware])
+        self.app.router.add_get("/sessions/new", self._login_form)
+        self.app.router.add_post("/sessions", self._login)
+        self.app.router.add_get("/{tail:.*}", self._content)
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> None:
+        """Start listening, a free port is picked when `port` is 0."""
+        self._runner = web.AppRunner(self.app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]  # type: ignore[union-attr]
+
+    async def close(self) -> None:
+        """Stop the server."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+    def team_url(self, name: str) -> str:
+        """Return the base URL the coordinator should use for a team."""
+        return f"http://{name.lower()}.{DOMAIN_SUFFIX}:{self.port}"
+
+    def request_count(self, team: str | None = None) -> int:
+        """Return the number of requests received (optionally for one team)."""
+        return sum(
+            count
+            for (name, _), count in self.requests.items()
+            if team is None or name == team.lower()
+        )
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler):
+        team = self._team(request)
+        endpoint = endpoint_for(request.path)
+        self.requests[(team.name if team else "?", endpoint)] += 1
+
+        faults = self.faults
+        if faults.latency or faults.jitter:
+            await asyncio.sleep(faults.latency + self._rng.uniform(0, faults.jitter))
+
+        if team is None:
+            response: web.StreamResponse = web.Response(status=404)
+        elif endpoint in faults.endpoint_status:
+            response = web.Response(status=faults.endpoint_status[endpoint])
+        elif faults.error_rate and self._rng.random() < faults.error_rate:
+            response = web.Response(status=faults.error_status)
+        else:
+            response = await handler(request)
+        self.statuses[response.status] += 1
+        return response
+
+    def _team(self, request: web.Request) -> TeamSite | None:
+        host = (request.host or "").split(":")[0]
+        return self.teams.get(host.split(".")[0].lower())
+
+    def _session(self, request: web.Request) -> tuple[str, dict[str, object]]:
+        token = request.cookies.get(SESSION_COOKIE)
+        if token is None or token not in self._sessions:
+            token = secrets.token_hex(16)
+            self._sessions[token] = {"csrf": secrets.token_hex(16), "user": None}
+        return token, self._sessions[token]
+
+    async def _login_form(self, request: web.Request) -> web.Response:
+        token, session = self._session(request)
+        body = (
+            "<html><head>"
+            f'<meta name="csrf-token" content="{session["csrf"]}"></head><body>'
+            '<form id="login_form" action="/sessions" method="post">'
+            f'<input type="hidden" name="authenticity_token" value="{session["csrf"]}">'
+            '<input name="login_name"><input name="password" type="password">'
+            "</form></body></html>"
+        )
+        response = web.Response(text=body, content_type="text/html")
+        response.set_cookie(SESSION_COOKIE, token)
+        return response
+
+    async def _login(self, request: web.Request) -> web.Response:
+        team = self._team(request)
+        assert team is not None
+        token, session = self._session(request)
+        form = await request.post()
+        if (
+            form.get("authenticity_token") == session["csrf"]
+            and form.get("login_name") == team.username
+            and form.get("password") == team.password
+        ):
+            session["user"] = team.name
+            raise web.HTTPFound("/")
+        # The login name is filled in again, the password is not
+        return web.Response(
+            text=(
+                "<html><body>Anmeldung fehlgeschlagen"
+                '<form id="login_form" action="/sessions" method="post">'
+                f'<input name="login_name" value="{form.get("login_name", "")}">'
+                '<input name="password" type="password"></form></body></html>'
+            ),
+            content_type="text/html",
+        )
+
+    async def _content(self, request: web.Request) -> web.Response:
+        team = self._team(request)
+        assert team is not None
+        endpoint = endpoint_for(request.path)
+        if endpoint == "other":
+            return web.Response(status=404)
+
+        _, session = self._session(request)
+        if (
+            session["user"] is not None
+            and self.faults.session_expiry_rate
+            and self._rng.random() < self.faults.session_expiry_rate
+        ):
+            session["user"] = None
+        if team.private and endpoint in PROTECTED and session["user"] != team.name:
+            raise web.HTTPFound("/sessions/new")
+
+        body = team.page(endpoint, self.team_url(team.name))
+        if session["user"] is not None and endpoint != "ical":
+            # Like the real site, logged-in pages show who is logged in
+            body = body.replace(
+                "<body>", f'<body><div id="current_user">{team.username}</div>', 1
+            )
+        etag = '"' + hashlib.sha1(body.encode()).hexdigest() + '"'
+        if request.headers.get("If-None-Match") == etag:
+            return web.Response(status=304, headers={"ETag": etag})
+
+        content_type = "text/calendar" if endpoint == "ical" else "text/html"
+        return web.Response(
+            text=body,
+            content_type=content_type,
+            charset="utf-8",
+            headers={"ETag": etag},
+        )
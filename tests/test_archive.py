@@ -0,0 +1,94 @@
+import sqlite3
+from datetime import datetime, timedelta, timezone
+
+from homeassistant.util import dt as dt_util
+
+from custom_components.kadermanager import coordinator as coordinator_module
+from custom_components.kadermanager.archive import SeasonArchive
+from custom_components.kadermanager.models import KadermanagerEvent, TeamRoster
+from tests.standin.harness import _ScaledRandom, create_coordinator
+from tests.standin.server import StandinServer, TeamSite
+
+
+def _event(idx, event_type="Training", in_count=10):
+    day = datetime(2023, 9, 1) + timedelta(days=idx)
+    return KadermanagerEvent(
+        uid=f"event-{idx}",
+        title=f"{event_type} {idx}",
+        type=event_type,
+        link=f"https://a.kadermanager.de/events/{idx}",
+        date=day.strftime("%Y-%m-%d"),
+        time="19:00",
+        original_date=day.strftime("%d.%m.%Y 19:00"),
+        in_count=in_count,
+    )
+
+
+def test_upsert_keeps_the_latest_snapshot(tmp_path):
+    archive = SeasonArchive(None, str(tmp_path / "archive.db"), "team")
+    roster = TeamRoster()
+    events = [_event(idx, "Spiel" if idx % 3 else "Training") for idx in range(90)]
+    events[0].players = roster.encode(
+        {"accepted_players": ["Anna", "Ben"], "declined_players": ["Cem"]}
+    )
+    assert archive.upsert(events, roster) == 90
+
+    # A later snapshot without players updates the count, the players stay
+    update = _event(0, in_count=12)
+    archive.upsert([update], roster)
+    start = datetime(2023, 9, 1, tzinfo=timezone.utc)
+    (first,) = archive.between(start, start + timedelta(days=1))
+    assert first.in_count == 12
+    connection = sqlite3.connect(archive.path)
+    (players,) = connection.execute("SELECT players FROM events WHERE uid = 'event-0'")
+    # Names are stored once, the events refer to them by ID
+    assert '"declined_players": [3]' in players[0]
+    plan = " ".join(
+        row[-1]
+        for row in connection.execute(
+            "EXPLAIN QUERY PLAN SELECT uid FROM events"
+            " WHERE team = 'team' AND start >= '2023' AND start < '2024'"
+        )
+    )
+    connection.close()
+    assert "events_team_start" in plan
+
+    october = archive.between(
+        datetime(2023, 10, 1, tzinfo=timezone.utc),
+        datetime(2023, 11, 1, tzinfo=timezone.utc),
+    )
+    assert [e.date[:7] for e in october] == ["2023-10"] * 31
+    assert len(archive.between(start, start + timedelta(days=30), "Training")) == 10
+    assert len(archive.between(start, start + timedelta(days=90), limit=5)) == 5
+    assert archive.stats() == {
+        "events": 90,
+        "first": "2023-09-01",
+        "last": "2023-11-29",
+    }
+
+
+async def test_passed_events_move_to_the_archive(monkeypatch):
+    site = TeamSite("archive", historical=5, players=3)
+    server = StandinServer([site])
+    await server.start()
+    coordinator = create_coordinator(server, site)
+    monkeypatch.setattr(coordinator_module, "random", _ScaledRandom(0.0))
+    try:
+        coordinator.data = await coordinator._async_update_data()
+        first = coordinator.data["events"][0]
+        tomorrow = dt_util.now() + timedelta(days=1)
+        monkeypatch.setattr(dt_util, "now", lambda: tomorrow)
+        coordinator.last_success = None
+        coordinator.data = await coordinator._async_update_data()
+    finally:
+        await coordinator.async_close()
+        await server.close()
+
+    assert first.uid not in {e.uid for e in coordinator.season_events()}
+    stats = await coordinator.archive.async_stats()
+    assert stats["events"] >= 1
+    window = (first.start - timedelta(hours=1), tomorrow)
+    events = await coordinator.async_events_between(*window)
+    (archived,) = [e for e in events if e.uid == first.uid]
+    assert archived.in_count == first.in_count
+    assert archived.start == first.start
@@ -0,0 +1,67 @@
+from custom_components.kadermanager import coordinator as coordinator_module
+from tests.standin.harness import _ScaledRandom, create_coordinator
+from tests.standin.server import StandinServer, TeamSite
+
+
+async def test_poll_fetches_details_only_for_changed_counts(monkeypatch):
+    site = TeamSite("attendance", historical=5, players=3)
+    server = StandinServer([site])
+    await server.start()
+    # Without player lists the detail pages do not overwrite the counts
+    coordinator = create_coordinator(
+        server, site, fetch_player_info=False, attendance_interval=5
+    )
+    monkeypatch.setattr(coordinator_module, "random", _ScaledRandom(0.0))
+    updates = []
+    monkeypatch.setattr(
+        coordinator, "async_update_listeners", lambda: updates.append(True)
+    )
+
+    def requests(endpoint):
+        return server.requests[("attendance", endpoint)]
+
+    try:
+        assert coordinator.attendance_interval == 15
+        coordinator.data = await coordinator._async_scrape_data()
+        assert requests("detail") == 5
+
+        await coordinator.async_poll_attendance()
+        assert requests("widget_events") == 2
+        assert requests("detail") == 5
+        assert coordinator.last_attendance_poll["changed"] == 0
+        assert not updates
+
+        # One more player signed up for the second event
+        site.upcoming_events[1]["in_count"] += 1
+        site._pages.pop("widget_events")
+        await coordinator.async_poll_attendance()
+    finally:
+        await coordinator.async_close()
+        await server.close()
+
+    assert requests("widget_events") == 3
+    assert requests("detail") == 6
+    assert requests("ical") == requests("widget_messages") == 1
+    changed = site.upcoming_events[1]
+    uid = f"event-{changed['id']}@"
+    (event,) = [e for e in coordinator.data["events"] if e.uid.startswith(uid)]
+    assert event.in_count == changed["in_count"]
+    assert coordinator.last_attendance_poll["details_fetched"] == 1
+    assert updates == [True]
+
+
+async def test_poll_waits_for_the_first_update(monkeypatch):
+    site = TeamSite("attendance", historical=5, players=3)
+    server = StandinServer([site])
+    await server.start()
+    coordinator = create_coordinator(server, site, attendance_interval=30)
+    monkeypatch.setattr(coordinator_module, "random", _ScaledRandom(0.0))
+    try:
+        coordinator.data = None
+        await coordinator.async_poll_attendance()
+    finally:
+        await coordinator.async_close()
+        await server.close()
+
+    assert server.request_count() == 0
+    assert coordinator.last_attendance_poll is None
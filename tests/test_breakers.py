@@ -0,0 +1,117 @@
+from datetime import timedelta
+from unittest.mock import MagicMock
+
+import aiohttp
+import pytest
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from custom_components.kadermanager import coordinator as coordinator_module
+from custom_components.kadermanager.breakers import (
+    BREAKER_COOLDOWN,
+    STATE_CLOSED,
+    STATE_HALF_OPEN,
+    STATE_OPEN,
+    CircuitBreakers,
+    EndpointUnavailable,
+)
+from custom_components.kadermanager.pipeline import Request, Response
+from tests.standin.harness import _ScaledRandom, create_coordinator
+from tests.standin.server import Faults, StandinServer, TeamSite
+
+URL = "https://a.kadermanager.de/messages/widget_iframe_messages"
+
+
+def _failing(status):
+    async def handler(request):
+        raise aiohttp.ClientResponseError(MagicMock(), (), status=status)
+
+    return handler
+
+
+async def _ok(request):
+    return Response(request.url, 200, b"ok", {})
+
+
+async def _call(breakers, handler):
+    return await breakers(Request("GET", URL), handler)
+
+
+async def test_opens_after_repeated_failures_and_half_opens(monkeypatch):
+    breakers = CircuitBreakers(MagicMock(), "breakers")
+    for _ in range(3):
+        with pytest.raises(aiohttp.ClientResponseError):
+            await _call(breakers, _failing(404))
+
+    assert breakers.state("widget_messages") == STATE_OPEN
+    with pytest.raises(EndpointUnavailable):
+        await _call(breakers, _ok)
+
+    later = dt_util.now() + BREAKER_COOLDOWN + timedelta(minutes=1)
+    monkeypatch.setattr(dt_util, "now", lambda: later)
+    assert breakers.state("widget_messages") == STATE_HALF_OPEN
+    # A failed probe opens the breaker again, for twice as long
+    with pytest.raises(aiohttp.ClientResponseError):
+        await _call(breakers, _failing(500))
+    assert breakers.state("widget_messages") == STATE_OPEN
+    reopen = dt_util.parse_datetime(breakers.as_dict()["widget_messages"]["open_until"])
+    assert reopen - later == BREAKER_COOLDOWN * 2
+
+    monkeypatch.setattr(dt_util, "now", lambda: reopen)
+    await _call(breakers, _ok)
+    assert breakers.state("widget_messages") == STATE_CLOSED
+    assert breakers.as_dict() == {}
+
+
+async def test_blocks_are_not_counted():
+    breakers = CircuitBreakers(MagicMock(), "breakers")
+    for _ in range(5):
+        with pytest.raises(aiohttp.ClientResponseError):
+            await _call(breakers, _failing(429))
+
+    assert breakers.state("widget_messages") == STATE_CLOSED
+
+
+async def test_state_is_persisted():
+    Store.disk.clear()
+    breakers = CircuitBreakers(MagicMock(), "persisted")
+    for _ in range(3):
+        breakers.record_failure("widget_events")
+    await breakers.async_save()
+
+    restored = CircuitBreakers(MagicMock(), "persisted")
+    await restored.async_load()
+
+    assert restored.state("widget_events") == STATE_OPEN
+    assert not restored.allows(
+        "https://a.kadermanager.de/calendar/widget_iframe_events"
+    )
+
+
+async def test_refresh_skips_dead_endpoint(monkeypatch):
+    Store.disk.clear()
+    site = TeamSite("nowidgets", historical=5, players=3)
+    server = StandinServer(
+        [site], faults=Faults(endpoint_status={"widget_messages": 404})
+    )
+    await server.start()
+    coordinator = create_coordinator(server, site)
+    monkeypatch.setattr(coordinator_module, "random", _ScaledRandom(0.0))
+    try:
+        for _ in range(4):
+            data = await coordinator._async_scrape_data()
+    finally:
+        await coordinator.async_close()
+        await server.close()
+
+    assert server.requests[("nowidgets", "widget_messages")] == 3
+    assert server.requests[("nowidgets", "ical")] == 4
+    assert "general_comments" not in data
+    assert len(data["events"]) == 5
+    assert coordinator.pipeline.as_dict()["circuit_breakers"] == {
+        "widget_messages": {
+            "state": STATE_OPEN,
+            "failures": 3,
+            "open_until": (dt_util.now() + BREAKER_COOLDOWN).isoformat(),
+        }
+    }
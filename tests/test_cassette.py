@@ -0,0 +1,81 @@
+import gzip
+
+from custom_components.kadermanager.cassette import Cassette, Redactor, ReplaySession
+from tests.benchmarks import generator
+from tests.standin.replay import record_standin, replay
+
+
+def test_redactor_uses_stable_pseudonyms():
+    redactor = Redactor()
+    body = generator.detail_page(players=4, comments=3)
+    names = generator.player_names(4)
+
+    redacted = redactor.body(body)
+
+    assert not any(name in redacted for name in names)
+    assert redactor.body(body) == redacted
+    assert 'name="csrf-token" content="**REDACTED**"' in redacted
+
+
+def test_redactor_removes_credentials():
+    redactor = Redactor(["coach", "hunter2"])
+    body = (
+        '<div id="current_user">coach</div><p>trainer@club.example</p>'
+        '<input name="login_name" value="coach2"><input name="password">'
+    )
+
+    redacted = redactor.body(body)
+
+    assert "coach" not in redacted
+    assert "trainer@club.example" not in redacted
+    assert '<input name="login_name" value="**REDACTED**">' in redacted
+
+
+async def test_record_private_team_without_credentials(tmp_path):
+    cassette = await record_standin(
+        private=True, username="coach", password="hunter2", players=10
+    )
+    path = tmp_path / "club.json.gz"
+    cassette.save(str(path))
+    raw = gzip.decompress(path.read_bytes()).decode()
+
+    assert "hunter2" not in raw
+    assert "coach" not in raw
+    # Logged-in pages show the username, it is redacted there as well
+    bodies = [i["body"] or "" for i in cassette.interactions]
+    assert any('<div id="current_user">**REDACTED**</div>' in b for b in bodies)
+    assert not any(
+        "Set-Cookie" in i["headers"] or "Cookie" in i["headers"]
+        for i in cassette.interactions
+    )
+    assert "_kadermanager_session" not in raw
+    assert not any(name in raw for name in generator.player_names(10))
+    login = [i for i in cassette.interactions if i["method"] == "POST"]
+    assert login[0]["form"] == ["authenticity_token", "login_name", "password"]
+
+
+async def test_replay_matches_recording(tmp_path):
+    path = tmp_path / "club.json.gz"
+    (await record_standin(players=10)).save(str(path))
+
+    # The stand-in is gone, every response comes from the cassette
+    durations, data = await replay(Cassette.load(str(path)), refreshes=2)
+
+    assert len(durations) == 2
+    assert len(data["events"]) == 5
+    assert all(event.players for event in data["events"])
+    assert sum(len(ids) for ids in data["events"][0].players.values()) == 10
+    assert data["general_comments"][0]["author"].startswith("Spieler ")
+
+
+async def test_replay_session_serves_last_response_again():
+    cassette = Cassette()
+    cassette.record("GET", "https://a/x", 200, "https://a/x", {}, "one", 0.1)
+    session = ReplaySession(cassette)
+
+    for _ in range(2):
+        async with session.get("https://a/x") as resp:
+            assert await resp.text() == "one"
+    async with session.get("https://a/missing") as resp:
+        assert resp.status == 404
+    assert session.misses == ["https://a/missing"]
@@ -0,0 +1,57 @@
+import pytest
+
+from custom_components.kadermanager import coordinator as coordinator_module
+from custom_components.kadermanager.demand import (
+    ALL_FIELDS,
+    FIELD_EVENTS,
+    FIELD_IN_COUNT,
+    DataDemand,
+    FetchNeeds,
+)
+from tests.standin.harness import _ScaledRandom, create_coordinator
+from tests.standin.server import StandinServer, TeamSite
+
+
+def test_options_apply_until_entities_registered():
+    demand = DataDemand()
+    unregister = demand.register("sensor", ALL_FIELDS)
+    demand.register("calendar", (FIELD_EVENTS, FIELD_IN_COUNT))
+
+    assert demand.needs(True, False) == FetchNeeds(True, True, False, False)
+    demand.ready = True
+    assert demand.needs(True, True) == FetchNeeds(True, True, True, True)
+
+    unregister()
+    assert demand.needs(True, True) == FetchNeeds(True, False, False, False)
+    assert demand.as_dict()["consumers"] == {"calendar": ["events", "in_count"]}
+
+
+@pytest.mark.parametrize(
+    ("fields", "options", "expected"),
+    [
+        # The messages widget is not requested without comments
+        (ALL_FIELDS, {"fetch_comments": False}, {"widget_events", "detail"}),
+        # Only the calendar is enabled: no details, no messages
+        ((FIELD_EVENTS, FIELD_IN_COUNT), {}, {"widget_events"}),
+        ((), {}, set()),
+    ],
+)
+async def test_refresh_requests_only_demanded_pages(
+    monkeypatch, fields, options, expected
+):
+    site = TeamSite("demand", historical=5, players=3)
+    server = StandinServer([site])
+    await server.start()
+    coordinator = create_coordinator(server, site, **options)
+    coordinator.demand.register("entity", fields)
+    coordinator.demand.ready = True
+    monkeypatch.setattr(coordinator_module, "random", _ScaledRandom(0.0))
+    try:
+        data = await coordinator._async_scrape_data()
+    finally:
+        await coordinator.async_close()
+        await server.close()
+
+    requested = {endpoint for (_, endpoint) in server.requests}
+    assert requested == {"ical", *expected}
+    assert len(data["events"]) == 5
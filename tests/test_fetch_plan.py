@@ -0,0 +1,65 @@
+from datetime import timedelta
+
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from custom_components.kadermanager import coordinator as coordinator_module
+from custom_components.kadermanager.fetch_plan import (
+    PLAN_ICAL,
+    PLAN_REPROBE_INTERVAL,
+    PLAN_SCRAPE,
+    FetchPlan,
+)
+from tests.standin.harness import _ScaledRandom, create_coordinator
+from tests.standin.server import Faults, StandinServer, TeamSite
+
+
+def test_plan_round_trip():
+    now = dt_util.now()
+    plan = FetchPlan()
+    assert plan.try_ical(now)
+
+    plan.record_scrape(now, tried_ical=True)
+    restored = FetchPlan.from_dict(plan.as_dict())
+
+    assert restored.path == PLAN_SCRAPE
+    assert not restored.try_ical(now + timedelta(hours=1))
+    assert restored.try_ical(now + PLAN_REPROBE_INTERVAL)
+    restored.record_ical()
+    assert restored.as_dict() == {"path": PLAN_ICAL, "ical_failed": None}
+
+
+async def test_team_without_ical_is_scraped_directly(monkeypatch):
+    Store.disk.clear()
+    site = TeamSite("noical", historical=5, players=3)
+    server = StandinServer([site], faults=Faults(endpoint_status={"ical": 404}))
+    await server.start()
+    coordinator = create_coordinator(server, site, fetch_comments=False)
+    restarted = create_coordinator(server, site, fetch_comments=False)
+    monkeypatch.setattr(coordinator_module, "random", _ScaledRandom(0.0))
+    start = dt_util.now()
+
+    def requests(endpoint):
+        return server.requests[("noical", endpoint)]
+
+    try:
+        for _ in range(2):
+            coordinator.last_success = None
+            coordinator.data = await coordinator._async_update_data()
+        assert requests("ical") == 1
+        assert requests("events") == 2
+        assert requests("widget_events") == requests("widget_messages") == 0
+        assert coordinator.data["fetch_plan"]["path"] == PLAN_SCRAPE
+
+        # The plan survives a restart and iCal is probed again a day later
+        await restarted.async_load_cache()
+        assert restarted.fetch_plan.path == PLAN_SCRAPE
+        later = start + PLAN_REPROBE_INTERVAL
+        monkeypatch.setattr(dt_util, "now", lambda: later)
+        await restarted._async_scrape_data()
+        assert requests("ical") == 2
+        assert restarted.fetch_plan.ical_failed == later
+    finally:
+        await coordinator.async_close()
+        await restarted.async_close()
+        await server.close()
@@ -0,0 +1,96 @@
+import sys
+from array import array
+
+import pytest
+
+from custom_components.kadermanager import coordinator as coordinator_module
+from custom_components.kadermanager.footprint import deep_sizeof, memory_report
+from custom_components.kadermanager.models import KadermanagerEvent
+from custom_components.kadermanager.profiling import async_trace_refresh_memory
+from custom_components.kadermanager.sensor import event_attributes
+from tests.standin.harness import _ScaledRandom, create_coordinator
+from tests.standin.server import StandinServer, TeamSite
+
+
+def test_deep_sizeof_counts_shared_objects_once():
+    name = "Anna Müller " * 10
+    single = deep_sizeof([name])
+    shared = deep_sizeof([name, name])
+
+    assert shared == single + 8
+    ids = array("H", range(100))
+    assert deep_sizeof({"ids": ids}) >= sys.getsizeof(ids)
+
+
+def test_deep_sizeof_follows_slots():
+    event = KadermanagerEvent(
+        title="Training " * 50,
+        link="https://a.kadermanager.de/events/1",
+        date="2024-01-02",
+        time="19:00",
+        original_date="02.01.2024 19:00",
+    )
+    assert deep_sizeof(event) > sys.getsizeof(event) + len(event.title)
+
+
+async def _refreshed(monkeypatch, **options):
+    site = TeamSite("footprint", historical=20, players=30, messages=20)
+    server = StandinServer([site])
+    await server.start()
+    coordinator = create_coordinator(server, site, **options)
+    monkeypatch.setattr(coordinator_module, "random", _ScaledRandom(0.0))
+
+    async def async_refresh():
+        coordinator.data = await coordinator._async_update_data()
+        coordinator.last_update_success = True
+
+    coordinator.async_refresh = async_refresh
+    return coordinator, server
+
+
+@pytest.mark.parametrize("fetch_details", [True, False])
+async def test_memory_report_reflects_options(monkeypatch, fetch_details):
+    coordinator, server = await _refreshed(
+        monkeypatch, fetch_player_info=fetch_details, fetch_comments=fetch_details
+    )
+    try:
+        await coordinator.async_refresh()
+    finally:
+        await coordinator.async_close()
+        await server.close()
+
+    report = memory_report(coordinator, event_attributes(coordinator))
+    data_bytes = report["coordinator_data_bytes"]
+    attribute_bytes = report["sensor_attributes_json_bytes"]
+
+    assert report["event_count"] == 5
+    assert report["options"]["fetch_player_info"] is fetch_details
+    assert data_bytes["events"] > 0
+    assert 0 < data_bytes["calendar_index"] < data_bytes["events"]
+    assert data_bytes["total"] == sum(
+        value for key, value in data_bytes.items() if key != "total"
+    )
+    assert report["store_json_bytes"]["core"] > 0
+    if fetch_details:
+        assert data_bytes["roster"] > 0
+        assert report["store_json_bytes"]["players"] > 100
+        assert attribute_bytes["players"] > 1000
+        assert attribute_bytes["comments"] > 1000
+    else:
+        assert len(coordinator.roster) == 0
+        assert attribute_bytes["general_comments"] == 2
+    assert attribute_bytes["total"] > attribute_bytes["players"]
+
+
+async def test_trace_refresh_memory(monkeypatch):
+    coordinator, server = await _refreshed(monkeypatch)
+    try:
+        trace = await async_trace_refresh_memory(coordinator, top=10)
+    finally:
+        await coordinator.async_close()
+        await server.close()
+
+    assert trace["refresh_succeeded"] is True
+    assert len(trace["top"]) == 10
+    assert all(":" in row["location"] for row in trace["top"])
+    assert coordinator.data["events"]
@@ -0,0 +1,111 @@
+import asyncio
+import os
+import time
+
+from custom_components.kadermanager import coordinator as coordinator_module
+from custom_components.kadermanager.instrumentation import (
+    LoopLagMonitor,
+    RefreshTimings,
+)
+from tests.standin.harness import _ScaledRandom, create_coordinator
+from tests.standin.server import StandinServer, TeamSite
+
+# Worst acceptable event-loop block of one refresh of a large club
+LOOP_LAG_BUDGET_MS = float(os.environ.get("KADERMANAGER_LOOP_LAG_BUDGET_MS", "1000"))
+
+
+async def test_monitor_attributes_lag_to_stage():
+    monitor = LoopLagMonitor(interval=0.005)
+    monitor.start()
+    await asyncio.sleep(0.02)
+    with monitor.stage("parse_ical"):
+        time.sleep(0.1)
+    await asyncio.sleep(0.02)
+    result = await monitor.stop()
+
+    assert result["max_ms"] >= 90
+    assert result["p95_ms"] <= result["max_ms"]
+    assert result["worst_stage"] == "parse_ical"
+    assert monitor.as_dict()["worst_refresh"] is result
+
+
+async def test_stop_without_start_returns_none():
+    assert await LoopLagMonitor().stop() is None
+
+
+async def test_large_club_refresh_stays_within_loop_lag_budget(monkeypatch):
+    site = TeamSite("bigclub", historical=5000, upcoming=40, players=60)
+    server = StandinServer([site])
+    await server.start()
+    coordinator = create_coordinator(server, site, monitor_loop_lag=True)
+    monkeypatch.setattr(coordinator_module, "random", _ScaledRandom(0.0))
+    try:
+        data = await coordinator._async_update_data()
+    finally:
+        await coordinator.async_close()
+        await server.close()
+
+    lag = coordinator.loop_lag.last
+    assert len(data["events"]) == 5
+    assert lag["samples"] > 0
+    assert lag["max_ms"] < LOOP_LAG_BUDGET_MS, (
+        f"refresh blocked the loop for {lag['max_ms']} ms in {lag['worst_stage']} "
+        f"(budget {LOOP_LAG_BUDGET_MS} ms)"
+    )
+
+
+def test_monitor_disabled_by_default():
+    server = StandinServer([TeamSite("small")])
+    coordinator = create_coordinator(server, TeamSite("small"))
+    assert coordinator.loop_lag is None
+
+
+def test_refresh_timings_ring_buffer():
+    timings = RefreshTimings(size=3)
+    for seconds in (1.0, 2.0, 3.0, 4.0):
+        timings.begin()
+        timings.add("fetch_ical", seconds)
+        timings.add("pacing", 0.5)
+        timings.add("pacing", 0.5)
+        timings.finish()
+    with timings.listeners():
+        pass
+    # Listener updates outside a refresh are not attributed to it
+    with timings.listeners():
+        time.sleep(0.01)
+
+    assert timings.refreshes == 3
+    assert timings.last["fetch_ical"] == 4.0
+    assert timings.last["pacing"] == 1.0
+    assert timings.last["listeners"] < 0.01
+    assert timings.percentiles("fetch_ical") == {"p50": 3.0, "p95": 3.9, "max": 4.0}
+    assert timings.as_dict()["rolling_seconds"]["login"]["max"] == 0.0
+
+
+def test_phase_outside_refresh_is_ignored():
+    timings = RefreshTimings()
+    with timings.phase("parse_ical"):
+        pass
+    timings.finish()
+
+    assert timings.last is None
+    assert timings.percentiles("total") is None
+
+
+async def test_refresh_records_phase_breakdown(monkeypatch):
+    site = TeamSite("phases", historical=50, players=10)
+    server = StandinServer([site])
+    await server.start()
+    coordinator = create_coordinator(server, site)
+    monkeypatch.setattr(coordinator_module, "random", _ScaledRandom(0.0))
+    try:
+        await coordinator._async_update_data()
+    finally:
+        await coordinator.async_close()
+        await server.close()
+
+    last = coordinator.timings.last
+    for phase in ("fetch_ical", "parse_ical", "fetch_widget_events", "fetch_details"):
+        assert last[phase] > 0, phase
+    assert last["fetch_events"] == 0
+    assert last["total"] >= last["fetch_ical"] + last["parse_ical"]
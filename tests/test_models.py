@@ -0,0 +1,146 @@
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+
+from custom_components.kadermanager.models import (
+    EventIndex,
+    KadermanagerEvent,
+    TeamRoster,
+)
+
+
+def _raw_event(idx, time="19:00"):
+    day = datetime(2024, 1, 1) + timedelta(days=idx % 365, hours=idx % 7)
+    return {
+        "title": f"Training {idx}",
+        "link": f"https://testteam.kadermanager.de/events/{idx}",
+        "location": "Halle A",
+        "type": "Training",
+        "date": day.strftime("%Y-%m-%d"),
+        "time": time,
+        "original_date": day.strftime("%d.%m.%Y ") + time,
+        "in_count": idx % 20,
+    }
+
+
+def test_aware_start_and_end():
+    event = KadermanagerEvent.from_dict(_raw_event(0))
+    assert event.start == datetime(2024, 1, 1, 19, 0, tzinfo=timezone.utc)
+    assert event.end == event.start + timedelta(hours=2)
+    assert not event.all_day
+    assert event.uid == "https://testteam.kadermanager.de/events/0"
+
+
+def test_all_day_event_is_kept_for_the_day():
+    event = KadermanagerEvent.from_dict(_raw_event(0, time="Unknown"))
+    assert event.all_day
+    assert not event.is_past(datetime(2024, 1, 1, 23, 0, tzinfo=timezone.utc))
+    assert event.is_past(datetime(2024, 1, 2, 1, 0, tzinfo=timezone.utc))
+
+
+def test_timed_event_past_after_grace():
+    event = KadermanagerEvent.from_dict(_raw_event(0))
+    assert not event.is_past(datetime(2024, 1, 1, 20, 0, tzinfo=timezone.utc))
+    assert event.is_past(datetime(2024, 1, 1, 20, 1, tzinfo=timezone.utc))
+
+
+def test_dict_round_trip():
+    raw = {**_raw_event(3), "uid": "abc@kadermanager", "comments": []}
+    event = KadermanagerEvent.from_dict(raw)
+    data = event.as_dict()
+    assert data["uid"] == "abc@kadermanager"
+    assert data["comments"] == []
+    assert "players" not in data
+    assert KadermanagerEvent.from_dict(data).start == event.start
+
+
+def test_event_index_range_includes_overlapping_events():
+    events = [KadermanagerEvent.from_dict(_raw_event(idx)) for idx in range(30)]
+    all_day = KadermanagerEvent.from_dict(_raw_event(3, time="Unknown"))
+    index = EventIndex(reversed([*events, all_day]))
+    start = datetime(2024, 1, 4, 0, 0, tzinfo=timezone.utc)
+    end = start + timedelta(days=3)
+
+    expected = [e for e in [all_day, *events] if e.start < end and e.end > start]
+    assert len(index) == 31
+    assert index.between(start, end) == sorted(expected, key=lambda e: e.start)
+    # Still running at the start of the range
+    assert index.between(events[5].start + timedelta(hours=1), end)[0] is events[5]
+
+
+def _legacy_pipeline(raw_events, now):
+    """The old per-stage string parsing, kept here as the comparison baseline."""
+    kept = []
+    for e in raw_events:
+        event_dt = datetime.strptime(f"{e['date']} {e['time']}", "%Y-%m-%d %H:%M")
+        if event_dt.replace(tzinfo=timezone.utc) + timedelta(hours=1) >= now:
+            kept.append(e)
+    kept.sort(key=lambda x: (x["date"], x.get("time", "00:00")))
+    for e in kept:  # dynamic interval
+        datetime.fromisoformat(f"{e['date']} {e['time']}")
+    for e in kept:  # calendar
+        datetime.strptime(f"{e['date']} {e['time']}", "%Y-%m-%d %H:%M").replace(
+            tzinfo=timezone.utc
+        )
+    return kept
+
+
+def _model_pipeline(raw_events, now):
+    events = [KadermanagerEvent.from_dict(e) for e in raw_events]
+    kept = [e for e in events if not e.is_past(now)]
+    kept.sort(key=lambda e: e.sort_key)
+    deltas = [e.start - now for e in kept]  # dynamic interval
+    assert deltas == sorted(deltas)
+    assert not [e for e in kept if e.start < now]  # calendar
+    return kept
+
+
+def test_model_memory_and_cpu_for_1000_events():
+    """Compare 1,000 plain dicts with 1,000 slotted events."""
+    raw = [_raw_event(idx) for idx in range(1000)]
+    now = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    tracemalloc.start()
+    dicts = [dict(e) for e in raw]
+    dict_mem = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    tracemalloc.start()
+    models = [KadermanagerEvent.from_dict(e) for e in raw]
+    model_mem = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    legacy = _legacy_pipeline(dicts, now)
+    legacy_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    modern = _model_pipeline(raw, now)
+    model_time = time.perf_counter() - start
+
+    print(
+        f"1000 events dict: {dict_mem / 1024:.0f} KiB / {legacy_time * 1000:.1f} ms, "
+        f"slotted: {model_mem / 1024:.0f} KiB / {model_time * 1000:.1f} ms"
+    )
+    assert len(legacy) == len(modern) == len(models)
+    assert model_mem < dict_mem
+
+
+def test_roster_interns_names_once():
+    roster = TeamRoster()
+    first = roster.encode({"accepted_players": ["A", "B"], "declined_players": ["C"]})
+    second = roster.encode({"accepted_players": ["C"], "no_response_players": ["A"]})
+
+    assert len(roster) == 3
+    assert list(first["accepted_players"]) == [0, 1]
+    assert list(second["accepted_players"]) == [2]
+    assert roster.expand(second) == {
+        "accepted_players": ["C"],
+        "declined_players": [],
+        "no_response_players": ["A"],
+    }
+    # Every event references the same interned string
+    assert (
+        roster.expand(first)["accepted_players"][0]
+        is roster.expand(second)["no_response_players"][0]
+    )
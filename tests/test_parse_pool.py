@@ -0,0 +1,117 @@
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from custom_components.kadermanager import coordinator as coordinator_module
+from custom_components.kadermanager.parse_pool import (
+    DATA_PARSE_POOL,
+    ParsePool,
+    async_acquire_parse_pool,
+    async_release_parse_pool,
+)
+from custom_components.kadermanager.parsers import make_soup
+from tests.benchmarks import generator
+from tests.standin.harness import _ScaledRandom, create_coordinator, install_stubs
+from tests.standin.server import StandinServer, TeamSite
+
+
+def _hass():
+    hass = MagicMock()
+    hass.data = {"kadermanager": {}}
+    hass.async_add_executor_job = lambda func, *args: (
+        asyncio.get_running_loop().run_in_executor(None, func, *args)
+    )
+    return hass
+
+
+@pytest.fixture
+async def pool():
+    pool = ParsePool(_hass(), workers=1, initializer=install_stubs)
+    yield pool
+    pool.shutdown()
+
+
+@pytest.fixture
+def coordinator_local():
+    hass = MagicMock()
+    entry = MagicMock()
+    entry.data = {"teamname": "team"}
+    entry.options = {}
+    return coordinator_module.KadermanagerDataUpdateCoordinator(hass, entry)
+
+
+async def test_pool_parses_like_the_coordinator(pool, coordinator_local):
+    detail = generator.detail_page(players=20, comments=8)
+    widget = generator.events_widget(generator.events(historical=0, upcoming=10))
+
+    players, comments = await pool.async_parse_detail(detail, "html.parser", True, True)
+    soup = make_soup(detail, "html.parser")
+    assert players == coordinator_local.parse_event_players(soup)
+    assert comments == coordinator_local.parse_event_comments(soup)
+    assert await pool.async_parse_detail(detail, "html.parser", False, True) == (
+        None,
+        comments,
+    )
+    assert await pool.async_parse_list(
+        "widget", widget
+    ) == coordinator_local._parse_widget_events(widget)
+
+
+async def test_pool_that_cannot_start_parses_locally():
+    # Without the test stubs the workers cannot import Home Assistant
+    pool = ParsePool(_hass(), workers=1)
+    assert await pool.async_parse_list("widget", "<div></div>") is None
+    assert pool.failed
+    assert not pool.running
+
+
+async def test_pool_is_shared_and_shut_down_after_last_entry(monkeypatch):
+    calls = []
+
+    def start(self):
+        calls.append("start")
+        self._executor = MagicMock()
+
+    monkeypatch.setattr(ParsePool, "start", start)
+    monkeypatch.setattr(ParsePool, "shutdown", lambda self: calls.append("stop"))
+    hass = _hass()
+
+    first = await async_acquire_parse_pool(hass, "a")
+    second = await async_acquire_parse_pool(hass, "b")
+    assert first is second
+    await async_release_parse_pool(hass, "a")
+    await async_release_parse_pool(hass, "unknown")
+    assert calls == ["start"]
+
+    await async_release_parse_pool(hass, "b")
+    assert calls == ["start", "stop"]
+    assert DATA_PARSE_POOL not in hass.data["kadermanager"]
+
+
+async def test_refresh_with_pool_matches_local_refresh(pool, monkeypatch):
+    site = TeamSite("pooled", historical=5, upcoming=6, players=12)
+    server = StandinServer([site])
+    await server.start()
+    monkeypatch.setattr(coordinator_module, "random", _ScaledRandom(0.0))
+    results = []
+    try:
+        for parse_pool in (None, pool):
+            coordinator = create_coordinator(server, site)
+            coordinator.parse_pool = parse_pool
+            try:
+                data = await coordinator._async_scrape_data()
+            finally:
+                await coordinator.async_close()
+            results.append(
+                [
+                    (event.link, event.in_count, event.players, event.comments)
+                    for event in data["events"]
+                ]
+                + [data.get("general_comments")]
+            )
+    finally:
+        await server.close()
+
+    assert results[0] == results[1]
+    assert pool.running
@@ -0,0 +1,66 @@
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from custom_components.kadermanager.coordinator import KadermanagerDataUpdateCoordinator
+from custom_components.kadermanager.parsers import (
+    PARSER_BACKENDS,
+    available_backends,
+    default_backend,
+    make_soup,
+)
+from tests.benchmarks import generator
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def _corpus():
+    event_list = generator.events(historical=30, upcoming=10)
+    pages = {
+        "events_page": generator.events_page(event_list),
+        "home_page": generator.home_page(event_list, messages=20),
+        "events_widget": generator.events_widget(event_list),
+        "messages_widget": generator.messages_widget(20),
+        "detail_page": generator.detail_page(players=30, comments=10),
+    }
+    for path in sorted(FIXTURES.glob("*.html")):
+        pages[path.name] = path.read_text(encoding="utf-8")
+    return pages
+
+
+def _parse_all(backend):
+    """Run every BeautifulSoup parser over the whole corpus."""
+    hass = MagicMock()
+    entry = MagicMock()
+    entry.data = {"teamname": "bigclub"}
+    entry.options = {}
+    coordinator = KadermanagerDataUpdateCoordinator(hass, entry)
+    coordinator.html_backend = backend
+    results = {}
+    for name, html in _corpus().items():
+        soup = make_soup(html, backend)
+        results[name] = {
+            "events": coordinator._event_rows_soup(html),
+            "enrollments": coordinator._enrollments_soup(html),
+            "widget": coordinator._parse_widget_events_soup(html),
+            "general_comments": coordinator._parse_general_comments_soup(html),
+            "players": coordinator.parse_event_players(soup),
+            "comments": coordinator.parse_event_comments(soup),
+        }
+    return results
+
+
+def test_default_backend_is_fastest_available():
+    assert available_backends()[-1] == "html.parser"
+    assert default_backend() == available_backends()[0]
+
+
+@pytest.mark.parametrize("backend", PARSER_BACKENDS)
+def test_backends_agree_on_corpus(backend):
+    if backend not in available_backends():
+        pytest.skip(f"{backend} is not installed")
+    results = _parse_all(backend)
+    assert results == _parse_all("html.parser")
+    assert results["events_page"]["events"]
+    assert results["detail_page"]["players"]["accepted_players"]
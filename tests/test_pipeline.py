@@ -0,0 +1,98 @@
+from unittest.mock import patch
+
+import aiohttp
+import pytest
+
+from custom_components.kadermanager.coordinator import async_login
+from custom_components.kadermanager.pipeline import (
+    RETRY_BLOCKED,
+    RETRY_CONNECTION,
+    CannotConnect,
+    ConditionalCache,
+    InvalidAuth,
+    RequestBudgetExceeded,
+    Response,
+    SessionExpired,
+    classify_error,
+)
+from tests.standin.harness import create_coordinator
+from tests.standin.server import StandinServer, TeamSite
+
+
+@pytest.fixture
+async def standin():
+    site = TeamSite(
+        "pipeline", historical=5, players=3, username="coach", password="s3cret"
+    )
+    server = StandinServer([site])
+    await server.start()
+    coordinator = create_coordinator(server, site)
+    coordinator._session = coordinator._create_session()
+    yield server, site, coordinator
+    await coordinator.async_close()
+    await server.close()
+
+
+async def test_unchanged_pages_are_revalidated(standin):
+    server, _, coordinator = standin
+    url = f"{coordinator.team_url}/events"
+
+    first = await coordinator.pipeline.async_request("GET", url)
+    second = await coordinator.pipeline.async_request("GET", url)
+
+    assert not first.from_cache
+    assert second.from_cache
+    assert second.body == first.body
+    assert server.statuses[304] == 1
+    assert coordinator.traffic.today["not_modified"] == 1
+    stats = coordinator.pipeline.as_dict()
+    assert stats["timing"]["events"]["count"] == 2
+    assert stats["conditional_cache"]["hits"] == 1
+
+
+def test_conditional_cache_drops_least_recently_used():
+    cache = ConditionalCache(max_bytes=10)
+    for idx in range(3):
+        resp = Response(f"u{idx}", 200, b"x" * 4, {"ETag": f'"{idx}"'})
+        cache._store(f"u{idx}", resp)
+    cache._store("u3", Response("u3", 200, b"x" * 40, {"ETag": '"3"'}))
+
+    assert cache.as_dict() == {"entries": 2, "bytes": 8, "hits": 0}
+
+
+async def test_budget_limits_requests_per_refresh(standin):
+    _, _, coordinator = standin
+    coordinator.request_budget.limit = 1
+
+    await coordinator.pipeline.async_request("GET", coordinator.team_url)
+    with pytest.raises(RequestBudgetExceeded):
+        await coordinator.pipeline.async_request("GET", coordinator.team_url)
+    assert await coordinator._async_get_url(coordinator.team_url) is None
+
+    coordinator.request_budget.reset()
+    assert await coordinator._async_get_url(coordinator.team_url)
+
+
+async def test_login_is_shared_and_expiry_detected(standin):
+    _, site, coordinator = standin
+    site.private = True
+    events_url = f"{coordinator.team_url}/events"
+    login_url = f"{coordinator.team_url}/sessions/new"
+
+    with pytest.raises(SessionExpired):
+        await coordinator.pipeline.async_request("GET", events_url)
+    with patch("asyncio.sleep"):
+        with pytest.raises(InvalidAuth):
+            await async_login(coordinator.pipeline, login_url, "coach", "wrong")
+        await async_login(coordinator.pipeline, login_url, "coach", "s3cret")
+
+    assert await coordinator._async_get_url(events_url)
+
+
+def test_classify_error():
+    request_info = aiohttp.RequestInfo("https://a.test", "GET", {}, "https://a.test")
+    blocked = aiohttp.ClientResponseError(request_info, (), status=429)
+
+    assert classify_error(blocked) == RETRY_BLOCKED
+    assert classify_error(CannotConnect()) == RETRY_CONNECTION
+    assert classify_error(ValueError()) is None
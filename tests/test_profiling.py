@@ -0,0 +1,41 @@
+import json
+
+from custom_components.kadermanager import coordinator as coordinator_module
+from custom_components.kadermanager.profiling import async_profile_refresh
+from tests.benchmarks import generator
+from tests.standin.harness import _ScaledRandom, create_coordinator
+from tests.standin.server import StandinServer, TeamSite
+
+
+async def test_profile_refresh_reports_code_locations_only(monkeypatch):
+    site = TeamSite("profiled", historical=200, players=20)
+    server = StandinServer([site])
+    await server.start()
+    coordinator = create_coordinator(server, site)
+    monkeypatch.setattr(coordinator_module, "random", _ScaledRandom(0.0))
+
+    async def async_refresh():
+        coordinator.data = await coordinator._async_update_data()
+        coordinator.last_update_success = True
+
+    coordinator.async_refresh = async_refresh
+    try:
+        profile = await async_profile_refresh(coordinator, top=15)
+    finally:
+        await coordinator.async_close()
+        await server.close()
+
+    assert profile["profiler"] in ("cprofile", "pyinstrument")
+    assert profile["refresh_succeeded"] is True
+    assert len(profile["top"]) == 15
+    assert all(
+        set(row) == {"location", "calls", "own_ms", "cumulative_ms"}
+        for row in profile["top"]
+    )
+    cumulative = [row["cumulative_ms"] for row in profile["top"]]
+    assert cumulative == sorted(cumulative, reverse=True)
+    assert any("coordinator.py" in row["location"] for row in profile["top"])
+    # The refresh parsed player names, the profile must not contain them
+    dumped = json.dumps(profile)
+    assert not any(name in dumped for name in generator.player_names(20))
+    assert coordinator.data["events"][0].players
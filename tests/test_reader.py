@@ -0,0 +1,73 @@
+from types import SimpleNamespace
+
+import pytest
+
+from custom_components.kadermanager.reader import (
+    ResponseTooLarge,
+    decode_body,
+    max_response_bytes,
+    read_body,
+)
+from tests.standin.harness import create_coordinator
+from tests.standin.server import StandinServer, TeamSite
+
+
+class _Content:
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.read = 0
+
+    async def iter_chunked(self, size):
+        for chunk in self.chunks:
+            self.read += 1
+            yield chunk
+
+
+def _response(chunks, content_length=None, charset="utf-8"):
+    return SimpleNamespace(
+        content=_Content(chunks), content_length=content_length, charset=charset
+    )
+
+
+async def test_reads_chunks_up_to_the_limit():
+    body = await read_body(_response([b"<html>", "Grüße".encode()]), 100)
+    assert decode_body(body) == "<html>Grüße"
+
+
+async def test_declared_length_over_limit_is_not_read():
+    resp = _response([b"x" * 10], content_length=500)
+    with pytest.raises(ResponseTooLarge):
+        await read_body(resp, 100)
+    assert resp.content.read == 0
+
+
+async def test_streamed_body_over_limit_is_aborted():
+    resp = _response([b"x" * 60] * 5)
+    with pytest.raises(ResponseTooLarge):
+        await read_body(resp, 100)
+    assert resp.content.read == 2
+
+
+async def test_declared_charset_is_transcoded_to_utf8():
+    resp = _response(["Müller".encode("iso-8859-1")], charset="ISO-8859-1")
+    assert await read_body(resp, 100) == "Müller".encode()
+
+
+def test_max_response_bytes_defaults():
+    assert max_response_bytes(None) == 5 * 1024 * 1024
+    assert max_response_bytes(1) == 1024 * 1024
+
+
+async def test_oversized_page_is_skipped():
+    site = TeamSite("reader", historical=50, players=3)
+    server = StandinServer([site])
+    await server.start()
+    coordinator = create_coordinator(server, site)
+    coordinator._session = coordinator._create_session()
+    try:
+        assert await coordinator._async_get_url(f"{coordinator.team_url}/events")
+        coordinator.pipeline.max_bytes = 1000
+        assert await coordinator._async_get_url(coordinator.team_url) is None
+    finally:
+        await coordinator.async_close()
+        await server.close()
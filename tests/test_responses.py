@@ -0,0 +1,77 @@
+import os
+from custom_components.kadermanager import coordinator as coordinator_module
+from custom_components.kadermanager.responses import ResponseCapture
+from tests.standin.harness import _ScaledRandom, create_coordinator
+from tests.standin.server import StandinServer, TeamSite
+
+URL = "https://a.kadermanager.de/events/{}"
+
+
+def test_bodies_are_redacted():
+    capture = ResponseCapture(secrets=("hunter2", None))
+    capture.capture(
+        "https://a.kadermanager.de/sessions?password=hunter2",
+        200,
+        '<meta name="csrf-token" content="abc123">'
+        '<span class="player_label">Max Muster</span>'
+        "<p>mail max@example.com, password hunter2</p>",
+    )
+
+    stored = capture.as_dict(include_bodies=True)["responses"][0]
+    assert "hunter2" not in stored["url"]
+    body = stored["body"]
+    for leaked in ("hunter2", "abc123", "Max Muster", "max@example.com"):
+        assert leaked not in body
+    assert "Spieler 1" in body
+
+
+def test_keeps_last_responses_per_endpoint():
+    capture = ResponseCapture(per_endpoint=2)
+    for idx in range(4):
+        capture.capture(URL.format(idx), 200, f"detail {idx}")
+    capture.capture("https://a.kadermanager.de/calendar/ical", 200, "ical")
+
+    responses = capture.as_dict()["responses"]
+    assert [r["url"] for r in responses] == [
+        URL.format(2),
+        URL.format(3),
+        "https://a.kadermanager.de/calendar/ical",
+    ]
+    assert "body" not in responses[0]
+
+
+def test_byte_cap_evicts_oldest_and_skips_oversized():
+    noise = [os.urandom(2000).hex() for _ in range(4)]
+    capture = ResponseCapture(per_endpoint=10, max_bytes=5000)
+    for idx, body in enumerate(noise):
+        capture.capture(URL.format(idx), 200, body)
+
+    assert capture.size <= 5000
+    assert len(capture) == 2
+    assert capture.as_dict()["responses"][0]["url"] == URL.format(2)
+
+    capture.capture(URL.format(9), 200, os.urandom(8000).hex())
+    assert len(capture) == 2
+
+
+async def test_refresh_captures_only_when_enabled(monkeypatch):
+    site = TeamSite(
+        "capture", historical=5, players=3, username="coach", password="s3cret-pw"
+    )
+    server = StandinServer([site])
+    await server.start()
+    default = create_coordinator(server, site)
+    enabled = create_coordinator(server, site, capture_responses=True)
+    monkeypatch.setattr(coordinator_module, "random", _ScaledRandom(0.0))
+    try:
+        await enabled._async_scrape_data()
+    finally:
+        await default.async_close()
+        await enabled.async_close()
+        await server.close()
+
+    assert default.responses is None
+    captured = enabled.responses.as_dict(include_bodies=True)
+    assert {r["endpoint"] for r in captured["responses"]} >= {"ical", "detail"}
+    assert "login" in {r["endpoint"] for r in captured["responses"]}
+    assert site.password not in str(captured)
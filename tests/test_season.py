@@ -0,0 +1,47 @@
+from unittest.mock import MagicMock
+
+from homeassistant.helpers.storage import Store
+
+from custom_components.kadermanager import coordinator as coordinator_module
+from custom_components.kadermanager.calendar import KadermanagerCalendar
+from tests.standin.harness import _ScaledRandom, create_coordinator
+from tests.standin.server import StandinServer, TeamSite
+
+
+async def test_counts_of_later_events_come_with_the_widget(monkeypatch):
+    Store.disk.clear()
+    site = TeamSite("season", historical=5, upcoming=12, players=3)
+    server = StandinServer([site])
+    await server.start()
+    coordinator = create_coordinator(server, site, event_limit=3)
+    restarted = create_coordinator(server, site, event_limit=3)
+    monkeypatch.setattr(coordinator_module, "random", _ScaledRandom(0.0))
+    try:
+        coordinator.data = await coordinator._async_scrape_data()
+        await coordinator.store.async_save(coordinator.data, coordinator.roster)
+        await restarted.async_load_cache()
+    finally:
+        await coordinator.async_close()
+        await restarted.async_close()
+        await server.close()
+
+    # Only the events within the limit cost a detail request
+    assert server.requests[("season", "detail")] == 3
+    assert server.requests[("season", "widget_events")] == 1
+    later = coordinator.data["later_events"]
+    # One of the generated upcoming events started earlier that day
+    assert len(later) == 8
+    expected = {f"event-{e['id']}@": e["in_count"] for e in site.upcoming_events}
+    for event in later:
+        assert event.in_count == expected[event.uid.split("kadermanager")[0]]
+        assert event.players is None
+
+    season = restarted.season_events()
+    assert [e.uid for e in season] == [e.uid for e in coordinator.season_events()]
+    assert [e.in_count for e in season[3:]] == [e.in_count for e in later]
+
+    entry = MagicMock()
+    entry.data = {"teamname": "season"}
+    calendar = KadermanagerCalendar(restarted, entry)
+    window = (season[0].start, season[-1].end)
+    assert len(await calendar.async_get_events(MagicMock(), *window)) == 11
@@ -0,0 +1,72 @@
+from unittest.mock import patch
+
+import aiohttp
+import pytest
+
+from tests.standin.harness import create_coordinator, run_harness
+from tests.standin.server import Faults, StandinServer, TeamSite
+
+
+async def test_public_team_uses_ical_and_widgets():
+    report = await run_harness(teams=2, refreshes=1)
+
+    assert all(result.success for result in report.results)
+    assert all(result.events == 5 for result in report.results)
+    assert report.requests["ical"] == 2
+    assert report.requests["detail"] == 10
+    assert report.requests["events"] == 0
+    assert report.max_loop_lag >= 0
+
+
+async def test_private_team_logs_in():
+    report = await run_harness(
+        teams=1, private=True, username="user", password="secret"
+    )
+
+    assert report.results[0].success
+    assert report.requests["login"] == 2
+    assert report.results[0].events == 5
+
+
+async def test_wrong_credentials_fail_the_refresh():
+    site = TeamSite("private", private=True, username="user", password="secret")
+    server = StandinServer([site])
+    await server.start()
+    coordinator = create_coordinator(server, TeamSite("private", password="wrong"))
+    coordinator.password = "wrong"
+    coordinator.username = "user"
+    coordinator.hass.data = {}
+    try:
+        with patch("asyncio.sleep"):
+            with pytest.raises(Exception, match="Failed to fetch events page"):
+                await coordinator._async_update_data()
+    finally:
+        await coordinator.async_close()
+        await server.close()
+
+    assert not coordinator._logged_in
+
+
+async def test_injected_429_triggers_backoff():
+    report = await run_harness(teams=1, faults=Faults(error_rate=1.0))
+
+    assert not report.results[0].success
+    assert report.statuses[429] > 0
+
+
+async def test_etag_returns_not_modified():
+    server = StandinServer([TeamSite("etag")])
+    await server.start()
+    url = f"http://127.0.0.1:{server.port}/calendar/ical"
+    headers = {"Host": f"etag.kadermanager.test:{server.port}"}
+    try:
+        async with aiohttp.ClientSession() as session:
+            async with session.get(url, headers=headers) as resp:
+                etag = resp.headers["ETag"]
+                assert resp.status == 200
+            async with session.get(
+                url, headers={**headers, "If-None-Match": etag}
+            ) as resp:
+                assert resp.status == 304
+    finally:
+        await server.close()
@@ -0,0 +1,129 @@
+from datetime import timedelta
+from unittest.mock import MagicMock
+
+from homeassistant.helpers.storage import Store
+
+from custom_components.kadermanager.models import KadermanagerEvent, TeamRoster
+from custom_components.kadermanager.sensor import KadermanagerAttendanceSensor
+from custom_components.kadermanager.statistics import AttendanceStatistics
+from tests.benchmarks import generator
+
+
+def synthetic_history(roster, historical, players=25):
+    """Return passed events with enrollment counts and player lists."""
+    raw_events = generator.events(historical, 0)
+    events = []
+    for raw, zones in zip(raw_events, generator.attendance(raw_events, players)):
+        start = raw["start"]
+        event = KadermanagerEvent.from_dict(
+            {
+                "uid": f"event-{raw['id']}",
+                "title": raw["title"],
+                "type": raw["type"],
+                "date": start.strftime("%Y-%m-%d"),
+                "time": start.strftime("%H:%M"),
+                "original_date": start.strftime("%d.%m.%Y %H:%M"),
+                "in_count": raw["in_count"],
+            }
+        )
+        event.players = roster.encode(zones)
+        events.append(event)
+    return events
+
+
+def _recomputed(events, roster, today, window):
+    # Events of the current day are counted by the next day's refresh
+    first, last = today.toordinal() - window + 1, today.toordinal() - 1
+    inside = [e for e in events if first <= e.start.date().toordinal() <= last]
+    turnout = {}
+    for event in inside:
+        count, total = turnout.get(event.type, (0, 0))
+        turnout[event.type] = (count + 1, total + event.in_count)
+    listed, accepted = {}, {}
+    for event in inside:
+        for zone, names in roster.expand(event.players).items():
+            for name in names:
+                listed[name] = listed.get(name, 0) + 1
+                if zone == "accepted_players":
+                    accepted[name] = accepted.get(name, 0) + 1
+    return (
+        {
+            event_type: {"events": count, "average": round(total / count, 1)}
+            for event_type, (count, total) in sorted(turnout.items())
+        },
+        {
+            name: {
+                "listed": count,
+                "accepted": accepted.get(name, 0),
+                "ratio": round(accepted.get(name, 0) / count, 3),
+            }
+            for name, count in listed.items()
+        },
+    )
+
+
+def _feed(statistics, events, until):
+    """Advance day by day, adding the events of the previous day each time."""
+    by_day = {}
+    for event in events:
+        by_day.setdefault(event.start.date(), []).append(event)
+    day = min(by_day) + timedelta(days=1)
+    while day <= until:
+        statistics.advance(day)
+        statistics.add_events(by_day.get(day - timedelta(days=1), []))
+        day += timedelta(days=1)
+
+
+async def test_rolling_windows_match_a_recomputation():
+    Store.disk.clear()
+    roster = TeamRoster()
+    events = synthetic_history(roster, historical=900)
+    statistics = AttendanceStatistics(MagicMock(), "stats", roster, windows=(30, 90))
+    last = max(e.start.date() for e in events)
+
+    for checkpoint in (last - timedelta(days=200), last + timedelta(days=1)):
+        passed = [e for e in events if e.start.date() < checkpoint]
+        _feed(statistics, passed, checkpoint)
+        for window in statistics.windows:
+            by_type, players = _recomputed(events, roster, checkpoint, window)
+            assert statistics.turnout(window)["by_type"] == by_type
+            assert statistics.attendance(window) == players
+    # Events are only counted once
+    assert statistics.add_events(events) == 0
+
+    # Buckets are stored with names and the totals rebuilt on load
+    await statistics.async_save()
+    restored = AttendanceStatistics(
+        MagicMock(), "stats", TeamRoster(), windows=(30, 90)
+    )
+    await restored.async_load()
+    for window in statistics.windows:
+        assert restored.turnout(window) == statistics.turnout(window)
+        assert restored.attendance(window) == statistics.attendance(window)
+    assert restored.as_dict() == statistics.as_dict()
+
+    # Nothing passes for a while: the windows empty out again
+    statistics.advance(last + timedelta(days=100))
+    assert statistics.turnout(90) == {"events": 0, "average": None, "by_type": {}}
+    assert statistics.as_dict()["days"] == 0
+
+
+def test_attendance_sensor():
+    roster = TeamRoster()
+    events = synthetic_history(roster, historical=60)
+    coordinator = MagicMock()
+    coordinator.statistics = AttendanceStatistics(MagicMock(), "stats", roster)
+    _feed(coordinator.statistics, events, events[-1].start.date() + timedelta(days=1))
+    entry = MagicMock()
+    entry.data = {"teamname": "stats"}
+    entry.entry_id = "123"
+
+    sensor = KadermanagerAttendanceSensor(coordinator, entry, 30)
+
+    turnout = coordinator.statistics.turnout(30)
+    assert sensor._attr_unique_id == "123_attendance_30d"
+    assert sensor.native_value == turnout["average"]
+    attributes = sensor.extra_state_attributes
+    assert attributes["events"] == turnout["events"] > 0
+    assert set(attributes["by_type"]) <= {"Training", "Spiel", "Sonstiges"}
+    assert all(0 <= player["ratio"] <= 1 for player in attributes["players"].values())
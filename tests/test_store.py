@@ -0,0 +1,210 @@
+import json
+import time
+import tracemalloc
+from unittest.mock import MagicMock
+
+import pytest
+
+from homeassistant.helpers.storage import Store
+from custom_components.kadermanager.coordinator import KadermanagerDataUpdateCoordinator
+from custom_components.kadermanager.models import KadermanagerEvent, TeamRoster
+from custom_components.kadermanager.store import (
+    KadermanagerStore,
+    SECTION_COMMENTS,
+    SECTION_GENERAL_COMMENTS,
+    SECTION_PLAYERS,
+)
+
+
+def _legacy_payload(event_count=10, player_count=30, comment_count=5):
+    events = []
+    for idx in range(event_count):
+        events.append(
+            {
+                "title": f"Training {idx}",
+                "link": f"https://testteam.kadermanager.de/events/{idx}",
+                "date": "2024-01-02",
+                "time": "19:00",
+                "original_date": "02.01.2024 19:00",
+                "in_count": player_count,
+                "players": {
+                    "accepted_players": [
+                        f"Player {idx}-{p}" for p in range(player_count)
+                    ],
+                    "declined_players": [],
+                    "no_response_players": [],
+                },
+                "comments": [
+                    {"author": f"Author {c}", "text": "Bin dabei! " * 20}
+                    for c in range(comment_count)
+                ],
+            }
+        )
+    return {
+        "events": events,
+        "general_comments": [
+            {"author": f"Author {c}", "text": "Allgemein " * 50} for c in range(5)
+        ],
+        "last_success": "2024-01-01T12:00:00+00:00",
+    }
+
+
+@pytest.fixture(autouse=True)
+def clean_disk():
+    Store.disk.clear()
+    yield
+    Store.disk.clear()
+
+
+@pytest.fixture
+def coordinator():
+    hass = MagicMock()
+    entry = MagicMock()
+    entry.data = {"teamname": "testteam"}
+    entry.options = {"fetch_player_info": True, "fetch_comments": True}
+    return KadermanagerDataUpdateCoordinator(hass, entry)
+
+
+async def _write_legacy(payload):
+    await Store(MagicMock(), 1, "kadermanager_testteam").async_save(payload)
+
+
+async def test_migrates_version_1_store():
+    await _write_legacy(_legacy_payload(event_count=2))
+
+    store = KadermanagerStore(MagicMock(), "testteam")
+    core = await store.async_load_core()
+
+    assert len(core["events"]) == 2
+    assert "players" not in core["events"][0]
+    assert "general_comments" not in core
+    assert core["last_success"] == "2024-01-01T12:00:00+00:00"
+    assert json.loads(Store.disk["kadermanager_testteam"])["version"] == 2
+
+    players = json.loads(Store.disk["kadermanager_testteam_players"])["data"]
+    ids = players["events"]["https://testteam.kadermanager.de/events/1"]
+    assert players["roster"][ids["accepted_players"][0]] == "Player 1-0"
+
+
+async def test_migrates_name_based_players_section(coordinator):
+    await KadermanagerStore(MagicMock(), "testteam").async_save(
+        {"events": [KadermanagerEvent.from_dict(_event("https://x/events/1"))]},
+        TeamRoster(),
+    )
+    # Players section as written before the roster existed
+    await Store(MagicMock(), 1, "kadermanager_testteam_players").async_save(
+        {"https://x/events/1": {"accepted_players": ["A", "B"], "declined_players": []}}
+    )
+
+    await coordinator.async_load_cache()
+    await coordinator.async_ensure_sections()
+
+    event = coordinator.data["events"][0]
+    assert event.as_dict(coordinator.roster)["players"]["accepted_players"] == [
+        "A",
+        "B",
+    ]
+    assert coordinator.events_for_player("B") == [(event, "accepted_players")]
+    assert coordinator.events_for_player("Nobody") == []
+
+
+def _event(link):
+    return {
+        "title": "Training",
+        "link": link,
+        "date": "2024-01-02",
+        "time": "19:00",
+        "original_date": "02.01.2024 19:00",
+    }
+
+
+async def test_sections_load_lazily(coordinator):
+    await _write_legacy(_legacy_payload(event_count=2))
+    await coordinator.async_load_cache()
+
+    # A fresh store instance to simulate the next start after the migration
+    coordinator.store = KadermanagerStore(MagicMock(), "testteam")
+    await coordinator.async_load_cache()
+    assert coordinator.data["events"][0].players is None
+    assert not coordinator.store.is_loaded(SECTION_PLAYERS)
+
+    await coordinator.async_ensure_sections()
+
+    assert coordinator.data["events"][0].players["accepted_players"]
+    assert coordinator.data["events"][0].comments
+    assert len(coordinator.data["general_comments"]) == 5
+
+
+async def test_migrated_sections_are_merged(coordinator):
+    await _write_legacy(_legacy_payload(event_count=2))
+
+    # Same store and coordinator for the migration and the first access
+    await coordinator.async_load_cache()
+    assert not coordinator.store.is_loaded(SECTION_PLAYERS)
+    await coordinator.async_ensure_sections()
+
+    event = coordinator.data["events"][1]
+    names = event.as_dict(coordinator.roster)["players"]["accepted_players"]
+    assert names[0] == "Player 1-0"
+    assert event.comments
+    assert len(coordinator.data["general_comments"]) == 5
+
+
+async def test_disabled_options_skip_sections(coordinator):
+    coordinator.fetch_player_info = False
+    coordinator.fetch_comments = False
+    await _write_legacy(_legacy_payload(event_count=2))
+    await KadermanagerStore(MagicMock(), "testteam").async_load_core()
+
+    await coordinator.async_load_cache()
+    await coordinator.async_ensure_sections()
+
+    assert not coordinator.store.is_loaded(SECTION_COMMENTS)
+    assert not coordinator.store.is_loaded(SECTION_GENERAL_COMMENTS)
+
+
+async def test_save_skips_unchanged_sections():
+    store = KadermanagerStore(MagicMock(), "testteam")
+    payload = _legacy_payload(event_count=2)
+    roster = TeamRoster()
+    events = []
+    for raw in payload["events"]:
+        event = KadermanagerEvent.from_dict(raw)
+        event.players = roster.encode(raw["players"])
+        events.append(event)
+    payload["events"] = events
+    await store.async_save(payload, roster)
+
+    Store.disk.pop("kadermanager_testteam_players")
+    payload["last_success"] = "2024-01-02T12:00:00+00:00"
+    await store.async_save(payload, roster)
+
+    assert "kadermanager_testteam_players" not in Store.disk
+    assert "2024-01-02" in Store.disk["kadermanager_testteam"]
+
+
+async def test_startup_cost_core_vs_legacy():
+    """Compare startup memory/latency of the legacy file against the core file."""
+    payload = _legacy_payload(event_count=10, player_count=60, comment_count=20)
+
+    await _write_legacy(payload)
+    tracemalloc.start()
+    start = time.perf_counter()
+    await Store(MagicMock(), 1, "kadermanager_testteam").async_load()
+    legacy_time = time.perf_counter() - start
+    legacy_peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    await KadermanagerStore(MagicMock(), "testteam").async_load_core()
+    tracemalloc.start()
+    start = time.perf_counter()
+    await KadermanagerStore(MagicMock(), "testteam").async_load_core()
+    core_time = time.perf_counter() - start
+    core_peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    print(
+        f"startup legacy: {legacy_time * 1000:.2f} ms / {legacy_peak / 1024:.0f} KiB, "
+        f"core: {core_time * 1000:.2f} ms / {core_peak / 1024:.0f} KiB"
+    )
+    assert core_peak < legacy_peak / 4
@@ -0,0 +1,145 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from custom_components.kadermanager import streaming
+from custom_components.kadermanager.coordinator import KadermanagerDataUpdateCoordinator
+from tests.benchmarks import generator
+
+EVENTS_HTML = """
+<div class="event-detailed-container">
+  <a class="event-title-link">Training &middot; <span>Halle</span></a>
+  <a href="/events/1/players">Spieler</a>
+  <a href="/events/1/edit">Bearbeiten</a>
+  <a href="/events/1">Details</a>
+  <div><h4>Heute um 19:00</h4><span>x</span><div class="location">Halle 1</div></div>
+</div>
+<div class="event-detailed-container">
+  <a class="event-title-link" href="/events/2">Spiel</a>
+  <p><h4>Morgen um 15:00</h4></p>
+  <div>Nicht der Ort</div>
+</div>
+<div class="event-detailed-container">
+  <h4>01.02.2024 um 10:00</h4>
+  <div class="event-latest-comment">Letzter Kommentar</div>
+</div>
+<div class="event-detailed-container">
+  <a class="event-title-link" href="/events/4">Sonstiges &middot; Feier
+  <h4>02.02.2024</h4><br><div>Vereinsheim <b>oben</b></div>
+"""
+
+HOME_HTML = """
+<a href="https://team.kadermanager.de/events/1?ref=home">
+  <span><div class="circle-in-enrollments">12</div></span>
+</a>
+<div class="circle-in-enrollments">n/a</div>
+<a><div class="circle-in-enrollments">4</div></a>
+"""
+
+MESSAGES_HTML = (
+    "".join(
+        f'<div class="row message"><h5>Spieler {idx}\n<small>vor {idx} Tagen</small>'
+        f"</h5><p>Text &amp; {idx}</p></div>"
+        for idx in range(8)
+    )
+    + '<div class="row message"><h5>Ohne Text</h5></div><div class="message"></div>'
+)
+
+WIDGET_HTML = """
+<div class="event"><div class="what"> Training </div>
+<span class="date">Di 23.06.</span><span class="enrolled_in">(Teilnehmer: 5)</span></div>
+<div class="event"><div class="what">Spiel</div><span class="date">Mi</span>
+<span class="enrolled_in">(Teilnehmer: 3)</span></div>
+<div class="event highlighted"><div class="what">Fest</div>
+<span class="date">Sa 27.06.</span><span class="enrolled_in">(Teilnehmer: 9)
+"""
+
+
+@pytest.fixture
+def coordinator():
+    hass = MagicMock()
+    entry = MagicMock()
+    entry.data = {"teamname": "team"}
+    entry.options = {}
+    coordinator = KadermanagerDataUpdateCoordinator(hass, entry)
+    # The extractors follow html.parser, lxml repairs malformed markup differently
+    coordinator.html_backend = "html.parser"
+    return coordinator
+
+
+@pytest.fixture(scope="module")
+def club():
+    event_list = generator.events(historical=50, upcoming=10)
+    return {
+        "events_page": generator.events_page(event_list),
+        "home_page": generator.home_page(event_list, messages=20),
+        "events_widget": generator.events_widget(event_list),
+        "messages_widget": generator.messages_widget(20),
+    }
+
+
+@pytest.mark.parametrize("page", ["events_page", "html"])
+def test_event_list_matches_beautifulsoup(coordinator, club, page):
+    html = club[page] if page in club else EVENTS_HTML
+    rows = streaming.parse_event_list(html)
+    assert rows == coordinator._event_rows_soup(html)
+    assert rows
+
+
+def test_event_list_fields():
+    rows = streaming.parse_event_list(EVENTS_HTML)
+    assert [row["link"] for row in rows] == ["/events/1", "/events/2", "", "/events/4"]
+    assert [row["location"] for row in rows] == [
+        "Halle 1",
+        # The div is no sibling of the heading, which is nested in the <p>
+        "Unknown",
+        "Unknown",
+        "Vereinsheim oben",
+    ]
+    assert rows[2]["title"] == "Unknown"
+
+
+@pytest.mark.parametrize("html", [HOME_HTML, "home_page"])
+def test_enrollments_match_beautifulsoup(coordinator, club, html):
+    html = club.get(html, html)
+    counts = streaming.parse_enrollments(html)
+    assert counts == coordinator._enrollments_soup(html)
+    assert counts
+
+
+@pytest.mark.parametrize("html", [MESSAGES_HTML, "messages_widget", "home_page"])
+def test_general_comments_match_beautifulsoup(coordinator, club, html):
+    html = club.get(html, html)
+    comments = streaming.parse_general_comments(html)
+    assert comments == coordinator._parse_general_comments_soup(html)
+    assert len(comments) == 5
+
+
+@pytest.mark.parametrize("html", [WIDGET_HTML, "events_widget"])
+def test_widget_events_match_beautifulsoup(coordinator, club, html):
+    html = club.get(html, html)
+    counts = streaming.parse_widget_events(html)
+    assert counts == coordinator._parse_widget_events_soup(html)
+    assert counts
+
+
+def test_parse_events_is_unchanged(coordinator, club):
+    streamed = coordinator.parse_events(
+        club["events_page"], club["home_page"], generator.TEAM_URL
+    )
+    rows = coordinator._event_rows_soup(club["events_page"])
+    assert [event["link"] for event in streamed] == [
+        f"{generator.TEAM_URL}{row['link']}" for row in rows
+    ]
+    assert all(event["in_count"] is not None for event in streamed)
+
+
+def test_falls_back_to_beautifulsoup(coordinator, monkeypatch):
+    def broken(html):
+        raise AssertionError("unexpected markup")
+
+    monkeypatch.setattr(streaming, "parse_widget_events", broken)
+    assert coordinator._parse_widget_events(WIDGET_HTML) == {
+        "Training_23.06.": 5,
+        "Fest_27.06.": 9,
+    }
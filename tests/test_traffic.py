@@ -0,0 +1,100 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from custom_components.kadermanager import coordinator as coordinator_module
+from custom_components.kadermanager.traffic import TrafficCounters, endpoint_for
+from homeassistant.helpers.storage import Store
+from tests.standin.harness import _ScaledRandom, create_coordinator
+from tests.standin.server import StandinServer, TeamSite
+
+
+@pytest.mark.parametrize(
+    ("url", "endpoint"),
+    [
+        ("https://a.kadermanager.de/calendar/ical", "ical"),
+        ("https://a.kadermanager.de/calendar/widget_iframe_events", "widget_events"),
+        (
+            "https://a.kadermanager.de/messages/widget_iframe_messages",
+            "widget_messages",
+        ),
+        ("https://a.kadermanager.de/events", "events"),
+        ("https://a.kadermanager.de/events/123", "detail"),
+        ("https://a.kadermanager.de/sessions/new", "login"),
+        ("https://a.kadermanager.de", "home"),
+        ("https://a.kadermanager.de/", "home"),
+        ("https://a.kadermanager.de/profile", "other"),
+    ],
+)
+def test_endpoint_for(url, endpoint):
+    assert endpoint_for(url) == endpoint
+
+
+def test_counts_bytes_and_content_hash_hits():
+    traffic = TrafficCounters(MagicMock(), "counting")
+    url = "https://a.kadermanager.de/calendar/ical"
+    for body in (b"one", b"one", b"two"):
+        traffic.record_request(url, 200)
+        traffic.record_body(url, body, content_length=2)
+    traffic.record_request(url, 304)
+
+    today = traffic.today
+    assert today["requests"] == {"ical": 4}
+    assert today["statuses"] == {"200": 3, "304": 1}
+    assert today["not_modified"] == 1
+    assert today["content_hash_hits"] == 1
+    assert today["bytes_decompressed"] == 9
+    assert today["bytes_compressed"] == 6
+
+
+async def test_counters_are_persisted_per_day():
+    Store.disk.clear()
+    traffic = TrafficCounters(MagicMock(), "persisted")
+    traffic.days = {
+        f"2023-11-{day:02d}": {"requests": {"ical": 1}} for day in range(1, 31)
+    }
+    traffic.record_retry()
+    await traffic.async_save()
+
+    restored = TrafficCounters(MagicMock(), "persisted")
+    await restored.async_load()
+
+    assert len(restored.days) == 30
+    assert "2023-11-01" not in restored.days
+    assert restored.today["retries"] == 1
+    assert restored.as_dict(days=2)["requests_per_day"] == {
+        "2023-11-30": 1,
+        "2024-01-01": 0,
+    }
+
+
+async def test_refresh_counts_traffic_and_cache_hits(monkeypatch):
+    Store.disk.clear()
+    # Without accepted players the widget count stays the cache key
+    site = TeamSite("traffic", historical=20, players=0)
+    server = StandinServer([site])
+    await server.start()
+    coordinator = create_coordinator(server, site)
+    monkeypatch.setattr(coordinator_module, "random", _ScaledRandom(0.0))
+    try:
+        for _ in range(2):
+            coordinator.last_success = None
+            coordinator.data = await coordinator._async_update_data()
+    finally:
+        await coordinator.async_close()
+        await server.close()
+
+    today = coordinator.traffic.today
+    assert today["requests"] == {
+        "ical": 2,
+        "widget_events": 2,
+        "widget_messages": 2,
+        "detail": 5,
+    }
+    # The second refresh reused all details and revalidated the unchanged pages
+    assert today["statuses"] == {"200": 8, "304": 3}
+    assert today["not_modified"] == 3
+    assert today["detail_cache_hits"] == 5
+    assert today["content_hash_hits"] == 0
+    assert today["bytes_compressed"] > 0
+    assert "kadermanager_traffic_traffic" in Store.disk